@@ -0,0 +1,44 @@
+# File: benchmarks/bench_regex_extractor.py
+# Micro-benchmark extract_all_sections: versi lama (legacy_regex_extractor.py) vs core/regex_extractor.py.
+# Jalankan dari root proyek: python benchmarks/bench_regex_extractor.py [--limit N] [--repeat N]
+
+import argparse
+import statistics
+
+from bench_utils import percentile, time_call
+import legacy_regex_extractor
+from core import regex_extractor
+from core.pdf_parser import extract_texts
+from core.inverted_index import list_cv_paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Bandingkan biaya extract_all_sections per CV, sebelum dan sesudah.")
+    parser.add_argument('--limit', type=int, default=0, help="Jumlah CV yang dipakai (0 = semua)")
+    parser.add_argument('--repeat', type=int, default=3, help="Pengulangan per CV (diambil yang tercepat)")
+    args = parser.parse_args()
+
+    cv_paths = list_cv_paths()
+    if args.limit:
+        cv_paths = cv_paths[:args.limit]
+    texts = [extract_texts(cv_path)[0] for cv_path in cv_paths]
+
+    mismatches = sum(
+        legacy_regex_extractor.extract_all_sections(text) != regex_extractor.extract_all_sections(text)
+        for text in texts
+    )
+    print(f"{len(texts)} CV, {sum(map(len, texts)) / 1e6:.1f} juta karakter, hasil berbeda: {mismatches}")
+
+    results = {}
+    for label, module in (('sebelum', legacy_regex_extractor), ('sesudah', regex_extractor)):
+        samples = [time_call(module.extract_all_sections, text, repeat=args.repeat) for text in texts]
+        results[label] = samples
+        print(
+            f"{label:8s} mean {statistics.mean(samples) * 1000:7.3f} ms  "
+            f"p50 {percentile(samples, 0.50) * 1000:7.3f} ms  "
+            f"p95 {percentile(samples, 0.95) * 1000:7.3f} ms  "
+            f"total {sum(samples):6.2f} s"
+        )
+    print(f"speedup: {sum(results['sebelum']) / sum(results['sesudah']):.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# File: benchmarks/bench_utils.py
+# Utilitas bersama script benchmark: path import src/, pengukuran waktu, dan ringkasan statistik.
+
+import os
+import sys
+import time
+import statistics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+def percentile(samples: list, q: float) -> float:
+    """Persentil sederhana (nearest-rank) dari daftar sampel."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def time_call(func, *args, repeat: int = 1) -> float:
+    """Waktu terbaik (detik) dari `repeat` kali pemanggilan func(*args)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def summarize(name: str, dataset: str, samples: list, total_bytes: int, unit: str = 'cv') -> dict:
+    """
+    Ringkasan satu kasus benchmark.
+    `samples` = waktu per item (detik); throughput dihitung dari total waktu seluruh item.
+    """
+    total = sum(samples)
+    return {
+        'name': name,
+        'dataset': dataset,
+        'unit': unit,
+        'items': len(samples),
+        'bytes': total_bytes,
+        'total_s': total,
+        'mean_ms': statistics.mean(samples) * 1000 if samples else 0.0,
+        'p50_ms': percentile(samples, 0.50) * 1000 if samples else 0.0,
+        'p95_ms': percentile(samples, 0.95) * 1000 if samples else 0.0,
+        'mb_per_s': total_bytes / 1e6 / total if total else 0.0,
+        'items_per_s': len(samples) / total if total else 0.0,
+    }
+
+def format_result(result: dict) -> str:
+    return (
+        f"{result['name']:34s} {result['dataset']:18s} n={result['items']:<5d} "
+        f"p50 {result['p50_ms']:9.3f} ms  p95 {result['p95_ms']:9.3f} ms  "
+        f"{result['mb_per_s']:8.2f} MB/s  {result['items_per_s']:9.1f} {result['unit']}/s"
+    )
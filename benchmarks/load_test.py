@@ -0,0 +1,111 @@
+# File: benchmarks/load_test.py
+# Load test untuk layanan HTTP (python -m cvanalyzer serve), hanya memakai stdlib asyncio.
+# Jalankan dari root proyek:
+#   python benchmarks/load_test.py [--url http://127.0.0.1:8765] [--concurrency 8] [--requests 200]
+
+import json
+import time
+import random
+import asyncio
+import argparse
+from urllib.parse import urlencode, urlsplit
+
+from bench_utils import percentile
+
+DEFAULT_KEYWORDS = ['python', 'java', 'sql', 'react', 'html', 'excel', 'management', 'accounting', 'leadership', 'communication']
+ALGORITHMS = ['KMP', 'BM', 'AHO-CORASICK', 'CORPUS']
+
+async def _request(reader, writer, host: str, path: str) -> tuple:
+    """Mengirim satu GET (keep-alive) dan membaca responsnya. Return: (status, body)."""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value.strip())
+    return status, await reader.readexactly(length)
+
+async def _client(host: str, port: int, paths: list, latencies: list, errors: list):
+    """Satu koneksi yang mengirim request secara berurutan sampai antrean `paths` habis."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while paths:
+            path = paths.pop()
+            start = time.perf_counter()
+            try:
+                status, body = await _request(reader, writer, host, path)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+                errors.append(str(e))
+                break
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(f"{status}: {body[:200].decode('utf-8', 'replace')}")
+    finally:
+        writer.close()
+
+def _build_paths(count: int, keywords: list, algorithms: list, top_n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(count):
+        query = {
+            'keywords': ','.join(rng.sample(keywords, min(3, len(keywords)))),
+            'algorithm': rng.choice(algorithms),
+            'top_n': top_n,
+        }
+        paths.append(f"/search?{urlencode(query)}")
+    return paths
+
+async def run(args) -> dict:
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    keywords = [keyword.strip() for keyword in args.keywords.split(',') if keyword.strip()]
+    algorithms = [algorithm.strip().upper() for algorithm in args.algorithms.split(',') if algorithm.strip()]
+    paths = _build_paths(args.requests, keywords, algorithms, args.top, args.seed)
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, paths, latencies, errors) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'url': args.url,
+        'concurrency': args.concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'elapsed_s': elapsed,
+        'requests_per_s': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000 if latencies else 0.0,
+        'p95_ms': percentile(latencies, 0.95) * 1000 if latencies else 0.0,
+        'first_errors': errors[:5],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test endpoint /search layanan CV Analyzer.")
+    parser.add_argument('--url', default='http://127.0.0.1:8765', help="Alamat layanan")
+    parser.add_argument('--concurrency', type=int, default=8, help="Jumlah koneksi paralel")
+    parser.add_argument('--requests', type=int, default=200, help="Total request")
+    parser.add_argument('--keywords', default=','.join(DEFAULT_KEYWORDS), help="Kumpulan keyword (setiap query memakai 3 acak)")
+    parser.add_argument('--algorithms', default=','.join(ALGORITHMS), help="Algoritma yang dipakai bergantian")
+    parser.add_argument('--top', type=int, default=10, help="top_n setiap query")
+    parser.add_argument('--seed', type=int, default=0, help="Seed pembuatan query")
+    parser.add_argument('--output', default=None, help="Simpan hasil sebagai JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(
+        f"{report['requests']} request ({report['errors']} error) dalam {report['elapsed_s']:.2f} detik: "
+        f"{report['requests_per_s']:.1f} req/s, p50 {report['p50_ms']:.1f} ms, p95 {report['p95_ms']:.1f} ms"
+    )
+    for error in report['first_errors']:
+        print(f"  error: {error}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+# File: benchmarks/run_benchmarks.py
+# Benchmark matcher dan pipeline ekstraksi tanpa GUI, pada PDF asli di data/ dan teks sintetis.
+# Jalankan dari root proyek:
+#   python benchmarks/run_benchmarks.py [--limit N] [--sizes 10000,100000] [--only kmp,bm] [--compare FILE]
+# Hasil disimpan sebagai JSON di benchmarks/results/ (nama file memuat commit git).
+
+import os
+import json
+import time
+import random
+import platform
+import argparse
+import subprocess
+
+from bench_utils import RESULTS_DIR, ROOT_DIR, format_result, summarize, time_call
+from core import pdf_parser
+from core.pdf_parser import extract_texts, extract_text_for_pattern_matching
+from core.inverted_index import list_cv_paths
+from core.kmp import kmp_search
+from core.bm import bm_search
+from core.aho_corasick import AhoCorasick
+from core.corpus import PackedCorpus
+from core.levenshtein import levenshtein_distance, levenshtein_distance_bounded
+from core.regex_extractor import extract_all_sections
+
+DEFAULT_KEYWORDS = ['python', 'java', 'sql', 'react', 'html', 'excel', 'management', 'accounting', 'leadership', 'communication']
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+FUZZY_THRESHOLD = 2
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def _synthetic_text(size: int, vocabulary: list, seed: int = 0) -> str:
+    """Teks 'flat' (lowercase, spasi tunggal) sepanjang `size` karakter dari kata-kata korpus."""
+    rng = random.Random(seed)
+    words, length = [], 0
+    while length < size:
+        word = rng.choice(vocabulary)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:size]
+
+# --- Kasus benchmark: setiap fungsi menerima daftar teks dan mengembalikan waktu per teks ---
+
+def bench_kmp(texts, keywords, repeat):
+    return [time_call(lambda t: [kmp_search(t, keyword) for keyword in keywords], text, repeat=repeat) for text in texts]
+
+def bench_bm(texts, keywords, repeat):
+    return [time_call(lambda t: [bm_search(t, keyword) for keyword in keywords], text, repeat=repeat) for text in texts]
+
+def bench_aho_corasick(texts, keywords, repeat):
+    # Automaton dibangun per teks, seperti pemakaian AhoCorasick di luar cache get_automaton
+    def run(text):
+        automaton = AhoCorasick()
+        for keyword in keywords:
+            automaton.add_keyword(keyword)
+        automaton.build_failure_links()
+        automaton.search(text)
+    return [time_call(run, text, repeat=repeat) for text in texts]
+
+def bench_corpus(texts, keywords, repeat):
+    # Satu lintasan untuk seluruh korpus per keyword; waktu total dibagi rata ke setiap teks
+    # agar sebanding dengan kasus per-teks (pembangunan buffer tidak dihitung, seperti korpus yang sudah di memori)
+    corpus = PackedCorpus.from_texts([str(index) for index in range(len(texts))], texts)
+    total = time_call(lambda: [corpus.find_counts(keyword) for keyword in keywords], repeat=repeat)
+    return [total / len(texts)] * len(texts)
+
+def _bench_fuzzy(texts, keywords, repeat, distance):
+    # Setiap kata unik teks dibandingkan dengan setiap keyword, seperti fuzzy matching per CV
+    def run(text):
+        for word in set(text.split()):
+            for keyword in keywords:
+                distance(word, keyword)
+    return [time_call(run, text, repeat=repeat) for text in texts]
+
+def bench_levenshtein(texts, keywords, repeat):
+    return _bench_fuzzy(texts, keywords, repeat, levenshtein_distance)
+
+def bench_levenshtein_bounded(texts, keywords, repeat):
+    return _bench_fuzzy(texts, keywords, repeat, lambda word, keyword: levenshtein_distance_bounded(word, keyword, FUZZY_THRESHOLD))
+
+def bench_extract_all_sections(texts, keywords, repeat):
+    return [time_call(extract_all_sections, text, repeat=repeat) for text in texts]
+
+# (nama, fungsi, dataset yang didukung: 'raw' = teks mentah CV, 'flat' = teks flat)
+TEXT_CASES = [
+    ('kmp_search', bench_kmp, 'flat'),
+    ('bm_search', bench_bm, 'flat'),
+    ('aho_corasick', bench_aho_corasick, 'flat'),
+    ('packed_corpus', bench_corpus, 'flat'),
+    ('levenshtein_distance', bench_levenshtein, 'flat'),
+    ('levenshtein_distance_bounded', bench_levenshtein_bounded, 'flat'),
+    ('extract_all_sections', bench_extract_all_sections, 'raw'),
+]
+
+def bench_pdf_extraction(cv_paths: list, cold: bool) -> list:
+    """
+    Waktu extract_text_for_pattern_matching per CV.
+    cold=True: text cache dimatikan sehingga setiap PDF benar-benar di-decode.
+    """
+    saved = pdf_parser.TEXT_CACHE_PATH, pdf_parser._text_cache
+    if cold:
+        pdf_parser.TEXT_CACHE_PATH, pdf_parser._text_cache = None, None
+    try:
+        return [time_call(extract_text_for_pattern_matching, cv_path) for cv_path in cv_paths]
+    finally:
+        pdf_parser.TEXT_CACHE_PATH, pdf_parser._text_cache = saved
+
+def _selected(name: str, only: set) -> bool:
+    return not only or any(key in name for key in only)
+
+def run(args) -> dict:
+    keywords = [keyword.strip().lower() for keyword in args.keywords.split(',') if keyword.strip()]
+    only = {key.strip() for key in args.only.split(',') if key.strip()} if args.only else set()
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()] if args.sizes else []
+
+    cv_paths = list_cv_paths()
+    if args.limit:
+        cv_paths = cv_paths[:args.limit]
+
+    results = []
+    def record(result):
+        results.append(result)
+        print(format_result(result), flush=True)
+
+    # Ekstraksi PDF (warm = dari text cache, cold = decode PDF)
+    for cold in (False, True):
+        name = f"extract_text_for_pattern_matching[{'cold' if cold else 'warm'}]"
+        if _selected(name, only):
+            samples = bench_pdf_extraction(cv_paths, cold)
+            file_bytes = sum(os.path.getsize(os.path.join(ROOT_DIR, cv_path)) for cv_path in cv_paths)
+            record(summarize(name, 'data/pdf', samples, file_bytes))
+
+    texts = [extract_texts(cv_path) for cv_path in cv_paths]
+    datasets = {
+        'raw': ('data/raw', [raw for raw, _ in texts]),
+        'flat': ('data/flat', [flat for _, flat in texts]),
+    }
+    vocabulary = sorted({word for _, flat in texts for word in flat.split()}) or keywords
+
+    for name, bench, kind in TEXT_CASES:
+        if not _selected(name, only):
+            continue
+        dataset, corpus = datasets[kind]
+        samples = bench(corpus, keywords, args.repeat)
+        record(summarize(name, dataset, samples, sum(len(text.encode('utf-8')) for text in corpus)))
+        for size in sizes:
+            # Teks sintetis dengan ukuran bertingkat untuk melihat skala terhadap panjang teks
+            synthetic = [_synthetic_text(size, vocabulary, seed) for seed in range(args.synthetic_count)]
+            samples = bench(synthetic, keywords, args.repeat)
+            record(summarize(name, f"synthetic/{size}", samples, sum(len(text) for text in synthetic), unit='text'))
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'cvs': len(cv_paths),
+            'keywords': keywords,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+
+def compare(current: dict, baseline_path: str):
+    """Mencetak rasio p50 terhadap file hasil sebelumnya (>1 = lebih lambat)."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['name'], r['dataset']): r for r in baseline['results']}
+    print(f"\nPerbandingan dengan {baseline['meta'].get('git_commit')} ({os.path.basename(baseline_path)}):")
+    for result in current['results']:
+        old = previous.get((result['name'], result['dataset']))
+        if old and old['p50_ms']:
+            ratio = result['p50_ms'] / old['p50_ms']
+            flag = '  <-- lebih lambat' if ratio > 1.10 else ''
+            print(f"{result['name']:34s} {result['dataset']:18s} p50 x{ratio:5.2f}{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark matcher dan ekstraksi CV tanpa GUI.")
+    parser.add_argument('--limit', type=int, default=200, help="Jumlah CV dari data/ (0 = semua)")
+    parser.add_argument('--repeat', type=int, default=1, help="Pengulangan per item (diambil yang tercepat)")
+    parser.add_argument('--keywords', default=','.join(DEFAULT_KEYWORDS), help="Keyword dipisah koma")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="Ukuran teks sintetis (karakter), dipisah koma; kosong = tidak ada")
+    parser.add_argument('--synthetic-count', type=int, default=3, help="Jumlah teks sintetis per ukuran")
+    parser.add_argument('--only', default='', help="Hanya jalankan kasus yang namanya memuat salah satu kata ini (dipisah koma)")
+    parser.add_argument('--output', default=None, help="File JSON hasil (default: benchmarks/results/<waktu>-<commit>.json)")
+    parser.add_argument('--compare', default=None, help="File JSON hasil sebelumnya sebagai pembanding")
+    args = parser.parse_args()
+
+    report = run(args)
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{report['meta']['git_commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil disimpan di {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+if __name__ == '__main__':
+    main()
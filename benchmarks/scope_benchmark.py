@@ -0,0 +1,176 @@
+# File: benchmarks/scope_benchmark.py
+# Waktu pencarian per scope (kategori x jumlah CV per kategori) lewat search_cvs, dan skala tahap
+# matching pada korpus sintetis N kali seluruh CV di data/ (tanpa database).
+# Jalankan dari root proyek (untuk scope 'all' atas seluruh data/, jalankan `python -m db.ingest` dulu):
+#   python benchmarks/scope_benchmark.py [--scopes 20,100,all] [--algorithms CORPUS,AHO-CORASICK] [--scales 1,10]
+
+import os
+import json
+import time
+import random
+import argparse
+import statistics
+
+from bench_utils import RESULTS_DIR, percentile
+from core.pdf_parser import extract_texts
+from core.inverted_index import list_cv_paths
+from core.matcher import THRESHOLD, compile_keywords, match_exact
+from core.corpus import PackedCorpus
+from core.vocabulary_index import VocabularyIndex
+
+# Keyword dengan typo ('pyhton', 'managment') ikut diukur agar tahap fuzzy juga berjalan
+DEFAULT_QUERIES = [
+    ['python', 'sql', 'excel'],
+    ['java', 'react', 'html'],
+    ['accounting', 'leadership', 'communication'],
+    ['pyhton', 'managment'],
+]
+
+def _parse_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+def bench_scope(limit, categories, algorithm: str, queries: list) -> dict:
+    """
+    Menjalankan seluruh query pada satu scope. Query pertama memuat teks CV (cold);
+    query berikutnya memakai dokumen yang sama (warm).
+    """
+    from db.operations import search_cvs
+
+    documents = {}
+    runs = []
+    for keywords in queries:
+        start = time.perf_counter()
+        result = search_cvs(keywords, algorithm, 10, categories=categories, documents=documents, limit_per_category=limit)
+        runs.append({
+            'total_s': time.perf_counter() - start,
+            'exact_s': result['execution_time_exact'],
+            'fuzzy_s': result['execution_time_fuzzy'],
+            'candidates': result['total_scanned'],
+        })
+    warm = runs[1:] or runs
+    totals = [run['total_s'] for run in warm]
+    return {
+        'scope': f"{'all' if limit is None else limit}/category",
+        'categories': categories or 'all',
+        'algorithm': algorithm,
+        'candidates': runs[0]['candidates'],
+        'cvs': len(documents),
+        'cold_s': runs[0]['total_s'],
+        'warm_p50_s': percentile(totals, 0.50),
+        'warm_p95_s': percentile(totals, 0.95),
+        'warm_exact_mean_s': statistics.mean(run['exact_s'] for run in warm),
+        'warm_fuzzy_mean_s': statistics.mean(run['fuzzy_s'] for run in warm),
+    }
+
+def synthetic_corpus(texts: list[str], scale: int, seed: int = 0) -> list[str]:
+    """
+    `scale` salinan seluruh teks; salinan ke-2 dst. berisi kata yang sama dengan urutan diacak
+    per CV, sehingga frekuensi kata tetap realistis tetapi isi setiap 'CV' berbeda.
+    """
+    rng = random.Random(seed)
+    corpus = list(texts)
+    for _ in range(scale - 1):
+        for text in texts:
+            words = text.split()
+            rng.shuffle(words)
+            corpus.append(' '.join(words))
+    return corpus
+
+def bench_synthetic(texts: list[str], scale: int, queries: list) -> dict:
+    """Waktu tahap matching (exact Corpus/Aho-Corasick, fuzzy lewat kosakata) pada korpus sintetis."""
+    corpus_texts = synthetic_corpus(texts, scale)
+    cv_paths = [f"synthetic/{i:06d}.pdf" for i in range(len(corpus_texts))]
+    size_mb = sum(len(text) for text in corpus_texts) / 1e6
+
+    start = time.perf_counter()
+    corpus = PackedCorpus.from_texts(cv_paths, corpus_texts)
+    corpus_build_s = time.perf_counter() - start
+
+    corpus_times, aho_times = [], []
+    for keywords in queries:
+        start = time.perf_counter()
+        for keyword in keywords:
+            corpus.lookup(keyword)
+        corpus_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        compiled = compile_keywords(keywords, 'AHO-CORASICK')
+        for text in corpus_texts:
+            match_exact(text, keywords, 'AHO-CORASICK', compiled)
+        aho_times.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    vocabulary = VocabularyIndex()
+    for cv_path, text in zip(cv_paths, corpus_texts):
+        vocabulary.add_document(cv_path, set(text.split()))
+    vocabulary_build_s = time.perf_counter() - start
+    fuzzy_times = []
+    for keywords in queries:
+        start = time.perf_counter()
+        vocabulary.fuzzy_matches(keywords, THRESHOLD)
+        fuzzy_times.append(time.perf_counter() - start)
+
+    return {
+        'scale': scale,
+        'cvs': len(corpus_texts),
+        'mb': size_mb,
+        'corpus_build_s': corpus_build_s,
+        'corpus_query_p50_s': percentile(corpus_times, 0.50),
+        'aho_corasick_query_p50_s': percentile(aho_times, 0.50),
+        'vocabulary_build_s': vocabulary_build_s,
+        'fuzzy_query_p50_s': percentile(fuzzy_times, 0.50),
+        'corpus_mb_per_s': size_mb / percentile(corpus_times, 0.50) if corpus_times else 0.0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark waktu pencarian per scope dan skala korpus sintetis.")
+    parser.add_argument('--scopes', default='20,100,all', help="Jumlah CV per kategori yang diukur ('all' = semua), dipisah koma; kosong = lewati")
+    parser.add_argument('--categories', default='', help="Subset kategori, dipisah koma (default: semua)")
+    parser.add_argument('--algorithms', default='CORPUS,AHO-CORASICK', help="Algoritma search_cvs, dipisah koma")
+    parser.add_argument('--scales', default='1,10', help="Kelipatan korpus sintetis dari seluruh CV di data/, dipisah koma; kosong = lewati")
+    parser.add_argument('--output', default=None, help="File JSON hasil (default: benchmarks/results/scope-<waktu>.json)")
+    args = parser.parse_args()
+
+    queries = DEFAULT_QUERIES
+    categories = [category.upper() for category in _parse_list(args.categories)] or None
+    report = {'queries': queries, 'scopes': [], 'synthetic': []}
+
+    scopes = _parse_list(args.scopes)
+    if scopes:
+        print(f"{'scope':14s} {'algoritma':13s} {'kandidat':>8s} {'dimuat':>6s} {'cold':>8s} {'warm p50':>9s} {'warm p95':>9s} {'exact':>8s} {'fuzzy':>8s}")
+    for scope in scopes:
+        limit = None if scope.lower() == 'all' else int(scope)
+        for algorithm in _parse_list(args.algorithms):
+            result = bench_scope(limit, categories, algorithm.upper(), queries)
+            report['scopes'].append(result)
+            print(
+                f"{result['scope']:14s} {result['algorithm']:13s} {result['candidates']:8d} {result['cvs']:6d} "
+                f"{result['cold_s']:7.2f}s {result['warm_p50_s']:8.3f}s {result['warm_p95_s']:8.3f}s "
+                f"{result['warm_exact_mean_s']:7.3f}s {result['warm_fuzzy_mean_s']:7.3f}s", flush=True
+            )
+
+    scales = [int(scale) for scale in _parse_list(args.scales)]
+    if scales:
+        texts = [extract_texts(cv_path)[1] for cv_path in list_cv_paths()]
+        print(f"\n{'skala':>5s} {'CV':>7s} {'MB':>7s} {'build':>8s} {'corpus':>8s} {'aho':>8s} {'vocab':>8s} {'fuzzy':>8s} {'MB/s':>8s}")
+        for scale in scales:
+            result = bench_synthetic(texts, scale, queries)
+            report['synthetic'].append(result)
+            print(
+                f"{scale:4d}x {result['cvs']:7d} {result['mb']:7.1f} {result['corpus_build_s']:7.2f}s "
+                f"{result['corpus_query_p50_s']:7.3f}s {result['aho_corasick_query_p50_s']:7.2f}s "
+                f"{result['vocabulary_build_s']:7.2f}s {result['fuzzy_query_p50_s']:7.3f}s {result['corpus_mb_per_s']:8.0f}", flush=True
+            )
+
+    output = args.output or os.path.join(RESULTS_DIR, f"scope-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil disimpan di {output}")
+
+    if scopes:
+        from db.operations import close_db_connection
+        close_db_connection()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# File: benchmarks/startup_report.py
+# Laporan waktu startup GUI: tahap startup main.py (sampai first paint) dan rincian import ala `-X importtime`.
+# Jalankan dari root proyek (butuh PyQt5; tanpa display memakai platform Qt 'offscreen'):
+#   python benchmarks/startup_report.py [--runs 3] [--top 15] [--module ui.main_page] [--output FILE]
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+import statistics
+
+from bench_utils import SRC_DIR
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+STAGE_LINE = re.compile(r'^  (.+?)\s+([\d.]+)  \(\+[\d.]+\)$')
+
+def _run(command: list) -> str:
+    """Menjalankan command di src/ dengan -X importtime dan mengembalikan stderr-nya."""
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + command,
+        cwd=SRC_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} gagal (exit {result.returncode}):\n{result.stderr[-2000:]}")
+    return result.stderr
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """Baris `-X importtime` menjadi list {'module', 'self_ms', 'cumulative_ms', 'depth'}."""
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append({
+                'module': module,
+                'self_ms': int(self_us) / 1000,
+                'cumulative_ms': int(cumulative_us) / 1000,
+                'depth': len(indent) // 2,
+            })
+    return modules
+
+def parse_stages(stderr: str) -> dict:
+    """Tahap dari laporan `main.py --startup-report`: {tahap: ms sejak main.py mulai}."""
+    return {match.group(1): float(match.group(2)) for match in map(STAGE_LINE.match, stderr.splitlines()) if match}
+
+def group_by_package(modules: list[dict]) -> dict:
+    """Total waktu import (self) per package tingkat atas, mis. 'PyQt5', 'fitz', 'db'."""
+    totals = {}
+    for module in modules:
+        package = module['module'].split('.')[0]
+        totals[package] = totals.get(package, 0.0) + module['self_ms']
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Laporan waktu startup GUI dan rincian import.")
+    parser.add_argument('--runs', type=int, default=3, help="Jumlah pengulangan (dilaporkan median)")
+    parser.add_argument('--top', type=int, default=15, help="Jumlah package/modul termahal yang ditampilkan")
+    parser.add_argument('--module', default=None,
+                        help="Ukur import satu modul saja (mis. db.operations) alih-alih menjalankan main.py")
+    parser.add_argument('--output', default=None, help="Simpan laporan sebagai JSON")
+    args = parser.parse_args()
+
+    if args.module:
+        command = ['-c', f'import {args.module}']
+    else:
+        command = ['main.py', '--startup-report', '--exit-after-startup', '--no-warm-up']
+
+    runs = []
+    for _ in range(args.runs):
+        stderr = _run(command)
+        runs.append((parse_importtime(stderr), parse_stages(stderr)))
+
+    # Run dengan waktu import total median dipakai untuk rincian per modul
+    runs.sort(key=lambda run: sum(module['self_ms'] for module in run[0]))
+    modules, _ = runs[len(runs) // 2]
+    stage_names = list(runs[0][1])
+    stages = {name: statistics.median(run[1][name] for run in runs if name in run[1]) for name in stage_names}
+    packages = group_by_package(modules)
+
+    if stages:
+        print(f"Tahap startup main.py (median {args.runs} run, ms sejak main.py mulai):")
+        for name, elapsed in stages.items():
+            print(f"  {name:28s} {elapsed:8.1f}")
+    print(f"Total import: {sum(module['self_ms'] for module in modules):.1f} ms ({len(modules)} modul)")
+    print("\nPackage termahal (self time):")
+    for package, elapsed in list(packages.items())[:args.top]:
+        print(f"  {package:28s} {elapsed:8.1f} ms")
+    print("\nModul termahal (cumulative):")
+    for module in sorted(modules, key=lambda module: -module['cumulative_ms'])[:args.top]:
+        print(f"  {'  ' * module['depth']}{module['module']:{max(1, 40 - 2 * module['depth'])}s} {module['cumulative_ms']:8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'command': command, 'stages_ms': stages, 'packages_ms': packages, 'modules': modules}, f, indent=2)
+
+if __name__ == '__main__':
+    main()
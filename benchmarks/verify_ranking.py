@@ -0,0 +1,96 @@
+# File: benchmarks/verify_ranking.py
+# Verifikasi acak pemangkasan top-N (core.ranking.TopNBound dan fuzzy_scope): hasil search_cvs dengan
+# pemangkasan harus sama persis dengan referensi tanpa pemangkasan (semua CV dihitung penuh, semua CV
+# ikut tahap fuzzy). Kandidat dibangkitkan dari PDF di data/ dengan pelamar yang memiliki beberapa CV,
+# baris duplikat, dan CV yang dimiliki beberapa pelamar; query acak mencakup existence_only.
+# Jalankan dari root proyek (tanpa database):
+#   python benchmarks/verify_ranking.py [--seed 0] [--queries 120] [--cvs 150]
+
+import sys
+import time
+import random
+import argparse
+
+import bench_utils  # noqa: F401 (menambahkan src/ ke sys.path)
+from db import operations
+from core.inverted_index import list_cv_paths
+
+KEYWORDS = [
+    'python', 'java', 'sql', 'react', 'html', 'excel', 'management', 'accounting', 'leadership',
+    'communication', 'sales', 'data', 'c++', 'node.js', 'project management', 'customer service',
+    # Typo / kata langka agar tahap fuzzy (dan fuzzy_scope) ikut teruji
+    'pyhton', 'managment', 'teh', 'zzzq',
+]
+
+def build_candidates(cv_paths: list[str], rng: random.Random) -> list[dict]:
+    """
+    Baris kandidat seperti hasil fetch_dataset_by_category: setiap pelamar memiliki 1-4 CV,
+    sebagian baris diduplikasi, dan sebagian CV juga dimiliki pelamar lain.
+    """
+    rows = []
+    applicant_id = 0
+    remaining = list(cv_paths)
+    while remaining:
+        applicant_id += 1
+        for _ in range(min(len(remaining), rng.randint(1, 4))):
+            rows.append((applicant_id, remaining.pop()))
+    for _ in range(len(rows) // 10):
+        rows.append(rng.choice(rows))                                 # baris duplikat
+        rows.append((rng.randint(1, applicant_id), rng.choice(cv_paths)))  # CV milik beberapa pelamar
+    rng.shuffle(rows)
+    return [{'id': candidate_id, 'name': f"Applicant {candidate_id}", 'cv_path': cv_path} for candidate_id, cv_path in rows]
+
+class _UnprunedBound(operations.TopNBound):
+    """TopNBound yang tidak pernah menganggap CV hopeless (semua keyword dihitung penuh)."""
+    def is_hopeless(self, cv_path: str) -> bool:
+        return False
+
+def _search(keywords, algorithm, top_n, existence_only, documents, pruned: bool) -> list:
+    if pruned:
+        return operations.search_cvs(keywords, algorithm, top_n, existence_only=existence_only, documents=documents)['data']
+    bound, scope = operations.TopNBound, operations.fuzzy_scope
+    operations.TopNBound = _UnprunedBound
+    operations.fuzzy_scope = lambda all_candidates, *args: {candidate['cv_path'] for candidate in all_candidates}
+    try:
+        return operations.search_cvs(keywords, algorithm, top_n, existence_only=existence_only, documents=documents)['data']
+    finally:
+        operations.TopNBound, operations.fuzzy_scope = bound, scope
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bandingkan hasil top-N dengan dan tanpa pemangkasan pada query acak.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed generator acak")
+    parser.add_argument('--queries', type=int, default=120, help="Jumlah query acak")
+    parser.add_argument('--cvs', type=int, default=150, help="Jumlah CV dari data/ yang dipakai")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cv_paths = list_cv_paths()
+    cv_paths = rng.sample(cv_paths, min(args.cvs, len(cv_paths)))
+    candidates = build_candidates(cv_paths, rng)
+    # Scope pencarian diganti kandidat sintetis (tanpa database)
+    operations.fetch_dataset_by_category = lambda categories, limit_per_category=None: [dict(candidate) for candidate in candidates]
+
+    documents = {}
+    elapsed = {True: 0.0, False: 0.0}
+    for index in range(1, args.queries + 1):
+        keywords = rng.sample(KEYWORDS, rng.randint(1, 4))
+        algorithm = rng.choice(['KMP', 'BM'])
+        top_n = rng.choice([1, 3, 5, 10])
+        existence_only = rng.random() < 0.3
+        results = {}
+        for pruned in (False, True):
+            start = time.perf_counter()
+            results[pruned] = _search(keywords, algorithm, top_n, existence_only, documents, pruned)
+            elapsed[pruned] += time.perf_counter() - start
+        if results[True] != results[False]:
+            print(f"BERBEDA pada query #{index}: {keywords} {algorithm} top_n={top_n} existence_only={existence_only}", file=sys.stderr)
+            print(f"  tanpa pemangkasan: {[(res['id'], res['matched_keywords']) for res in results[False]]}", file=sys.stderr)
+            print(f"  dengan pemangkasan: {[(res['id'], res['matched_keywords']) for res in results[True]]}", file=sys.stderr)
+            return 1
+
+    print(f"OK: {args.queries} query, {len(candidates)} baris kandidat, {len(cv_paths)} CV. "
+          f"Tanpa pemangkasan {elapsed[False]:.2f} detik, dengan pemangkasan {elapsed[True]:.2f} detik.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
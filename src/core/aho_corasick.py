@@ -1,50 +1,80 @@
 # File: src/core/aho_corasick.py
 
 from collections import deque
+from functools import lru_cache
 
-class TrieNode:
-    """Node untuk struktur data Trie."""
-    def __init__(self):
-        self.children = {}  # {char: TrieNode}
-        self.fail = None      # Failure link
-        self.output = []      # Daftar keyword yang berakhir di node ini
+AUTOMATON_CACHE_SIZE = 32  # Jumlah automaton (per himpunan keyword) yang disimpan di cache
 
 class AhoCorasick:
-    """Implementasi algoritma Aho-Corasick."""
+    """
+    Implementasi algoritma Aho-Corasick dalam bentuk terkompilasi.
+    Trie dibangun dengan dict sementara, lalu build_failure_links() mengompilasinya
+    menjadi DFA penuh atas alfabet keyword: satu tabel transisi per state (tanpa
+    fail-walk saat pencarian), indeks keyword per state, dan output link ke state
+    terminal berikutnya di rantai failure (bukan salinan list output).
+    """
+    __slots__ = ('keywords', 'delta', 'output', 'output_link', 'has_output', '_goto', '_terminal')
+
     def __init__(self):
-        self.root = TrieNode()
+        self.keywords = []      # Daftar keyword, indeks = id keyword
+        self.delta = []         # Tabel transisi DFA: delta[state] = {char: state_berikutnya}, selain itu ke root
+        self.output = []        # Id keyword yang berakhir di state (-1 jika tidak ada)
+        self.output_link = []   # State terminal terdekat di rantai failure (-1 jika tidak ada)
+        self.has_output = []    # True jika state atau rantai failure-nya menghasilkan keyword
+        self._goto = [{}]       # Trie sementara selama pembangunan: [{char: state}]
+        self._terminal = [-1]
 
     def add_keyword(self, keyword: str):
         """Menambahkan sebuah keyword ke dalam Trie."""
-        node = self.root
+        if keyword in self.keywords:
+            return
+        state = 0
         for char in keyword:
-            node = node.children.setdefault(char, TrieNode())
-        node.output.append(keyword)
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._terminal.append(-1)
+            state = next_state
+        self._terminal[state] = len(self.keywords)
+        self.keywords.append(keyword)
 
     def build_failure_links(self):
-        """Membangun failure links untuk semua node menggunakan Breadth-First Search (BFS)."""
-        queue = deque()
-        # Inisialisasi failure links untuk anak-anak dari root
-        for node in self.root.children.values():
-            node.fail = self.root
-            queue.append(node)
+        """
+        Membangun failure links dengan Breadth-First Search (BFS), lalu mengompilasi
+        trie menjadi tabel transisi DFA dan output link.
+        """
+        goto = self._goto
+        num_states = len(goto)
+        delta = [None] * num_states
+        fail = [0] * num_states
+        output = list(self._terminal)
+        output_link = [-1] * num_states
+
+        # Transisi root: hanya anak trie, karakter lain tetap di root
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
 
         while queue:
-            current_node = queue.popleft()
-            for char, next_node in current_node.children.items():
-                queue.append(next_node)
-                fail_node = current_node.fail
-                # Cari failure link untuk next_node
-                while char not in fail_node.children and fail_node is not self.root:
-                    fail_node = fail_node.fail
-                
-                if char in fail_node.children:
-                    next_node.fail = fail_node.children[char]
-                else:
-                    next_node.fail = self.root
-                
-                # Gabungkan output dari failure link
-                next_node.output.extend(next_node.fail.output)
+            state = queue.popleft()
+            fail_state = fail[state]
+            # Output link: state terminal terdekat di rantai failure
+            output_link[state] = fail_state if output[fail_state] >= 0 else output_link[fail_state]
+
+            # Transisi yang tidak ada di trie diwarisi dari state failure (DFA penuh)
+            fail_row = delta[fail_state]
+            row = dict(fail_row)
+            for char, next_state in goto[state].items():
+                fail[next_state] = fail_row.get(char, 0)
+                row[char] = next_state
+                queue.append(next_state)
+            delta[state] = row
+
+        self.delta = delta
+        self.output = output
+        self.output_link = output_link
+        self.has_output = [output[state] >= 0 or output_link[state] >= 0 for state in range(num_states)]
 
     def search(self, text: str) -> dict:
         """
@@ -52,22 +82,83 @@ class AhoCorasick:
         Return: dict dalam format {'keyword': [end_index_1, end_index_2, ...]}
         """
         results = {}
-        node = self.root
+        delta, has_output = self.delta, self.has_output
+        output, output_link, keywords = self.output, self.output_link, self.keywords
+        state = 0
         for i, char in enumerate(text):
-            while char not in node.children and node is not self.root:
-                node = node.fail
-            
-            if char in node.children:
-                node = node.children[char]
-            else:
-                # Jika tidak ada transisi bahkan dari root, tetap di root
-                node = self.root
-
-            # Jika ada output di node saat ini, catat semua keyword yang cocok
-            if node.output:
-                for keyword in node.output:
-                    if keyword not in results:
-                        results[keyword] = []
-                    # Mencatat posisi akhir dari keyword yang ditemukan
-                    results[keyword].append(i)
-        return results
\ No newline at end of file
+            state = delta[state].get(char, 0)
+            if not has_output[state]:
+                continue
+
+            # Telusuri state ini lalu output link-nya untuk mencatat semua keyword yang cocok
+            match_state = state if output[state] >= 0 else output_link[state]
+            while match_state >= 0:
+                keyword = keywords[output[match_state]]
+                if keyword not in results:
+                    results[keyword] = []
+                # Mencatat posisi akhir dari keyword yang ditemukan
+                results[keyword].append(i)
+                match_state = output_link[match_state]
+        return results
+
+    def count(self, text: str) -> dict:
+        """
+        Menghitung kemunculan setiap keyword tanpa menyimpan posisinya.
+        Return: dict dalam format {'keyword': jumlah_kemunculan}
+        """
+        counts = {}
+        delta, has_output = self.delta, self.has_output
+        output, output_link, keywords = self.output, self.output_link, self.keywords
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if not has_output[state]:
+                continue
+            match_state = state if output[state] >= 0 else output_link[state]
+            while match_state >= 0:
+                keyword = keywords[output[match_state]]
+                counts[keyword] = counts.get(keyword, 0) + 1
+                match_state = output_link[match_state]
+        return counts
+
+    def contains(self, text: str) -> set:
+        """
+        Mencari keyword mana saja yang muncul di teks.
+        Pemindaian berhenti begitu semua keyword sudah ditemukan.
+        Return: himpunan keyword yang ditemukan
+        """
+        found = set()
+        remaining = len(self.keywords)
+        delta, has_output = self.delta, self.has_output
+        output, output_link, keywords = self.output, self.output_link, self.keywords
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if not has_output[state]:
+                continue
+            match_state = state if output[state] >= 0 else output_link[state]
+            while match_state >= 0:
+                keyword = keywords[output[match_state]]
+                if keyword not in found:
+                    found.add(keyword)
+                    remaining -= 1
+                    if not remaining:
+                        return found
+                match_state = output_link[match_state]
+        return found
+
+@lru_cache(maxsize=AUTOMATON_CACHE_SIZE)
+def _get_compiled_automaton(keywords: tuple) -> AhoCorasick:
+    automaton = AhoCorasick()
+    for keyword in keywords:
+        automaton.add_keyword(keyword)
+    automaton.build_failure_links()
+    return automaton
+
+def get_automaton(keywords) -> AhoCorasick:
+    """
+    Mengembalikan automaton terkompilasi untuk himpunan keyword (LRU cache),
+    sehingga pencarian berulang dengan keyword yang sama tidak membangun ulang automaton.
+    Automaton yang dikembalikan dipakai bersama, jangan ditambah keyword lagi.
+    """
+    return _get_compiled_automaton(tuple(sorted(set(keywords))))
@@ -38,42 +38,69 @@ def preprocess_good_suffix(pattern: str) -> list[int]:
             
     return shift
 
-def bm_search(text: str, pattern: str) -> list[int]:
+class BMPattern:
     """
-    Mencari semua kemunculan pattern dalam text menggunakan Boyer-Moore
-    dengan Bad Character dan Good Suffix Heuristics.
+    Pattern Boyer-Moore yang sudah di-preprocess: tabel bad character dan
+    good suffix dihitung sekali saat konstruksi, lalu dipakai ulang untuk
+    mencari di banyak teks.
     """
-    if not pattern or not text or len(pattern) > len(text):
-        return []
+    __slots__ = ('pattern', 'bad_char_table', 'good_suffix_shift_table')
 
-    m = len(pattern)
-    n = len(text)
-    
-    # Pre-processing
-    bad_char_table = build_bad_char_table(pattern)
-    good_suffix_shift_table = preprocess_good_suffix(pattern)
-    
-    indices = []
-    s = 0  # s adalah shift dari pattern relatif terhadap text
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.bad_char_table = build_bad_char_table(pattern)
+        self.good_suffix_shift_table = preprocess_good_suffix(pattern)
 
-    while s <= n - m:
-        j = m - 1 # Mulai perbandingan dari kanan ke kiri
-        
-        while j >= 0 and pattern[j] == text[s + j]:
-            j -= 1
+    def finditer(self, text: str):
+        """
+        Menghasilkan (generator) indeks awal setiap kemunculan pattern dalam text
+        dengan Bad Character dan Good Suffix Heuristics.
+        """
+        pattern = self.pattern
+        if not pattern or not text or len(pattern) > len(text):
+            return
 
-        if j < 0:
-            # Pattern ditemukan
-            indices.append(s)
-            # Geser pattern berdasarkan tabel good suffix untuk mencari kemunculan berikutnya
-            s += good_suffix_shift_table[0]
-        else:
-            # Mismatch terjadi
-            # Hitung pergeseran dari kedua heuristik
-            bad_char_shift = j - bad_char_table.get(text[s + j], -1)
-            good_suffix_shift = good_suffix_shift_table[j + 1]
-            
-            # Pilih pergeseran terbesar untuk memaksimalkan lompatan
-            s += max(bad_char_shift, good_suffix_shift)
+        m = len(pattern)
+        n = len(text)
+        bad_char_table = self.bad_char_table
+        good_suffix_shift_table = self.good_suffix_shift_table
+        s = 0  # s adalah shift dari pattern relatif terhadap text
+
+        while s <= n - m:
+            j = m - 1 # Mulai perbandingan dari kanan ke kiri
             
-    return indices
\ No newline at end of file
+            while j >= 0 and pattern[j] == text[s + j]:
+                j -= 1
+
+            if j < 0:
+                # Pattern ditemukan
+                yield s
+                # Geser pattern berdasarkan tabel good suffix untuk mencari kemunculan berikutnya
+                s += good_suffix_shift_table[0]
+            else:
+                # Mismatch terjadi
+                # Hitung pergeseran dari kedua heuristik
+                bad_char_shift = j - bad_char_table.get(text[s + j], -1)
+                good_suffix_shift = good_suffix_shift_table[j + 1]
+                
+                # Pilih pergeseran terbesar untuk memaksimalkan lompatan
+                s += max(bad_char_shift, good_suffix_shift)
+
+    def search(self, text: str) -> list[int]:
+        """List berisi indeks awal dari semua kemunculan pattern."""
+        return list(self.finditer(text))
+
+    def count(self, text: str) -> int:
+        """Jumlah kemunculan pattern tanpa menyimpan indeksnya."""
+        return sum(1 for _ in self.finditer(text))
+
+    def contains(self, text: str) -> bool:
+        """True jika pattern muncul di text; berhenti pada kemunculan pertama."""
+        return next(self.finditer(text), None) is not None
+
+def bm_search(text: str, pattern: str) -> list[int]:
+    """
+    Mencari semua kemunculan pattern dalam text menggunakan Boyer-Moore
+    dengan Bad Character dan Good Suffix Heuristics.
+    """
+    return BMPattern(pattern).search(text)
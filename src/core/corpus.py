@@ -0,0 +1,261 @@
+# File: src/core/corpus.py
+
+import os
+import mmap
+import struct
+import logging
+import threading
+from array import array
+from bisect import bisect_right
+
+from core.pdf_parser import CACHE_DIR, extract_texts
+from core.cv_document import get_document
+from core.inverted_index import get_file_fingerprint, list_cv_paths
+
+logger = logging.getLogger(__name__)
+
+SEPARATOR = b'\x00'  # Pemisah antar CV di buffer; match yang melintasinya diabaikan
+
+# File korpus terkemas (read-only, dibuka dengan mmap):
+#   header (magic, jumlah CV, ukuran tabel path, ukuran blob)
+#   tabel path (UTF-8, dipisah '\n') | fingerprint (mtime_ns, size) per CV | offset (n + 1, posisi absolut di file) | blob
+CORPUS_PATH = os.path.join(CACHE_DIR, 'cv_corpus.bin')
+CORPUS_MAGIC = b'CVCORP01'
+HEADER = struct.Struct('<8sQQQ')
+
+class PackedCorpus:
+    """
+    Seluruh teks 'flat' CV (UTF-8) dalam satu buffer yang bersambung, dengan tabel
+    offset: CV ke-i menempati buffer[offsets[i]:offsets[i + 1] - 1].
+    Buffer berupa bytes (korpus di memori) atau mmap (file korpus), sehingga beberapa
+    proses yang membuka file yang sama memakai page cache yang sama tanpa menyalin teks.
+    Sebuah keyword dicari dengan find (C, satu lintasan), lalu setiap kemunculan
+    dipetakan ke CV-nya dengan binary search pada offsets. Karena UTF-8
+    self-synchronizing, jumlah kemunculan sama dengan pencarian per karakter.
+    """
+    def __init__(self, cv_paths: list[str], buffer, offsets: array, fingerprints: list = None):
+        self.cv_paths = list(cv_paths)
+        self.index = {cv_path: position for position, cv_path in enumerate(self.cv_paths)}
+        self.buffer = buffer
+        self.offsets = offsets
+        self.fingerprints = list(fingerprints) if fingerprints is not None else [None] * len(self.cv_paths)
+
+    @classmethod
+    def from_texts(cls, cv_paths: list[str], texts: list[str], fingerprints: list = None):
+        """Membangun korpus di memori dari teks flat setiap CV."""
+        offsets = array('q', [0])
+        chunks = []
+        for text in texts:
+            encoded = (text or '').encode('utf-8')
+            chunks.append(encoded)
+            offsets.append(offsets[-1] + len(encoded) + len(SEPARATOR))
+        return cls(cv_paths, SEPARATOR.join(chunks) + SEPARATOR, offsets, fingerprints)
+
+    @classmethod
+    def open(cls, path: str = CORPUS_PATH):
+        """Membuka file korpus dengan mmap (read-only). Hanya tabel kecil yang disalin ke memori."""
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, paths_size, _ = HEADER.unpack_from(buffer, 0)
+        if magic != CORPUS_MAGIC:
+            buffer.close()
+            raise ValueError(f"{path} bukan file korpus yang valid.")
+        position = HEADER.size
+        cv_paths = buffer[position:position + paths_size].decode('utf-8').split('\n') if count else []
+        position += paths_size
+        fingerprints = array('q')
+        fingerprints.frombytes(buffer[position:position + 16 * count])
+        position += 16 * count
+        offsets = array('q')
+        offsets.frombytes(buffer[position:position + 8 * (count + 1)])
+        pairs = [(fingerprints[2 * i], fingerprints[2 * i + 1]) for i in range(count)]
+        return cls(cv_paths, buffer, offsets, pairs)
+
+    def save(self, path: str = CORPUS_PATH):
+        """
+        Menulis korpus ke file (atomik lewat os.replace, sehingga proses yang masih
+        me-mmap file lama tetap membaca isi lama sampai membuka ulang).
+        """
+        paths_blob = '\n'.join(self.cv_paths).encode('utf-8')
+        count = len(self.cv_paths)
+        blob_start = HEADER.size + len(paths_blob) + 16 * count + 8 * (count + 1)
+        base = self.offsets[0]
+        fingerprints = array('q')
+        for fingerprint in self.fingerprints:
+            fingerprints.extend(fingerprint or (0, 0))
+        offsets = array('q', (blob_start + offset - base for offset in self.offsets))
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(CORPUS_MAGIC, count, len(paths_blob), self.offsets[-1] - base))
+            f.write(paths_blob)
+            f.write(fingerprints.tobytes())
+            f.write(offsets.tobytes())
+            f.write(self.buffer[base:self.offsets[-1]])
+        os.replace(temp_path, path)
+
+    def close(self):
+        """Menutup mmap file korpus beserta handle file-nya (korpus di memori tidak perlu ditutup)."""
+        if not isinstance(self.buffer, mmap.mmap):
+            return
+        try:
+            self.buffer.close()
+        except BufferError:
+            # Masih ada view (text_view) yang dipakai: mmap ditutup GC setelah view terakhir dilepas
+            logger.debug("File korpus lama masih dipakai; mmap ditutup setelah view terakhir dilepas.")
+
+    def __len__(self) -> int:
+        return len(self.cv_paths)
+
+    def text_view(self, cv_path: str) -> memoryview:
+        """Teks flat (UTF-8) sebuah CV sebagai memoryview ke buffer, tanpa menyalin."""
+        position = self.index[cv_path]
+        return memoryview(self.buffer)[self.offsets[position]:self.offsets[position + 1] - len(SEPARATOR)]
+
+    def find_counts(self, keyword: str, existence_only: bool = False, runs: list = None) -> dict:
+        """
+        Jumlah kemunculan (overlapping, seperti KMP/BM) `keyword` di setiap CV.
+        `runs` membatasi pencarian ke rentang indeks CV [awal, akhir) (default: seluruh korpus).
+        Jika `existence_only`, pencarian langsung melompat ke CV berikutnya setelah kemunculan pertama.
+        Return: {indeks_cv: jumlah} (hanya CV yang memuat keyword)
+        """
+        needle = keyword.encode('utf-8')
+        if not needle:
+            return {}
+        buffer, offsets = self.buffer, self.offsets
+        find, length = buffer.find, len(needle)
+        counts = {}
+        for first, last in runs if runs is not None else [(0, len(self.cv_paths))]:
+            run_end = offsets[last] - len(SEPARATOR)
+            position = find(needle, offsets[first], run_end)
+            while position != -1:
+                index = bisect_right(offsets, position) - 1
+                end = offsets[index + 1] - len(SEPARATOR)  # Posisi separator setelah CV ke-index
+                if position + length > end:
+                    # Match melintasi batas CV (hanya mungkin jika keyword memuat SEPARATOR)
+                    position = find(needle, position + 1, run_end)
+                elif existence_only:
+                    counts[index] = 1
+                    position = find(needle, end + len(SEPARATOR), run_end)
+                else:
+                    counts[index] = counts.get(index, 0) + 1
+                    position = find(needle, position + 1, run_end)
+        return counts
+
+    def lookup(self, keyword: str, existence_only: bool = False) -> dict:
+        """Sama seperti find_counts, tetapi dengan key cv_path: {cv_path: jumlah}."""
+        cv_paths = self.cv_paths
+        return {cv_paths[index]: count for index, count in self.find_counts(keyword, existence_only).items()}
+
+    def select(self, cv_paths: list[str], fingerprints: list):
+        """
+        CorpusScope untuk sebagian CV, atau None jika ada CV yang tidak ada di korpus
+        atau sudah berubah (fingerprint berbeda). CV yang file-nya tidak ada (fingerprint
+        None) tidak memiliki teks, sehingga cukup dilewati.
+        """
+        indices = []
+        for cv_path, fingerprint in zip(cv_paths, fingerprints):
+            if fingerprint is None:
+                continue
+            position = self.index.get(cv_path)
+            if position is None or self.fingerprints[position] != fingerprint:
+                return None
+            indices.append(position)
+        return CorpusScope(self, indices)
+
+class CorpusScope:
+    """
+    Sebagian CV dari sebuah PackedCorpus. Indeks CV digabung menjadi rentang
+    bersambung sehingga find tetap berjalan langsung di buffer (tanpa menyalin teks).
+    """
+    def __init__(self, corpus: PackedCorpus, indices: list[int]):
+        self.corpus = corpus
+        self.runs = []
+        for position in sorted(set(indices)):
+            if self.runs and self.runs[-1][1] == position:
+                self.runs[-1][1] = position + 1
+            else:
+                self.runs.append([position, position + 1])
+
+    def lookup(self, keyword: str, existence_only: bool = False) -> dict:
+        """{cv_path: jumlah} untuk CV di dalam scope saja."""
+        cv_paths = self.corpus.cv_paths
+        counts = self.corpus.find_counts(keyword, existence_only, self.runs)
+        return {cv_paths[index]: count for index, count in counts.items()}
+
+_corpus_instance = None
+_corpus_lock = threading.Lock()
+_store_instance = None
+_store_stat = None
+
+def get_corpus_store(path: str = CORPUS_PATH):
+    """
+    Mengembalikan file korpus yang di-mmap (satu per proses), atau None jika belum dibangun.
+    File dibuka ulang jika sudah diganti (mis. setelah `python -m core.corpus`).
+    """
+    global _store_instance, _store_stat
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    with _corpus_lock:
+        if _store_instance is None or _store_stat != key:
+            # File diganti: mmap dan handle file lama ditutup sebelum diganti store baru
+            if _store_instance is not None:
+                _store_instance.close()
+            try:
+                _store_instance, _store_stat = PackedCorpus.open(path), key
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning(f"Gagal membuka file korpus {path}: {str(e)}")
+                _store_instance, _store_stat = None, None
+        return _store_instance
+
+def store_covers(cv_paths: list[str], fingerprints: list = None) -> bool:
+    """True jika file korpus memuat seluruh `cv_paths` dalam versi terbaru."""
+    store = get_corpus_store()
+    if store is None:
+        return False
+    if fingerprints is None:
+        fingerprints = [get_file_fingerprint(cv_path) for cv_path in cv_paths]
+    return store.select(cv_paths, fingerprints) is not None
+
+def get_corpus(cv_paths: list[str], documents: dict):
+    """
+    Mengembalikan korpus untuk `cv_paths` (objek dengan lookup(keyword, existence_only)).
+    Jika file korpus memuat seluruh CV dalam versi terbaru, pencarian berjalan langsung
+    di file yang di-mmap. Jika tidak, korpus dibangun di memori dari teks di `documents`;
+    korpus terakhir dipakai ulang selama daftar CV sama dan tidak ada file yang berubah.
+    """
+    global _corpus_instance
+    fingerprints = [get_file_fingerprint(cv_path) for cv_path in cv_paths]
+    store = get_corpus_store()
+    if store is not None:
+        scope = store.select(cv_paths, fingerprints)
+        if scope is not None:
+            return scope
+        logger.debug("File korpus tidak memuat semua CV terbaru; korpus dibangun di memori (jalankan python -m core.corpus).")
+    with _corpus_lock:
+        corpus = _corpus_instance
+        if corpus is None or corpus.cv_paths != cv_paths or corpus.fingerprints != fingerprints:
+            texts = [get_document(documents, cv_path).flat_text for cv_path in cv_paths]
+            corpus = _corpus_instance = PackedCorpus.from_texts(cv_paths, texts, fingerprints)
+    return corpus
+
+def build_corpus_store(data_dir: str = 'data', path: str = CORPUS_PATH) -> PackedCorpus:
+    """Membangun file korpus dari seluruh PDF di `data_dir` (teks diambil dari text cache jika ada)."""
+    cv_paths = list_cv_paths(data_dir)
+    texts = [extract_texts(cv_path)[1] for cv_path in cv_paths]
+    fingerprints = [get_file_fingerprint(cv_path) for cv_path in cv_paths]
+    corpus = PackedCorpus.from_texts(cv_paths, texts, fingerprints)
+    corpus.save(path)
+    logger.info(f"Korpus berisi {len(corpus)} CV ({os.path.getsize(path) / 1e6:.1f} MB) disimpan di {path}.")
+    return corpus
+
+
+if __name__ == '__main__':
+    # Jalankan dari direktori src: python -m core.corpus [data_dir]
+    import sys
+    logging.basicConfig(level=logging.INFO)
+    build_corpus_store(sys.argv[1] if len(sys.argv) > 1 else 'data')
@@ -0,0 +1,55 @@
+# File: src/core/cv_document.py
+
+import logging
+from core.pdf_parser import extract_texts
+
+logger = logging.getLogger(__name__)
+
+class CVDocument:
+    """
+    Representasi sebuah CV selama satu aksi pengguna.
+    PDF hanya di-decode sekali (saat atribut teks pertama kali diakses), lalu
+    teks mentah, teks 'flat', dan himpunan kata dipakai bersama oleh tahap
+    exact match, fuzzy match, dan halaman ringkasan.
+    """
+    __slots__ = ('cv_path', '_raw_text', '_flat_text', '_words')
+
+    def __init__(self, cv_path: str):
+        self.cv_path = cv_path
+        self._raw_text = None
+        self._flat_text = None
+        self._words = None
+
+    def _load(self):
+        self._raw_text, self._flat_text = extract_texts(self.cv_path)
+        if not self._flat_text:
+            logger.warning(f"Tidak ada teks yang diekstrak dari {self.cv_path}")
+
+    @property
+    def raw_text(self) -> str:
+        """Teks dengan format asli, untuk Regex."""
+        if self._raw_text is None:
+            self._load()
+        return self._raw_text
+
+    @property
+    def flat_text(self) -> str:
+        """Teks lowercase dengan whitespace tunggal, untuk KMP/BM/Aho-Corasick."""
+        if self._flat_text is None:
+            self._load()
+        return self._flat_text
+
+    @property
+    def words(self) -> set:
+        """Himpunan kata unik dari teks flat, untuk fuzzy matching."""
+        if self._words is None:
+            self._words = set(self.flat_text.split())
+        return self._words
+
+def get_document(documents: dict, cv_path: str) -> CVDocument:
+    """Mengambil CVDocument dari `documents` (per request), membuatnya jika belum ada."""
+    document = documents.get(cv_path)
+    if document is None:
+        # setdefault: aman jika `documents` dipakai bersama beberapa thread (mis. server HTTP)
+        document = documents.setdefault(cv_path, CVDocument(cv_path))
+    return document
@@ -0,0 +1,235 @@
+# File: src/core/inverted_index.py
+
+import os
+import re
+import glob
+import pickle
+import logging
+import threading
+from array import array
+
+from core.pdf_parser import CACHE_DIR, ROOT_DIR, extract_texts, get_absolute_path
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = os.path.join(CACHE_DIR, 'cv_inverted_index.pickle')
+INDEX_FORMAT_VERSION = 2
+
+# Token: huruf/angka beserta simbol yang lazim di nama skill (c++, c#, node.js, e-commerce)
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:[.\-/&][a-z0-9+#]+)*")
+# Penghubung di dalam token gabungan (patient-centered, sales/marketing)
+JOINER_PATTERN = re.compile(r"[.\-/&]")
+
+# Flag kemunculan bagian token gabungan (disimpan di 2 bit terbawah: posisi * 4 + flag)
+PART_FIRST = 1  # Bagian pertama: boleh didahului token sebelumnya dalam frasa
+PART_LAST = 2   # Bagian terakhir: boleh diikuti token sesudahnya dalam frasa
+
+def tokenize(text: str) -> list[str]:
+    """Memecah teks flat (lowercase) menjadi daftar token secara berurutan."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def get_file_fingerprint(cv_path: str):
+    """Mengembalikan (mtime_ns, size) dari file CV, atau None jika file tidak ada."""
+    absolute_path = get_absolute_path(cv_path)
+    if not absolute_path:
+        return None
+    stat = os.stat(absolute_path)
+    return stat.st_mtime_ns, stat.st_size
+
+class InvertedIndex:
+    """
+    Positional inverted index: term -> cv_path -> posisi token kemunculan.
+    Query exact keyword dijawab dengan lookup dictionary, sedangkan keyword
+    multi-kata diselesaikan dengan interseksi posisi (posisi berurutan).
+    Berbeda dengan KMP/BM/Aho-Corasick/Corpus yang mencocokkan substring, index hanya
+    mencocokkan token utuh: 'java' tidak cocok dengan 'javascript', dan keyword yang
+    hanya muncul sebagai bagian kata dianggap tidak ditemukan (lalu masuk tahap fuzzy).
+    Bagian token gabungan juga diindeks, sehingga 'patient' cocok dengan "patient-centered" dan
+    'centered care' dengan "patient-centered care" (seperti algoritma substring).
+    """
+    def __init__(self):
+        self.postings = {}   # {term: {cv_path: array('I', [posisi, ...])}}
+        self.parts = {}      # {bagian: {cv_path: array('I', [posisi * 4 + flag, ...])}}
+        self.documents = {}  # {cv_path: (mtime_ns, size, jumlah_token)}
+
+    def add_document(self, cv_path: str, flat_text: str, fingerprint: tuple):
+        """Menambahkan (atau mengganti) sebuah CV ke dalam index."""
+        if cv_path in self.documents:
+            self.remove_document(cv_path)
+
+        positions_by_term = {}
+        occurrences_by_part = {}
+        tokens = tokenize(flat_text)
+        for position, term in enumerate(tokens):
+            positions_by_term.setdefault(term, []).append(position)
+            parts = JOINER_PATTERN.split(term)
+            if len(parts) > 1:
+                last = len(parts) - 1
+                for i, part in enumerate(parts):
+                    flag = (PART_FIRST if i == 0 else 0) | (PART_LAST if i == last else 0)
+                    occurrences_by_part.setdefault(part, []).append(position * 4 + flag)
+
+        for term, positions in positions_by_term.items():
+            self.postings.setdefault(term, {})[cv_path] = array('I', positions)
+        for part, occurrences in occurrences_by_part.items():
+            self.parts.setdefault(part, {})[cv_path] = array('I', occurrences)
+        self.documents[cv_path] = (fingerprint[0], fingerprint[1], len(tokens))
+
+    def remove_document(self, cv_path: str):
+        """Menghapus sebuah CV dari index."""
+        if self.documents.pop(cv_path, None) is None:
+            return
+        for postings in (self.postings, self.parts):
+            empty_terms = []
+            for term, docs in postings.items():
+                if docs.pop(cv_path, None) is not None and not docs:
+                    empty_terms.append(term)
+            for term in empty_terms:
+                del postings[term]
+
+    def is_fresh(self, cv_path: str, fingerprint: tuple) -> bool:
+        """True jika CV sudah ada di index dan belum berubah sejak diindeks."""
+        entry = self.documents.get(cv_path)
+        return entry is not None and entry[:2] == tuple(fingerprint)
+
+    def _occurrences(self, term: str, part_flag: int = None) -> dict:
+        """
+        Posisi sebuah term sebagai token utuh, ditambah kemunculannya sebagai bagian token gabungan:
+        semua bagian jika `part_flag` None, hanya bagian dengan flag tersebut, atau tidak ada jika 0.
+        Return: dict dalam format {cv_path: [posisi, ...]}
+        """
+        occurrences = {cv_path: list(positions) for cv_path, positions in self.postings.get(term, {}).items()}
+        if part_flag != 0:
+            for cv_path, encoded in self.parts.get(term, {}).items():
+                positions = [value >> 2 for value in encoded if part_flag is None or value & part_flag]
+                if positions:
+                    occurrences.setdefault(cv_path, []).extend(positions)
+        return occurrences
+
+    def phrase_positions(self, terms: list[str]) -> dict:
+        """
+        Mencari frasa (urutan token) di seluruh index. Term pertama boleh berupa bagian terakhir
+        token gabungan dan term terakhir boleh berupa bagian pertamanya ('centered care' cocok dengan
+        "patient-centered care"); term di tengah frasa harus token utuh.
+        Return: dict dalam format {cv_path: [posisi_token_awal, ...]}
+        """
+        if not terms:
+            return {}
+        if len(terms) == 1:
+            part_flags = [None]
+        else:
+            part_flags = [PART_LAST] + [0] * (len(terms) - 2) + [PART_FIRST]
+        term_postings = []
+        for term, part_flag in zip(terms, part_flags):
+            docs = self._occurrences(term, part_flag)
+            if not docs:
+                return {}
+            term_postings.append(docs)
+
+        if len(terms) == 1:
+            return term_postings[0]
+
+        # Mulai dari term dengan posting list terkecil untuk mempercepat interseksi dokumen
+        smallest = min(term_postings, key=len)
+        results = {}
+        for cv_path in smallest:
+            if not all(cv_path in docs for docs in term_postings):
+                continue
+            starts = term_postings[0][cv_path]
+            following = [set(docs[cv_path]) for docs in term_postings[1:]]
+            matches = [p for p in starts if all(p + offset in positions for offset, positions in enumerate(following, start=1))]
+            if matches:
+                results[cv_path] = matches
+        return results
+
+    def lookup(self, keyword: str) -> dict:
+        """
+        Mencari keyword (satu atau beberapa kata) di seluruh index, sebagai token utuh.
+        Return: dict dalam format {cv_path: jumlah_kemunculan}
+        """
+        return {cv_path: len(positions) for cv_path, positions in self.phrase_positions(tokenize(keyword)).items()}
+
+    def save(self, path: str = INDEX_PATH):
+        """Menyimpan index ke disk."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((INDEX_FORMAT_VERSION, self.documents, self.postings, self.parts), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = INDEX_PATH):
+        """Memuat index dari disk. Mengembalikan index kosong jika file tidak ada atau tidak valid."""
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        try:
+            with open(path, 'rb') as f:
+                version, *state = pickle.load(f)
+            if version == INDEX_FORMAT_VERSION:
+                index.documents, index.postings, index.parts = state
+        except Exception as e:
+            logger.warning(f"Gagal memuat inverted index dari {path}: {str(e)}")
+        return index
+
+    def update(self, cv_paths: list[str]) -> int:
+        """
+        Memastikan setiap CV di `cv_paths` ada di index dan up-to-date.
+        Return: jumlah CV yang (re)indeks.
+        """
+        updated = 0
+        for cv_path in cv_paths:
+            fingerprint = get_file_fingerprint(cv_path)
+            if fingerprint is None:
+                self.remove_document(cv_path)
+                continue
+            if self.is_fresh(cv_path, fingerprint):
+                continue
+            _, flat_text = extract_texts(cv_path)
+            if not flat_text:
+                # Ekstraksi gagal: entri dibiarkan stale agar dicoba lagi pada update berikutnya
+                continue
+            self.add_document(cv_path, flat_text, fingerprint)
+            updated += 1
+        return updated
+
+_index_instance = None
+_index_lock = threading.Lock()
+
+def get_inverted_index(cv_paths: list[str] = None) -> InvertedIndex:
+    """
+    Mengembalikan instance tunggal InvertedIndex (dimuat dari disk sekali).
+    Jika `cv_paths` diberikan, CV yang belum ada atau sudah berubah akan diindeks
+    ulang dan index disimpan kembali ke disk.
+    """
+    global _index_instance
+    # Lock: pencarian dari beberapa thread tidak boleh memperbarui/menyimpan index bersamaan
+    with _index_lock:
+        if _index_instance is None:
+            _index_instance = InvertedIndex.load()
+        if cv_paths and _index_instance.update(cv_paths):
+            _index_instance.save()
+    return _index_instance
+
+def list_cv_paths(data_dir: str = 'data') -> list[str]:
+    """Mengembalikan path relatif semua PDF di bawah `data_dir`, terurut."""
+    pattern = os.path.join(ROOT_DIR, data_dir, '*', '*.pdf')
+    return sorted(os.path.relpath(path, ROOT_DIR).replace(os.sep, '/') for path in glob.glob(pattern))
+
+def build_index(data_dir: str = 'data', path: str = INDEX_PATH) -> InvertedIndex:
+    """Membangun (atau memperbarui) index untuk seluruh PDF di `data_dir` lalu menyimpannya."""
+    index = InvertedIndex.load(path)
+    cv_paths = list_cv_paths(data_dir)
+    stale = set(index.documents) - set(cv_paths)
+    for cv_path in stale:
+        index.remove_document(cv_path)
+    updated = index.update(cv_paths)
+    index.save(path)
+    logger.info(f"Index berisi {len(index.documents)} CV ({updated} diperbarui, {len(stale)} dihapus), {len(index.postings)} term.")
+    return index
+
+
+if __name__ == '__main__':
+    # Jalankan dari direktori src: python -m core.inverted_index [data_dir]
+    import sys
+    build_index(sys.argv[1] if len(sys.argv) > 1 else 'data')
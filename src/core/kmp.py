@@ -16,6 +16,52 @@ def compute_lps_array(pattern: str) -> list[int]:
                 i += 1
     return lps
 
+class KMPPattern:
+    """
+    Pattern KMP yang sudah di-preprocess: tabel LPS dihitung sekali saat
+    konstruksi, lalu dipakai ulang untuk mencari di banyak teks.
+    """
+    __slots__ = ('pattern', 'lps')
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.lps = compute_lps_array(pattern)
+
+    def finditer(self, text: str):
+        """Menghasilkan (generator) indeks awal setiap kemunculan pattern dalam text."""
+        pattern, lps = self.pattern, self.lps
+        m, n = len(pattern), len(text)
+        if not m:
+            return
+        i = 0  # Indeks untuk text
+        j = 0  # Indeks untuk pattern
+
+        while i < n:
+            if pattern[j] == text[i]:
+                i += 1
+                j += 1
+
+            if j == m:
+                yield i - j
+                j = lps[j - 1]
+            elif i < n and pattern[j] != text[i]:
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+
+    def search(self, text: str) -> list[int]:
+        """List berisi indeks awal dari semua kemunculan pattern."""
+        return list(self.finditer(text))
+
+    def count(self, text: str) -> int:
+        """Jumlah kemunculan pattern tanpa menyimpan indeksnya."""
+        return sum(1 for _ in self.finditer(text))
+
+    def contains(self, text: str) -> bool:
+        """True jika pattern muncul di text; berhenti pada kemunculan pertama."""
+        return next(self.finditer(text), None) is not None
+
 def kmp_search(text: str, pattern: str) -> list[int]:
     """
     Mencari semua kemunculan pattern dalam text menggunakan KMP.
@@ -23,26 +69,4 @@ def kmp_search(text: str, pattern: str) -> list[int]:
     Returns:
         List berisi indeks awal dari semua kemunculan pattern.
     """
-    if not pattern:
-        return []
-        
-    m, n = len(pattern), len(text)
-    lps = compute_lps_array(pattern)
-    indices = []
-    i = 0  # Indeks untuk text
-    j = 0  # Indeks untuk pattern
-
-    while i < n:
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-
-        if j == m:
-            indices.append(i - j)
-            j = lps[j - 1]
-        elif i < n and pattern[j] != text[i]:
-            if j != 0:
-                j = lps[j - 1]
-            else:
-                i += 1
-    return indices
\ No newline at end of file
+    return KMPPattern(pattern).search(text)
@@ -21,4 +21,56 @@ def levenshtein_distance(s1: str, s2: str) -> int:
                            dp[i][j - 1] + 1,        # Insertion
                            dp[i - 1][j - 1] + cost) # Substitution
     
-    return dp[m][n]
\ No newline at end of file
+    return dp[m][n]
+
+def levenshtein_distance_bounded(s1: str, s2: str, max_distance: int = None) -> int:
+    """
+    Menghitung Levenshtein distance dengan algoritma bit-vector Myers (Hyyro).
+    Satu kolom DP diproses sebagai operasi bit pada integer, dan perhitungan
+    berhenti lebih awal begitu jarak pasti melebihi `max_distance`.
+    Berbeda dengan levenshtein_distance, string tidak di-lowercase (pemanggil
+    diharapkan sudah menormalisasi input).
+
+    Returns:
+        Jarak Levenshtein jika <= max_distance, selain itu max_distance + 1.
+        Jika max_distance None, selalu mengembalikan jarak yang sebenarnya.
+    """
+    # Gunakan string yang lebih pendek sebagai pattern (bit-vector lebih kecil)
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    m, n = len(s1), len(s2)
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+
+    # Peq: bitmask posisi kemunculan setiap karakter pada pattern
+    peq = {}
+    for i, char in enumerate(s1):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+    pv, mv = mask, 0  # Vertical delta +1 / -1
+    score = m
+
+    for j, char in enumerate(s2):
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)  # Horizontal delta +1
+        mh = pv & xh                   # Horizontal delta -1
+        if ph & last_bit:
+            score += 1
+        elif mh & last_bit:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+        # Jarak hanya bisa turun paling banyak 1 per karakter s2 yang tersisa
+        if max_distance is not None and score - (n - j - 1) > max_distance:
+            return max_distance + 1
+
+    return score
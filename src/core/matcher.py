@@ -0,0 +1,56 @@
+# File: src/core/matcher.py
+
+from core.kmp import KMPPattern
+from core.bm import BMPattern
+from core.aho_corasick import get_automaton
+
+THRESHOLD = 2  # Jarak Levenshtein <= 2 dianggap mirip
+
+def compile_keywords(keywords: list[str], algorithm: str, binary: bool = False):
+    """
+    Preprocessing keyword sekali per query, untuk dipakai di semua CV.
+    KMP/BM: list (keyword, KMPPattern/BMPattern). Aho-Corasick: automaton terkompilasi (dari LRU cache).
+    Jika `binary`, pattern dibangun dari keyword UTF-8 untuk teks berupa bytes/memoryview
+    (mis. PackedCorpus.text_view), sehingga teks tidak perlu di-decode menjadi string.
+    """
+    patterns = [keyword.encode('utf-8') for keyword in keywords] if binary else keywords
+    if algorithm == 'KMP':
+        return [(keyword, KMPPattern(pattern)) for keyword, pattern in zip(keywords, patterns)]
+    if algorithm == 'BM':
+        return [(keyword, BMPattern(pattern)) for keyword, pattern in zip(keywords, patterns)]
+    if algorithm == 'AHO-CORASICK':
+        return get_automaton(patterns)
+    return None
+
+def match_exact(cv_text: str, keywords: list[str], algorithm: str, compiled=None, existence_only: bool = False) -> dict:
+    """
+    Exact matching seluruh keyword pada satu teks CV.
+    `compiled` adalah hasil compile_keywords; jika None, keyword di-preprocess di sini.
+    Jika `existence_only`, pemindaian berhenti pada kemunculan pertama dan jumlahnya dicatat 1.
+    `cv_text` boleh berupa bytes/memoryview UTF-8; `compiled` harus dibuat dengan binary=True.
+    Return: dict dalam format {'keyword': jumlah_kemunculan} (hanya keyword yang ditemukan)
+    """
+    matches = {}
+    if not cv_text:
+        return matches
+    binary = not isinstance(cv_text, str)
+    if compiled is None:
+        compiled = compile_keywords(keywords, algorithm, binary)
+
+    if algorithm in ['KMP', 'BM']:
+        for keyword, pattern in compiled:
+            count = int(pattern.contains(cv_text)) if existence_only else pattern.count(cv_text)
+            if count:
+                matches[keyword] = count
+
+    elif algorithm == 'AHO-CORASICK':
+        # Cari semua keyword sekaligus
+        if existence_only:
+            found = compiled.contains(cv_text)
+            matches = {keyword: 1 for keyword in keywords if (keyword.encode('utf-8') if binary else keyword) in found}
+        elif binary:
+            matches = {keyword.decode('utf-8'): count for keyword, count in compiled.count(cv_text).items()}
+        else:
+            matches = compiled.count(cv_text)
+
+    return matches
@@ -0,0 +1,113 @@
+# File: src/core/parallel_scan.py
+
+import math
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from core.pdf_parser import extract_texts
+from core.matcher import compile_keywords, match_exact
+from core.corpus import get_corpus_store
+
+logger = logging.getLogger(__name__)
+
+TASKS_PER_WORKER = 4  # Jumlah shard per worker jika chunk_size otomatis
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()  # Melindungi pembuatan, penggantian, dan shutdown _pool
+
+def scan_exact_shard(shard: tuple) -> dict:
+    """
+    Worker: ekstraksi teks (atau view ke file korpus jika `use_store`) + exact matching untuk satu shard CV.
+    (Fuzzy matching tidak perlu diparalelkan: cukup satu query ke VocabularyIndex.)
+    Return: dict dalam format {cv_path: {'keyword': jumlah}} (hanya CV yang cocok)
+    """
+    cv_paths, keywords, algorithm, existence_only, use_store = shard
+    # File korpus di-mmap: teks dibaca langsung dari page cache bersama, tanpa salinan string per proses
+    store = get_corpus_store() if use_store else None
+    compiled = compile_keywords(keywords, algorithm, binary=store is not None)
+    results = {}
+    for cv_path in cv_paths:
+        if store is None:
+            cv_text = extract_texts(cv_path)[1]
+        elif cv_path in store.index:
+            cv_text = store.text_view(cv_path)
+        else:
+            cv_text = extract_texts(cv_path)[1].encode('utf-8')
+        matches = match_exact(cv_text, keywords, algorithm, compiled, existence_only)
+        if matches:
+            results[cv_path] = matches
+    return results
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers == workers:
+            return _pool
+        old_pool = _pool
+        pool = _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    if old_pool is not None:
+        # Pencarian lain mungkin masih memakai pool lama: shard yang sudah dikirim tetap diselesaikan
+        old_pool.shutdown(wait=False)
+    return pool
+
+def _discard_pool(broken_pool: ProcessPoolExecutor):
+    """Membuang pool yang rusak, kecuali sudah diganti thread lain (pool baru tidak ikut dimatikan)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not broken_pool:
+            return
+        _pool = None
+        _pool_workers = 0
+    broken_pool.shutdown(cancel_futures=True)
+
+def shutdown_pool():
+    """Mematikan process pool (dipanggil saat aplikasi keluar)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool, _pool, _pool_workers = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+def _compute_chunk_size(total: int, workers: int, chunk_size: int) -> int:
+    if chunk_size > 0:
+        return chunk_size
+    return max(1, math.ceil(total / (workers * TASKS_PER_WORKER)))
+
+def _run_sharded(worker_func, cv_paths: list[str], args: tuple, workers: int, chunk_size: int, merged: dict,
+                 on_progress=None, should_cancel=None) -> bool:
+    size = _compute_chunk_size(len(cv_paths), workers, chunk_size)
+    shards = [(cv_paths[i:i + size], *args) for i in range(0, len(cv_paths), size)]
+    pool = None
+    try:
+        pool = _get_pool(workers)
+        futures = {pool.submit(worker_func, shard): len(shard[0]) for shard in shards}
+        scanned = 0
+        for future in as_completed(futures):
+            merged.update(future.result())
+            scanned += futures[future]
+            if on_progress:
+                on_progress(scanned)
+            if should_cancel and should_cancel():
+                for pending in futures:
+                    pending.cancel()
+                return False
+        return True
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        # RuntimeError: pool sudah dimatikan karena diganti thread lain (jumlah worker berubah)
+        logger.error(f"Process pool gagal, kembali ke mode serial: {str(e)}")
+        if pool is not None:
+            _discard_pool(pool)
+        return False
+
+def parallel_exact(cv_paths: list[str], keywords: list[str], algorithm: str, workers: int, chunk_size: int, merged: dict,
+                   on_progress=None, should_cancel=None, existence_only: bool = False, use_store: bool = False) -> bool:
+    """
+    Exact matching paralel; hasil tiap shard digabung ke `merged` ({cv_path: {keyword: jumlah}}).
+    Jika `use_store`, worker membaca teks dari file korpus yang di-mmap (lihat core.corpus).
+    Return False jika dibatalkan atau pool gagal (pemanggil boleh kembali ke mode serial).
+    """
+    return _run_sharded(scan_exact_shard, cv_paths, (keywords, algorithm, existence_only, use_store), workers, chunk_size, merged, on_progress, should_cancel)
@@ -1,19 +1,93 @@
-import fitz  # PyMuPDF
 import re
 import os
+import sqlite3
+import threading
 import logging
 
-# Konfigurasi logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache')
+TEXT_CACHE_PATH = os.path.join(CACHE_DIR, 'cv_text_cache.sqlite3')
+
+class TextCache:
+    """
+    Cache persisten (SQLite) untuk teks hasil ekstraksi PDF.
+    Setiap entri menyimpan teks mentah (untuk Regex) dan teks 'flat' (untuk
+    pattern matching), dengan key path + mtime + ukuran file sehingga entri
+    otomatis dianggap usang ketika PDF berubah.
+    """
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._schema_ready = False
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Satu koneksi per thread (dan per proses, karena thread-local tidak ikut ter-fork dengan aman)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and getattr(self._local, 'pid', None) == os.getpid():
+            return conn
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS pdf_text (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                raw_text TEXT NOT NULL,
+                flat_text TEXT NOT NULL
+            )
+            """)
+            conn.commit()
+            self._schema_ready = True
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, absolute_path: str, mtime_ns: int, size: int):
+        """Mengembalikan (raw_text, flat_text) jika entri masih valid, atau None."""
+        row = self._get_connection().execute(
+            "SELECT mtime_ns, size, raw_text, flat_text FROM pdf_text WHERE path = ?",
+            (absolute_path,)
+        ).fetchone()
+        if row is None or row[0] != mtime_ns or row[1] != size:
+            return None
+        return row[2], row[3]
+
+    def put(self, absolute_path: str, mtime_ns: int, size: int, raw_text: str, flat_text: str):
+        """Menyimpan (atau mengganti) entri cache untuk sebuah file."""
+        conn = self._get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO pdf_text (path, mtime_ns, size, raw_text, flat_text) VALUES (?, ?, ?, ?, ?)",
+            (absolute_path, mtime_ns, size, raw_text, flat_text)
+        )
+        conn.commit()
+
+    def clear(self):
+        """Menghapus seluruh isi cache."""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM pdf_text")
+        conn.commit()
+
+_text_cache = None
+
+def get_text_cache():
+    """Mengembalikan instance tunggal TextCache, atau None jika cache dinonaktifkan."""
+    global _text_cache
+    if _text_cache is None and TEXT_CACHE_PATH:
+        _text_cache = TextCache(TEXT_CACHE_PATH)
+    return _text_cache
+
 def get_absolute_path(relative_path: str) -> str:
     """
     Mengkonversi path relatif menjadi path absolut.
     """
     try:
-        root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        absolute_path = os.path.join(root_dir, relative_path)
+        absolute_path = os.path.join(ROOT_DIR, relative_path)
         if not os.path.exists(absolute_path):
             logger.error(f"File tidak ditemukan: {absolute_path}")
             return ""
@@ -22,32 +96,77 @@ def get_absolute_path(relative_path: str) -> str:
         logger.error(f"Error dalam get_absolute_path: {str(e)}")
         return ""
 
-def extract_text_for_regex(pdf_path: str) -> str:
+def _read_pdf_text(absolute_path: str) -> str:
+    """Membaca seluruh halaman PDF menggunakan PyMuPDF."""
+    import fitz  # PyMuPDF; diimpor saat dibutuhkan karena import-nya mahal (~100 ms)
+    doc = fitz.open(absolute_path)
+    full_text = ""
+    for page in doc:
+        # Menggunakan get_text("text") adalah default dan mempertahankan format
+        full_text += page.get_text("text")
+    doc.close()
+    return full_text
+
+def flatten_text(raw_text: str) -> str:
+    """Mengubah teks mentah menjadi lowercase dengan whitespace tunggal."""
+    # 1. Ubah ke huruf kecil (lowercase)
+    text = raw_text.lower()
+    # 2. Ganti semua karakter whitespace (spasi, tab, newline) dengan satu spasi
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+def extract_texts(pdf_path: str) -> tuple[str, str]:
     """
-    Mengekstrak teks dari PDF dengan mempertahankan format asli (case dan newlines).
-    Cocok untuk digunakan dengan Regular Expressions.
+    Mengekstrak teks mentah dan teks 'flat' dari PDF sekaligus.
+    Hasil disimpan di TextCache sehingga PDF yang sama (dengan mtime dan ukuran
+    yang sama) tidak perlu di-parse ulang, termasuk setelah aplikasi di-restart.
 
     Args:
         pdf_path: Path menuju file PDF.
 
     Returns:
-        String teks dengan format asli.
+        Tuple (raw_text, flat_text). Keduanya string kosong jika gagal.
     """
     try:
         absolute_path = get_absolute_path(pdf_path)
         if not absolute_path:
-            return ""
-            
-        doc = fitz.open(absolute_path)
-        full_text = ""
-        for page in doc:
-            # Menggunakan get_text("text") adalah default dan mempertahankan format
-            full_text += page.get_text("text")
-        doc.close()
-        return full_text
+            return "", ""
+
+        stat = os.stat(absolute_path)
+        cache = get_text_cache()
+        if cache:
+            try:
+                cached = cache.get(absolute_path, stat.st_mtime_ns, stat.st_size)
+                if cached is not None:
+                    return cached
+            except sqlite3.Error as e:
+                logger.warning(f"Gagal membaca text cache untuk {pdf_path}: {str(e)}")
+
+        raw_text = _read_pdf_text(absolute_path)
+        flat_text = flatten_text(raw_text)
+
+        if cache:
+            try:
+                cache.put(absolute_path, stat.st_mtime_ns, stat.st_size, raw_text, flat_text)
+            except sqlite3.Error as e:
+                logger.warning(f"Gagal menulis text cache untuk {pdf_path}: {str(e)}")
+        return raw_text, flat_text
     except Exception as e:
-        logger.error(f"Error reading PDF for Regex {pdf_path}: {str(e)}")
-        return ""
+        logger.error(f"Error reading PDF {pdf_path}: {str(e)}")
+        return "", ""
+
+def extract_text_for_regex(pdf_path: str) -> str:
+    """
+    Mengekstrak teks dari PDF dengan mempertahankan format asli (case dan newlines).
+    Cocok untuk digunakan dengan Regular Expressions.
+
+    Args:
+        pdf_path: Path menuju file PDF.
+
+    Returns:
+        String teks dengan format asli.
+    """
+    return extract_texts(pdf_path)[0]
 
 def extract_text_for_pattern_matching(pdf_path: str) -> str:
     """
@@ -60,23 +179,10 @@ def extract_text_for_pattern_matching(pdf_path: str) -> str:
     Returns:
         String teks dalam format lowercase dan spasi tunggal.
     """
-    try:
-        # Kita bisa menggunakan fungsi pertama sebagai dasar
-        raw_text = extract_text_for_regex(pdf_path)
-        if not raw_text:
-            logger.warning(f"Tidak ada teks yang diekstrak dari {pdf_path}")
-            return ""
-        
-        # 1. Ubah ke huruf kecil (lowercase)
-        text = raw_text.lower()
-        
-        # 2. Ganti semua karakter whitespace (spasi, tab, newline) dengan satu spasi
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
-    except Exception as e:
-        logger.error(f"Error dalam extract_text_for_pattern_matching untuk {pdf_path}: {str(e)}")
-        return ""
+    text = extract_texts(pdf_path)[1]
+    if not text:
+        logger.warning(f"Tidak ada teks yang diekstrak dari {pdf_path}")
+    return text
 
 
 # if __name__ == '__main__':
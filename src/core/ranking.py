@@ -0,0 +1,122 @@
+# File: src/core/ranking.py
+
+import heapq
+
+def rank_key(result: dict) -> tuple:
+    """
+    Urutan peringkat: jumlah keyword yang cocok, lalu total kemunculan (keduanya menurun),
+    lalu id kandidat (menaik) agar urutan kandidat yang seri selalu sama.
+    """
+    return -result['match_count'], -sum(result['matched_keywords'].values()), result['id']
+
+def score_rank_key(result: dict) -> tuple:
+    """Urutan peringkat untuk skor relevansi (mis. BM25): skor menurun, lalu seperti rank_key."""
+    return (-result['score'],) + rank_key(result)
+
+def select_top(results, top_n: int, key=rank_key) -> list:
+    """top_n hasil terbaik menurut `key` (default rank_key), memakai heap berukuran top_n (tanpa mengurutkan semua hasil)."""
+    return heapq.nsmallest(max(top_n, 0), results, key=key)
+
+class TopNBound:
+    """
+    Batas atas skor akhir (match_count) setiap kandidat selama tahap exact matching,
+    untuk memangkas pekerjaan pada CV yang tidak mungkin masuk top-N.
+
+    Skor kandidat = jumlah keyword (gabungan seluruh CV miliknya) yang cocok exact,
+    ditambah hasil fuzzy untuk keyword yang tidak ditemukan exact di CV mana pun.
+    Untuk kandidat c, setiap keyword menyumbang paling banyak:
+    - 1 jika sudah ditemukan di CV milik c, atau masih ada CV milik c yang belum dipindai untuk keyword itu;
+    - jumlah CV milik c jika keyword belum ditemukan di CV mana pun (bisa menjadi hasil fuzzy per CV);
+    - 0 jika sudah dipindai di seluruh CV milik c tanpa hasil, padahal ditemukan di CV lain.
+    Kandidat yang batas atasnya < skor top-N saat ini (threshold, hanya bisa naik) tidak
+    mungkin masuk top-N, bahkan dengan tiebreak.
+    """
+    def __init__(self, all_candidates: list, keywords: list[str], top_n: int):
+        keywords = list(dict.fromkeys(keywords))
+        self.keywords = keywords
+        self.top_n = top_n
+        self.owners = {}         # {cv_path: [id kandidat]}
+        self.path_counts = {}    # {id kandidat: jumlah CV}
+        for candidate in all_candidates:
+            owners = self.owners.setdefault(candidate['cv_path'], [])
+            if candidate['id'] not in owners:
+                owners.append(candidate['id'])
+                self.path_counts[candidate['id']] = self.path_counts.get(candidate['id'], 0) + 1
+        # {id kandidat: {keyword: jumlah CV milik kandidat yang belum dipindai untuk keyword}}
+        self.unscanned = {candidate_id: dict.fromkeys(keywords, count) for candidate_id, count in self.path_counts.items()}
+        self.found = {candidate_id: set() for candidate_id in self.path_counts}
+        self.found_anywhere = set()
+        self.hopeless = set()
+        self.threshold = 0
+        # Histogram skor: score_counts[s] = jumlah kandidat dengan skor exact s saat ini
+        self.score_counts = [0] * (len(keywords) + 1)
+        self.score_counts[0] = len(self.path_counts)
+
+    def record(self, cv_path: str, keyword: str, found: bool):
+        """Mencatat hasil pemindaian satu keyword pada satu CV."""
+        if found:
+            self.found_anywhere.add(keyword)
+        for candidate_id in self.owners.get(cv_path, ()):
+            self.unscanned[candidate_id][keyword] -= 1
+            found_keywords = self.found[candidate_id]
+            if found and keyword not in found_keywords:
+                self.score_counts[len(found_keywords)] -= 1
+                found_keywords.add(keyword)
+                self.score_counts[len(found_keywords)] += 1
+
+    def finish_document(self):
+        """Memperbarui threshold (skor kandidat ke-top_n saat ini) setelah satu CV selesai dipindai."""
+        if self.top_n <= 0:
+            return
+        candidates = 0
+        for score in range(len(self.score_counts) - 1, 0, -1):
+            candidates += self.score_counts[score]
+            if candidates >= self.top_n:
+                self.threshold = score
+                return
+
+    def upper_bound(self, candidate_id) -> int:
+        found, unscanned = self.found[candidate_id], self.unscanned[candidate_id]
+        bound = 0
+        for keyword in self.keywords:
+            if keyword in found:
+                bound += 1
+            elif keyword not in self.found_anywhere:
+                bound += self.path_counts[candidate_id]
+            elif unscanned[keyword] > 0:
+                bound += 1
+        return bound
+
+    def is_hopeless(self, cv_path: str) -> bool:
+        """True jika tidak ada pemilik CV ini yang masih mungkin masuk top-N."""
+        if not self.threshold:
+            return False
+        for candidate_id in self.owners.get(cv_path, ()):
+            if candidate_id not in self.hopeless:
+                if self.upper_bound(candidate_id) >= self.threshold:
+                    return False
+                self.hopeless.add(candidate_id)
+        return True
+
+def fuzzy_scope(all_candidates: list, results: dict, unmatched_count: int, top_n: int) -> set:
+    """
+    cv_path yang masih perlu melalui fuzzy matching setelah tahap exact.
+    Fuzzy hanya menambah paling banyak `unmatched_count` keyword per CV, sehingga kandidat
+    dengan skor exact + unmatched_count * jumlah CV-nya < skor exact kandidat ke-top_n
+    tidak mungkin masuk top-N; CV miliknya dilewati.
+    """
+    cv_paths = {candidate['cv_path'] for candidate in all_candidates}
+    scores = [result['match_count'] for result in results.values()]
+    if top_n <= 0 or len(scores) < top_n:
+        return cv_paths
+    threshold = heapq.nlargest(top_n, scores)[-1]
+
+    paths_by_candidate = {}
+    for candidate in all_candidates:
+        paths_by_candidate.setdefault(candidate['id'], set()).add(candidate['cv_path'])
+    scope = set()
+    for candidate_id, paths in paths_by_candidate.items():
+        score = results[candidate_id]['match_count'] if candidate_id in results else 0
+        if score + unmatched_count * len(paths) >= threshold:
+            scope.update(paths)
+    return scope
@@ -4,6 +4,10 @@
 import re
 from collections import OrderedDict
 
+# Versi logika parsing. Naikkan setiap kali hasil extract_all_sections bisa berubah,
+# agar section yang tersimpan di database di-parse ulang.
+PARSER_VERSION = 1
+
 SECTION_KEYWORDS = {
     'summary': r'summary|profile|objective|about me|professional summary',
     'skills': r'skills|highlights|technical skills|core competencies|expertise|proficiencies',
@@ -12,28 +16,37 @@ SECTION_KEYWORDS = {
     'boundary': r'accomplishments|affiliations|interests|certifications|languages|awards|projects|publications|references'
 }
 
+# Pola heading: satu named group per section, sehingga section langsung diketahui dari match.lastgroup
+HEADING_PATTERN = re.compile(
+    r'^\s*(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_KEYWORDS.items()) + r')\b\s*:?',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Pola clean_text. Karakter non-ASCII diperlakukan seperti spasi horizontal (dulu diganti spasi lalu dirapikan).
+HYPHENATION_PATTERN = re.compile(r'(\w)-\n(\w)', re.ASCII)
+NEWLINE_SPACE_PATTERN = re.compile(r'[ \t\u0080-\U0010ffff]*\n[ \t\u0080-\U0010ffff]*')
+HORIZONTAL_SPACE_PATTERN = re.compile(r'[ \t\u0080-\U0010ffff]+')
+BULLET_PATTERN = re.compile(r'^\s*[•\-\*]\s*', re.MULTILINE)
+BLANK_LINES_PATTERN = re.compile(r'\n{2,}')
+
 def clean_text(text: str) -> str:
     if not text: return ""
-    text = re.sub(r'[^\x00-\x7F]+', ' ', text)
-    text = re.sub(r'[\u200b-\u200f\u202a-\u202e]', '', text)
-    text = re.sub(r'(\w)-\n(\w)', r'\1\2', text)
-    text = re.sub(r'[ \t]+', ' ', text)
-    text = re.sub(r' \n', '\n', text)
-    text = re.sub(r'\n ', '\n', text)
-    text = re.sub(r'^\s*[•\-\*]\s*', '', text, flags=re.MULTILINE)
-    text = re.sub(r'\n{2,}', '\n\n', text)
+    # Gabungkan kata yang terpotong tanda hubung di akhir baris (hanya huruf/angka ASCII)
+    text = HYPHENATION_PATTERN.sub(r'\1\2', text)
+    # Spasi/tab/non-ASCII di sekitar newline dibuang, sisanya dipadatkan menjadi satu spasi
+    text = NEWLINE_SPACE_PATTERN.sub('\n', text)
+    text = HORIZONTAL_SPACE_PATTERN.sub(' ', text)
+    text = BULLET_PATTERN.sub('', text)
+    text = BLANK_LINES_PATTERN.sub('\n\n', text)
     return text.strip()
 
 def extract_raw_sections(text: str) -> dict:
     cleaned_text = clean_text(text)
-    all_kw_pattern = '|'.join(SECTION_KEYWORDS.values())
-    title_pattern = re.compile(fr'^\s*({all_kw_pattern})\b\s*:?', re.IGNORECASE | re.MULTILINE)
-    matches = list(title_pattern.finditer(cleaned_text))
+    matches = list(HEADING_PATTERN.finditer(cleaned_text))
     sections = {}
     for i, match in enumerate(matches):
-        title_text = match.group(1).lower()
-        section_name = next((name for name, pattern in SECTION_KEYWORDS.items() if re.fullmatch(pattern, title_text, re.IGNORECASE)), None)
-        if section_name and section_name != 'boundary':
+        section_name = match.lastgroup
+        if section_name != 'boundary':
             content_start = match.end()
             content_end = matches[i + 1].start() if i + 1 < len(matches) else len(cleaned_text)
             content_block = cleaned_text[content_start:content_end].strip()
@@ -41,23 +54,41 @@ def extract_raw_sections(text: str) -> dict:
             sections[section_name].append(content_block)
     return sections
 
+SKILL_CONTINUATION_PATTERN = re.compile(r'\n(?![A-Z•*-])')
+SKILL_SEPARATOR_PATTERN = re.compile(r',\s*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 def parse_skills(text_blocks: list) -> list:
     if not text_blocks: return []
     full_text = '\n'.join(text_blocks)
-    processed_text = re.sub(r'\n(?![A-Z•*-])', ' ', full_text)
+    processed_text = SKILL_CONTINUATION_PATTERN.sub(' ', full_text)
     all_skills = []
     lines = processed_text.split('\n')
     for line in lines:
         line = line.strip()
         if not line: continue
         if ':' in line:
-            all_skills.append(re.sub(r'\s+', ' ', line).strip())
+            all_skills.append(WHITESPACE_PATTERN.sub(' ', line).strip())
         else:
-            sub_skills = re.split(r',\s*', line)
+            sub_skills = SKILL_SEPARATOR_PATTERN.split(line)
             all_skills.extend([skill.strip() for skill in sub_skills if skill.strip()])
     cleaned_skills = [skill.strip(' .,') for skill in all_skills if len(skill.strip(' .,')) > 1]
     return list(OrderedDict.fromkeys(cleaned_skills))
 
+# Prefilter linear: syarat perlu agar pola tanggal di bawahnya bisa cocok. Pola lengkap
+# (yang backtracking-nya mahal pada kata panjang) hanya dijalankan jika prefilter cocok.
+SPLIT_DATE_RANGE_PREFILTER = re.compile(r'\d{4}\s*\n\s*to\s*\n', re.IGNORECASE)
+DATE_RANGE_PREFILTER = re.compile(r'\d{4}\s*to', re.IGNORECASE)
+SPLIT_DATE_RANGE_PATTERN = re.compile(
+    r'([A-Za-z]+\s+\d{4})\s*\n\s*to\s*\n\s*([A-Za-z]+\s+\d{4}|Present|Current)',
+    re.IGNORECASE
+)
+# Pola tanggal yang fleksibel untuk mencari jangkar
+DATE_RANGE_PATTERN = re.compile(
+    r'((?:\d{2}/\d{4}|[A-Za-z]+\s+\d{4})\s*to\s*(?:\d{2}/\d{4}|[A-Za-z]+\s+\d{4}|Present|Current))',
+    re.IGNORECASE
+)
+
 def parse_experience(text: str) -> list:
     """
     Parser experience universal dengan pendekatan dua tahap yang fleksibel.
@@ -67,23 +98,13 @@ def parse_experience(text: str) -> list:
 
     # Tahap 1: Normalisasi Tanggal. Gabungkan tanggal yang terpisah oleh newline.
     # Contoh: "January 2004\nto\nJanuary 2012" -> "January 2004 to January 2012"
-    text = re.sub(
-        r'([A-Za-z]+\s+\d{4})\s*\n\s*to\s*\n\s*([A-Za-z]+\s+\d{4}|Present|Current)',
-        r'\1 to \2',
-        text,
-        flags=re.IGNORECASE
-    )
+    if SPLIT_DATE_RANGE_PREFILTER.search(text):
+        text = SPLIT_DATE_RANGE_PATTERN.sub(r'\1 to \2', text)
 
     # Tahap 2: Parsing dengan "Jangkar Tanggal"
     experiences = []
     current_experience = None
     
-    # Pola tanggal yang fleksibel untuk mencari jangkar
-    date_pattern = re.compile(
-        r'((?:\d{2}/\d{4}|[A-Za-z]+\s+\d{4})\s*to\s*(?:\d{2}/\d{4}|[A-Za-z]+\s+\d{4}|Present|Current))',
-        re.IGNORECASE
-    )
-
     lines = text.strip().split('\n')
 
     for line in lines:
@@ -91,7 +112,7 @@ def parse_experience(text: str) -> list:
         if not line:
             continue
 
-        date_match = date_pattern.search(line)
+        date_match = DATE_RANGE_PATTERN.search(line) if DATE_RANGE_PREFILTER.search(line) else None
 
         # Jika sebuah baris mengandung pola tanggal, anggap itu awal entri baru.
         if date_match:
@@ -129,6 +150,18 @@ def parse_experience(text: str) -> list:
 
     return experiences
 
+# Daftar kata kunci untuk membantu identifikasi (urutan = prioritas)
+DEGREE_KEYWORDS = ['Associate', 'Associates', 'Bachelors', 'Certificate', 'Diploma']
+INSTITUTION_KEYWORDS = ['College', 'School', 'University']
+DEGREE_PATTERNS = [re.compile(fr'({keyword}[A-Za-z\s:]*)', re.IGNORECASE) for keyword in DEGREE_KEYWORDS]
+# Pasangan (prefilter keyword saja, pola lengkap): pola lengkap diawali kelas karakter sehingga
+# mahal dicoba dari setiap posisi, jadi hanya dijalankan pada baris yang memuat keyword-nya.
+INSTITUTION_PATTERNS = [
+    (re.compile(keyword, re.IGNORECASE), re.compile(fr'([A-Za-z\s,]*{keyword}[A-Za-z\s,]*)', re.IGNORECASE))
+    for keyword in INSTITUTION_KEYWORDS
+]
+YEAR_PATTERN = re.compile(r'\b((19|20)\d{2})\b')
+
 def parse_education(text: str) -> list:
     """
     Parser pendidikan yang ditulis ulang untuk menangani format kompleks dan beragam.
@@ -136,10 +169,6 @@ def parse_education(text: str) -> list:
     if not text:
         return []
 
-    # Daftar kata kunci untuk membantu identifikasi
-    degree_keywords = ['Associate', 'Associates', 'Bachelors', 'Certificate', 'Diploma']
-    institution_keywords = ['College', 'School', 'University']
-    
     parsed_entries = []
     lines = text.strip().split('\n')
 
@@ -151,23 +180,23 @@ def parse_education(text: str) -> list:
         year, degree, institution, description = 'N/A', 'N/A', 'N/A', ''
 
         # 1. Cari tahun terlebih dahulu
-        year_match = re.search(r'\b((19|20)\d{2})\b', line)
+        year_match = YEAR_PATTERN.search(line)
         if year_match:
             year = year_match.group(0)
 
         # 2. Cari gelar & institusi berdasarkan kata kunci
         found_institution = ""
-        for keyword in institution_keywords:
+        for prefilter, pattern in INSTITUTION_PATTERNS:
             # Cari institusi yang mengandung keyword, contoh "Northern Maine Community College"
-            match = re.search(fr'([A-Za-z\s,]*{keyword}[A-Za-z\s,]*)', line, re.IGNORECASE)
+            match = pattern.search(line) if prefilter.search(line) else None
             if match:
                 found_institution = match.group(1).strip()
                 break
         
         found_degree = ""
-        for keyword in degree_keywords:
+        for pattern in DEGREE_PATTERNS:
             # Cari gelar yang mengandung keyword, contoh "Associate: Accounting"
-            match = re.search(fr'({keyword}[A-Za-z\s:]*)', line, re.IGNORECASE)
+            match = pattern.search(line)
             if match:
                 found_degree = match.group(1).strip()
                 break
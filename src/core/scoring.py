@@ -0,0 +1,128 @@
+# File: src/core/scoring.py
+
+import os
+import json
+import math
+import logging
+import threading
+
+from core.pdf_parser import CACHE_DIR
+from core.cv_document import get_document
+from core.inverted_index import get_file_fingerprint, tokenize
+
+logger = logging.getLogger(__name__)
+
+SCORING_METHODS = ['MATCH_COUNT', 'BM25']
+STATS_PATH = os.path.join(CACHE_DIR, 'cv_document_stats.json')
+STATS_FORMAT_VERSION = 1
+
+# Parameter BM25 standar: K1 = saturasi frekuensi term, B = normalisasi panjang dokumen
+K1 = 1.2
+B = 0.75
+
+class DocumentStats:
+    """
+    Panjang setiap CV (jumlah token, tokenisasi sama dengan inverted index), disimpan di disk
+    dengan key path + fingerprint (mtime, ukuran) sehingga cukup dihitung sekali per versi file.
+    File ini kecil (satu angka per CV), jauh lebih murah dimuat daripada inverted index.
+    """
+    def __init__(self):
+        self.documents = {}  # {cv_path: [mtime_ns, size, jumlah_token]}
+
+    @classmethod
+    def load(cls, path: str = STATS_PATH):
+        """Memuat statistik dari disk. Mengembalikan statistik kosong jika file tidak ada atau tidak valid."""
+        stats = cls()
+        if not os.path.exists(path):
+            return stats
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == STATS_FORMAT_VERSION:
+                stats.documents = data['documents']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Gagal memuat statistik dokumen dari {path}: {str(e)}")
+        return stats
+
+    def save(self, path: str = STATS_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATS_FORMAT_VERSION, 'documents': self.documents}, f)
+        os.replace(tmp_path, path)
+
+    def update(self, cv_paths: list[str], documents: dict) -> int:
+        """
+        Menghitung panjang CV yang belum ada atau sudah berubah (teks diambil dari `documents`).
+        Return: jumlah CV yang dihitung ulang.
+        """
+        updated = 0
+        for cv_path in cv_paths:
+            fingerprint = get_file_fingerprint(cv_path)
+            if fingerprint is None:
+                continue
+            entry = self.documents.get(cv_path)
+            if entry is not None and (entry[0], entry[1]) == fingerprint:
+                continue
+            length = len(tokenize(get_document(documents, cv_path).flat_text))
+            if not length:
+                # Ekstraksi gagal: tidak dicatat agar tidak menggeser panjang rata-rata dan dicoba lagi nanti
+                continue
+            self.documents[cv_path] = [fingerprint[0], fingerprint[1], length]
+            updated += 1
+        return updated
+
+    def lengths(self, cv_paths: list[str]) -> dict:
+        """{cv_path: jumlah_token} untuk CV yang statistiknya tersedia."""
+        return {cv_path: self.documents[cv_path][2] for cv_path in cv_paths if cv_path in self.documents}
+
+_stats_instance = None
+_stats_lock = threading.Lock()
+
+def get_document_lengths(cv_paths: list[str], documents: dict) -> dict:
+    """
+    Panjang (jumlah token) setiap CV di `cv_paths`. Statistik dimuat dari disk sekali per proses;
+    CV yang baru atau berubah dihitung lalu disimpan kembali.
+    """
+    global _stats_instance
+    with _stats_lock:
+        if _stats_instance is None:
+            _stats_instance = DocumentStats.load()
+        if _stats_instance.update(cv_paths, documents):
+            try:
+                _stats_instance.save()
+            except OSError as e:
+                logger.warning(f"Gagal menyimpan statistik dokumen: {str(e)}")
+        return _stats_instance.lengths(cv_paths)
+
+def bm25_scores(hits: dict, doc_lengths: dict, total_documents: int, k1: float = K1, b: float = B) -> dict:
+    """
+    Skor BM25 setiap CV dari hasil matching.
+
+    Args:
+        hits: {cv_path: {term: frekuensi}} (hanya CV yang cocok); df sebuah term = jumlah CV di `hits` yang memuatnya.
+        doc_lengths: {cv_path: jumlah_token} untuk seluruh CV yang dipindai (untuk panjang rata-rata).
+        total_documents: jumlah CV yang dipindai (N).
+
+    Returns:
+        dict dalam format {cv_path: skor}. Biayanya sebanding dengan jumlah hit.
+    """
+    document_frequency = {}
+    for matches in hits.values():
+        for term in matches:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+    idf = {
+        term: math.log(1 + (total_documents - df + 0.5) / (df + 0.5))
+        for term, df in document_frequency.items()
+    }
+    average_length = sum(doc_lengths.values()) / len(doc_lengths) if doc_lengths else 0
+
+    scores = {}
+    for cv_path, matches in hits.items():
+        length = doc_lengths.get(cv_path, average_length)
+        normalizer = k1 * (1 - b + b * length / average_length) if average_length else k1
+        scores[cv_path] = sum(
+            idf[term] * frequency * (k1 + 1) / (frequency + normalizer)
+            for term, frequency in matches.items()
+        )
+    return scores
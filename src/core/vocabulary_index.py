@@ -0,0 +1,204 @@
+# File: src/core/vocabulary_index.py
+
+import os
+import pickle
+import logging
+import threading
+
+from core.pdf_parser import CACHE_DIR, extract_texts
+from core.levenshtein import levenshtein_distance_bounded
+from core.inverted_index import get_file_fingerprint, list_cv_paths
+
+logger = logging.getLogger(__name__)
+
+VOCABULARY_PATH = os.path.join(CACHE_DIR, 'cv_vocabulary.pickle')
+VOCABULARY_FORMAT_VERSION = 1
+
+class BKTree:
+    """
+    BK-tree (Burkhard-Keller) atas jarak Levenshtein.
+    Setiap node menyimpan kata dan anak-anaknya dikelompokkan berdasarkan jarak,
+    sehingga pencarian kata dalam radius tertentu cukup mengunjungi sebagian kecil pohon.
+    """
+    __slots__ = ('root', 'size')
+
+    def __init__(self):
+        self.root = None  # [kata, {jarak: node_anak}]
+        self.size = 0
+
+    def add(self, word: str):
+        """Menambahkan sebuah kata (kata yang sudah ada diabaikan)."""
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            dist = levenshtein_distance_bounded(word, node[0])
+            if dist == 0:
+                return
+            child = node[1].get(dist)
+            if child is None:
+                node[1][dist] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list:
+        """Mengembalikan semua (kata, jarak) dengan jarak <= max_distance."""
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            # Jarak hanya perlu eksak sampai (jarak anak terbesar + k): di atas itu tidak ada anak yang
+            # dikunjungi, dan levenshtein_distance_bounded mengembalikan bound + 1 yang memberi hasil sama
+            dist = levenshtein_distance_bounded(word, node_word, max(children, default=0) + max_distance)
+            if dist <= max_distance:
+                found.append((node_word, dist))
+            # Ketaksamaan segitiga: hanya anak dengan jarak di [dist - k, dist + k] yang mungkin cocok
+            for child_dist in range(max(1, dist - max_distance), dist + max_distance + 1):
+                child = children.get(child_dist)
+                if child is not None:
+                    stack.append(child)
+        return found
+
+class VocabularyIndex:
+    """
+    Kosakata global seluruh CV yang pernah dipindai: kata -> himpunan cv_path,
+    diindeks dengan BK-tree. Tetangga sebuah keyword (jarak <= threshold) dicari
+    sekali untuk seluruh korpus, lalu disebar ke CV lewat posting list.
+    Seluruh method publik dilindungi lock agar aman dipakai beberapa thread sekaligus.
+    Membangun BK-tree (satu perhitungan Levenshtein per level untuk setiap kata baru) adalah
+    bagian termahal, sehingga kosakata disimpan ke disk dan hanya CV baru/berubah yang ditambahkan.
+    """
+    def __init__(self):
+        self.postings = {}   # {kata: set(cv_path)}
+        self.documents = {}  # {cv_path: (mtime_ns, size)}
+        self.tree = BKTree()
+        self._lock = threading.RLock()
+
+    def add_document(self, cv_path: str, words, fingerprint: tuple = None):
+        """Menambahkan (atau mengganti) kata-kata sebuah CV ke kosakata."""
+        with self._lock:
+            if cv_path in self.documents:
+                self.remove_document(cv_path)
+            for word in words:
+                cv_paths = self.postings.get(word)
+                if cv_paths is None:
+                    cv_paths = self.postings[word] = set()
+                    self.tree.add(word)
+                cv_paths.add(cv_path)
+            self.documents[cv_path] = fingerprint
+
+    def remove_document(self, cv_path: str):
+        """Menghapus sebuah CV dari posting list (kata tetap di BK-tree, tanpa posting)."""
+        with self._lock:
+            if cv_path not in self.documents:
+                return
+            del self.documents[cv_path]
+            for cv_paths in self.postings.values():
+                cv_paths.discard(cv_path)
+
+    def update_document(self, cv_path: str, load_words) -> bool:
+        """
+        Memastikan CV ada di kosakata dan up-to-date.
+        `load_words` dipanggil (tanpa argumen) hanya jika CV perlu diindeks ulang.
+        Return: True jika CV diindeks ulang.
+        """
+        fingerprint = get_file_fingerprint(cv_path)
+        if self.documents.get(cv_path, False) == fingerprint:
+            return False
+        # Kata-kata dimuat di luar lock (decode PDF bisa lama), lalu dimasukkan di dalam lock
+        words = load_words() if fingerprint else ()
+        if fingerprint and not words:
+            # Ekstraksi gagal: entri dibiarkan stale agar dicoba lagi pada update berikutnya
+            return False
+        self.add_document(cv_path, words, fingerprint)
+        return True
+
+    def save(self, path: str = VOCABULARY_PATH):
+        """Menyimpan kosakata (posting list dan BK-tree) ke disk."""
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                state = (VOCABULARY_FORMAT_VERSION, self.documents, self.postings, self.tree.root, self.tree.size)
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = VOCABULARY_PATH):
+        """Memuat kosakata dari disk. Mengembalikan kosakata kosong jika file tidak ada atau tidak valid."""
+        vocabulary = cls()
+        if not os.path.exists(path):
+            return vocabulary
+        try:
+            with open(path, 'rb') as f:
+                version, documents, postings, root, size = pickle.load(f)
+            if version == VOCABULARY_FORMAT_VERSION:
+                vocabulary.documents, vocabulary.postings = documents, postings
+                vocabulary.tree.root, vocabulary.tree.size = root, size
+        except Exception as e:
+            logger.warning(f"Gagal memuat kosakata dari {path}: {str(e)}")
+        return vocabulary
+
+    def neighbors(self, keyword: str, max_distance: int) -> list:
+        """Kata-kata korpus dengan 0 < jarak <= max_distance, terurut (jarak, kata)."""
+        with self._lock:
+            found = [(dist, word) for word, dist in self.tree.search(keyword, max_distance) if dist > 0 and self.postings.get(word)]
+        found.sort()
+        return [(word, dist) for dist, word in found]
+
+    def fuzzy_matches(self, keywords: list[str], max_distance: int, scope=None) -> dict:
+        """
+        Fuzzy matching seluruh keyword terhadap kosakata.
+        Untuk setiap CV dan keyword, dipilih kata terdekat (jarak terkecil, lalu leksikografis).
+
+        Args:
+            scope: Opsional, himpunan cv_path yang diperhitungkan.
+
+        Returns:
+            dict dalam format {cv_path: {keyword: kata_mirip}}
+        """
+        results = {}
+        with self._lock:
+            for keyword in keywords:
+                assigned = set()
+                for word, _ in self.neighbors(keyword, max_distance):
+                    for cv_path in self.postings[word]:
+                        if cv_path in assigned or (scope is not None and cv_path not in scope):
+                            continue
+                        assigned.add(cv_path)
+                        results.setdefault(cv_path, {})[keyword] = word
+        return results
+
+_vocabulary_instance = None
+_vocabulary_lock = threading.Lock()
+
+def get_vocabulary_index() -> VocabularyIndex:
+    """Mengembalikan instance tunggal VocabularyIndex (dimuat dari disk sekali, hidup selama proses berjalan)."""
+    global _vocabulary_instance
+    with _vocabulary_lock:
+        if _vocabulary_instance is None:
+            _vocabulary_instance = VocabularyIndex.load()
+    return _vocabulary_instance
+
+def build_vocabulary(data_dir: str = 'data', path: str = VOCABULARY_PATH) -> VocabularyIndex:
+    """Membangun (atau memperbarui) kosakata seluruh PDF di `data_dir` lalu menyimpannya."""
+    vocabulary = VocabularyIndex.load(path)
+    cv_paths = list_cv_paths(data_dir)
+    for cv_path in set(vocabulary.documents) - set(cv_paths):
+        vocabulary.remove_document(cv_path)
+    updated = sum(vocabulary.update_document(cv_path, lambda: set(extract_texts(cv_path)[1].split())) for cv_path in cv_paths)
+    vocabulary.save(path)
+    logger.info(f"Kosakata berisi {len(vocabulary.documents)} CV ({updated} diperbarui), {vocabulary.tree.size} kata.")
+    return vocabulary
+
+
+if __name__ == '__main__':
+    # Jalankan dari direktori src: python -m core.vocabulary_index [data_dir]
+    import sys
+    logging.basicConfig(level=logging.INFO)
+    build_vocabulary(sys.argv[1] if len(sys.argv) > 1 else 'data')
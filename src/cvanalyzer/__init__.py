@@ -0,0 +1,13 @@
+# File: src/cvanalyzer/__init__.py
+"""
+Entry point headless CV Analyzer (tanpa GUI).
+
+Library:
+    from cvanalyzer.api import search, search_batch
+    result = search(['python', 'sql'], algorithm='AHO-CORASICK', top_n=5)
+
+CLI (dari direktori src):
+    python -m cvanalyzer search -k python,sql --algorithm KMP --top 5 --format csv
+    python -m cvanalyzer search --queries queries.txt --output hasil.json
+    python -m cvanalyzer serve --port 8765
+"""
@@ -0,0 +1,8 @@
+# File: src/cvanalyzer/__main__.py
+# Jalankan dari direktori src: python -m cvanalyzer search ...
+
+import sys
+from cvanalyzer.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# File: src/cvanalyzer/api.py
+
+import os
+import json
+
+from db.operations import DEFAULT_LIMIT_PER_CATEGORY, search_cvs
+from core.scoring import SCORING_METHODS
+
+ALGORITHMS = ['KMP', 'BM', 'AHO-CORASICK', 'INDEX', 'CORPUS']
+DEFAULT_ALGORITHM = 'KMP'
+DEFAULT_TOP_N = 10
+DEFAULT_SCORING = 'MATCH_COUNT'
+
+def parse_limit(value):
+    """Batas CV per kategori: bilangan positif, atau None / 'all' untuk seluruh CV."""
+    if value is None or (isinstance(value, str) and value.strip().lower() == 'all'):
+        return None
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Batas CV per kategori '{value}' tidak valid (bilangan positif atau 'all').")
+    if limit <= 0:
+        raise ValueError(f"Batas CV per kategori harus positif (atau 'all'), bukan {limit}.")
+    return limit
+
+def parse_top_n(value) -> int:
+    """Jumlah hasil teratas: bilangan bulat (atau string angka)."""
+    try:
+        if isinstance(value, bool):
+            raise TypeError
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Jumlah hasil '{value}' tidak valid (harus berupa angka).")
+
+def _parse_items(value, name: str) -> list:
+    """List string dari string dipisah koma atau list/tuple string; tipe lain ditolak dengan ValueError."""
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, (list, tuple)) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{name} harus berupa string dipisah koma atau list string.")
+    return [item.strip() for item in value if item.strip()]
+
+def make_query(keywords, algorithm: str = DEFAULT_ALGORITHM, top_n: int = DEFAULT_TOP_N, categories=None,
+               scoring: str = DEFAULT_SCORING, limit_per_category=DEFAULT_LIMIT_PER_CATEGORY) -> dict:
+    """
+    Menormalisasi sebuah query menjadi dict {'keywords', 'algorithm', 'top_n', 'categories', 'scoring',
+    'limit_per_category'}. `keywords` dan `categories` boleh berupa list atau string dipisah koma.
+    Scope pencarian = `categories` (None = semua kategori) x `limit_per_category` (None/'all' = semua CV).
+    """
+    keywords = _parse_items(keywords, "Keyword")
+    categories = [category.upper() for category in _parse_items(categories or [], "Kategori")] or None
+    if not isinstance(algorithm or '', str) or not isinstance(scoring or '', str):
+        raise ValueError("Algoritma dan metode skor harus berupa string.")
+    algorithm = (algorithm or DEFAULT_ALGORITHM).upper()
+    scoring = (scoring or DEFAULT_SCORING).upper().replace('-', '_')
+    if not keywords:
+        raise ValueError("Query tidak memiliki keyword.")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algoritma '{algorithm}' tidak dikenal (pilih {', '.join(ALGORITHMS)}).")
+    if scoring not in SCORING_METHODS:
+        raise ValueError(f"Metode skor '{scoring}' tidak dikenal (pilih {', '.join(SCORING_METHODS)}).")
+    return {
+        'keywords': keywords, 'algorithm': algorithm, 'top_n': parse_top_n(top_n), 'categories': categories,
+        'scoring': scoring, 'limit_per_category': parse_limit(limit_per_category)
+    }
+
+def search(keywords, algorithm: str = DEFAULT_ALGORITHM, top_n: int = DEFAULT_TOP_N, categories=None, documents: dict = None,
+           scoring: str = DEFAULT_SCORING, limit_per_category=DEFAULT_LIMIT_PER_CATEGORY) -> dict:
+    """
+    Menjalankan satu pencarian. Hasilnya sama dengan search_cvs ditambah key 'query'.
+    `documents` (dict) dapat dipakai ulang antar pemanggilan agar teks CV tidak dimuat ulang.
+    """
+    query = make_query(keywords, algorithm, top_n, categories, scoring, limit_per_category)
+    result = search_cvs(query['keywords'], query['algorithm'], query['top_n'], categories=query['categories'], documents=documents,
+                        scoring=query['scoring'], limit_per_category=query['limit_per_category'])
+    result['query'] = query
+    return result
+
+def search_batch(queries, documents: dict = None):
+    """
+    Menjalankan banyak query secara berurutan dengan satu penyimpanan dokumen bersama,
+    sehingga setiap CV cukup dimuat sekali untuk seluruh batch.
+    Generator: menghasilkan hasil search() untuk setiap query (dict dari make_query).
+    """
+    if documents is None:
+        documents = {}
+    for query in queries:
+        yield search(query['keywords'], query['algorithm'], query['top_n'], query['categories'], documents=documents,
+                     scoring=query.get('scoring', DEFAULT_SCORING),
+                     limit_per_category=query.get('limit_per_category', DEFAULT_LIMIT_PER_CATEGORY))
+
+def load_queries(path: str, algorithm: str = DEFAULT_ALGORITHM, top_n: int = DEFAULT_TOP_N, categories=None,
+                 scoring: str = DEFAULT_SCORING, limit_per_category=DEFAULT_LIMIT_PER_CATEGORY) -> list[dict]:
+    """
+    Membaca file query. Format yang didukung:
+    - .json: list berisi object query atau list keyword
+    - selain itu, satu query per baris: object JSON ({"keywords": [...], "algorithm": ..., "top_n": ...,
+      "categories": [...], "scoring": ..., "limit_per_category": ...}) atau keyword dipisah koma. Baris kosong
+      dan baris berawalan '#' diabaikan.
+    Nilai yang tidak disebut di query memakai nilai argumen dengan nama yang sama.
+    """
+    def parse(entry):
+        if isinstance(entry, dict):
+            return make_query(
+                entry.get('keywords', []), entry.get('algorithm', algorithm),
+                entry.get('top_n', top_n), entry.get('categories', categories), entry.get('scoring', scoring),
+                entry.get('limit_per_category', limit_per_category)
+            )
+        return make_query(entry, algorithm, top_n, categories, scoring, limit_per_category)
+
+    with open(path, encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() == '.json':
+            return [parse(entry) for entry in json.load(f)]
+        queries = []
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            queries.append(parse(json.loads(line) if line.startswith('{') else line))
+        return queries
@@ -0,0 +1,146 @@
+# File: src/cvanalyzer/cli.py
+
+import sys
+import csv
+import json
+import time
+import logging
+import argparse
+import contextlib
+
+OUTPUT_FORMATS = ['json', 'jsonl', 'csv']
+CSV_COLUMNS = ['query', 'keywords', 'algorithm', 'rank', 'id', 'name', 'cv_path', 'match_count', 'score', 'matched_keywords']
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m cvanalyzer', description="CV Analyzer tanpa GUI.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    search = subparsers.add_parser('search', help="Cari CV berdasarkan keyword (satu query atau batch dari file).")
+    source = search.add_mutually_exclusive_group(required=True)
+    source.add_argument('-k', '--keywords', help="Keyword dipisah koma, mis. 'python,sql,react'")
+    source.add_argument('-q', '--queries', help="File query (.json, atau satu query per baris: keyword dipisah koma / object JSON)")
+    search.add_argument('-a', '--algorithm', default='KMP', help="KMP, BM, AHO-CORASICK, INDEX (kata utuh), atau CORPUS (default: KMP)")
+    search.add_argument('-n', '--top', type=int, default=10, help="Jumlah hasil teratas per query (default: 10)")
+    search.add_argument('-s', '--scoring', default='MATCH_COUNT',
+                        help="Peringkat: MATCH_COUNT (jumlah keyword cocok) atau BM25 (default: MATCH_COUNT)")
+    search.add_argument('-c', '--category', action='append', default=None,
+                        help="Batasi ke kategori tertentu (boleh diulang atau dipisah koma)")
+    limit = search.add_mutually_exclusive_group()
+    limit.add_argument('-l', '--limit', default=None,
+                       help="Jumlah CV per kategori yang dipindai, atau 'all' (default: 20)")
+    limit.add_argument('--all', action='store_true',
+                       help="Pindai seluruh CV yang terdaftar di database (sama dengan --limit all)")
+    search.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='json', help="Format output (default: json)")
+    search.add_argument('-o', '--output', default=None, help="File output (default: stdout)")
+
+    serve = subparsers.add_parser('serve', help="Jalankan layanan HTTP lokal (GET /search, GET /summary/{id}).")
+    serve.add_argument('--host', default='127.0.0.1', help="Alamat bind (default: 127.0.0.1)")
+    serve.add_argument('--port', type=int, default=8765, help="Port (default: 8765)")
+    serve.add_argument('--workers', type=int, default=4, help="Jumlah thread untuk pekerjaan pencarian (default: 4)")
+    serve.add_argument('--no-warm', action='store_true', help="Jangan memuat seluruh CV ke memori saat start")
+    return parser
+
+def _result_record(index: int, result: dict) -> dict:
+    """Hasil satu query dalam bentuk yang bisa di-serialize ke JSON."""
+    return {
+        'query': index,
+        'keywords': result['query']['keywords'],
+        'algorithm': result['query']['algorithm'],
+        'scoring': result['query']['scoring'],
+        'top_n': result['query']['top_n'],
+        'categories': result['query']['categories'],
+        'limit_per_category': result['query']['limit_per_category'],
+        'total_scanned': result['total_scanned'],
+        'execution_time_exact': result['execution_time_exact'],
+        'execution_time_fuzzy': result['execution_time_fuzzy'],
+        'failed_files': result.get('failed_files', []),
+        'results': result['data'],
+    }
+
+def _csv_rows(record: dict):
+    for rank, candidate in enumerate(record['results'], start=1):
+        yield {
+            'query': record['query'],
+            'keywords': ','.join(record['keywords']),
+            'algorithm': record['algorithm'],
+            'rank': rank,
+            'id': candidate['id'],
+            'name': candidate.get('name', ''),
+            'cv_path': candidate['cv_path'],
+            'match_count': candidate['match_count'],
+            'score': candidate.get('score', ''),
+            'matched_keywords': ';'.join(f"{keyword}:{count}" for keyword, count in candidate['matched_keywords'].items()),
+        }
+
+def _write_results(records, output_format: str, stream):
+    """Menulis hasil secara bertahap (jsonl/csv per query; json sebagai satu array di akhir)."""
+    if output_format == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        for record in records:
+            writer.writerows(_csv_rows(record))
+    elif output_format == 'jsonl':
+        for record in records:
+            stream.write(json.dumps(record, default=str) + '\n')
+    else:
+        json.dump(list(records), stream, indent=2, default=str)
+        stream.write('\n')
+
+def run_search(args, stream) -> int:
+    # Modul pencarian diimpor di sini: print/log dari DB dan parser dialihkan ke stderr oleh main()
+    from cvanalyzer.api import load_queries, make_query, search_batch
+    from db.operations import DEFAULT_LIMIT_PER_CATEGORY, close_db_connection
+
+    categories = None
+    if args.category:
+        categories = [category for value in args.category for category in value.split(',')]
+    limit = 'all' if args.all else args.limit if args.limit is not None else DEFAULT_LIMIT_PER_CATEGORY
+    try:
+        if args.queries:
+            queries = load_queries(args.queries, args.algorithm, args.top, categories, args.scoring, limit)
+        else:
+            queries = [make_query(args.keywords, args.algorithm, args.top, categories, args.scoring, limit)]
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    start_time = time.time()
+    documents = {}  # Dipakai bersama oleh seluruh query di batch
+    records = (_result_record(index, result) for index, result in enumerate(search_batch(queries, documents), start=1))
+    try:
+        _write_results(records, args.format, stream)
+    finally:
+        close_db_connection()
+    elapsed = time.time() - start_time
+    print(f"{len(queries)} query selesai dalam {elapsed:.2f} detik ({len(documents)} CV dimuat).", file=sys.stderr)
+    return 0
+
+def run_serve(args) -> int:
+    import asyncio
+    from cvanalyzer.server import serve
+    from db.operations import close_db_connection
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, warm=not args.no_warm))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        close_db_connection()
+    return 0
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    if args.command == 'serve':
+        return run_serve(args)
+    stdout = sys.stdout
+    output_file = open(args.output, 'w', encoding='utf-8', newline='') if args.output else None
+    try:
+        # Semua print selain hasil (status DB, peringatan library) dikirim ke stderr agar output tetap valid
+        with contextlib.redirect_stdout(sys.stderr):
+            if args.command == 'search':
+                return run_search(args, output_file or stdout)
+    finally:
+        if output_file:
+            output_file.close()
+    return 1
@@ -0,0 +1,203 @@
+# File: src/cvanalyzer/server.py
+
+import sys
+import json
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from cvanalyzer.api import DEFAULT_ALGORITHM, DEFAULT_SCORING, DEFAULT_TOP_N, make_query
+from db.operations import CATEGORIES, DEFAULT_LIMIT_PER_CATEGORY, fetch_dataset_by_category, get_applicant_summary, search_cvs
+from core.cv_document import get_document
+from core.vocabulary_index import get_vocabulary_index
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BODY_SIZE = 1 << 20  # Batas ukuran body request (1 MB)
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class SearchService:
+    """
+    Layanan pencarian yang hidup lama. Teks CV (CVDocument: teks mentah, teks flat, himpunan
+    kata) disimpan di memori dan dipakai bersama oleh seluruh request, begitu pula automaton
+    Aho-Corasick (LRU cache), kosakata fuzzy, dan inverted index yang merupakan singleton proses.
+    Pekerjaan CPU dijalankan di thread pool agar event loop tetap melayani request lain.
+    """
+    def __init__(self, workers: int = 4):
+        self.documents = {}     # {cv_path: CVDocument}, dipakai bersama seluruh request
+        self.known_paths = {}   # {applicant_id: cv_path} dari hasil pencarian, untuk /summary/{id}
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cvanalyzer')
+        self.started_at = time.time()
+        self.request_count = 0
+
+    def warm_up(self, categories: list[str] = None, limit_per_category: int = DEFAULT_LIMIT_PER_CATEGORY):
+        """
+        Memuat teks dan himpunan kata seluruh CV kandidat (scope `categories` x `limit_per_category`)
+        serta kosakata fuzzy ke memori sebelum melayani request.
+        """
+        start_time = time.time()
+        candidates = fetch_dataset_by_category(categories or CATEGORIES, limit_per_category)
+        for candidate in candidates:
+            get_document(self.documents, candidate['cv_path']).words
+        get_vocabulary_index()
+        logger.info(f"Warm-up: {len(self.documents)} CV dimuat dalam {time.time() - start_time:.2f} detik.")
+
+    def search(self, query: dict) -> dict:
+        result = search_cvs(query['keywords'], query['algorithm'], query['top_n'],
+                            categories=query['categories'], documents=self.documents, scoring=query['scoring'],
+                            limit_per_category=query['limit_per_category'])
+        for candidate in result['data']:
+            self.known_paths[candidate['id']] = candidate['cv_path']
+        return {
+            'query': query,
+            'total_scanned': result['total_scanned'],
+            'execution_time_exact': result['execution_time_exact'],
+            'execution_time_fuzzy': result['execution_time_fuzzy'],
+            'failed_files': result.get('failed_files', []),
+            'results': result['data'],
+        }
+
+    def summary(self, applicant_id: int, cv_path: str = None) -> dict:
+        cv_path = cv_path or self.known_paths.get(applicant_id)
+        if not cv_path:
+            raise HTTPError(400, "Parameter cv_path wajib diisi untuk pelamar yang belum muncul di hasil pencarian.")
+        document = get_document(self.documents, cv_path)
+        summary_data = get_applicant_summary(applicant_id, cv_path, document)
+        if not summary_data:
+            raise HTTPError(404, f"Pelamar dengan id {applicant_id} tidak ditemukan.")
+        return summary_data
+
+    def health(self) -> dict:
+        return {
+            'status': 'ok',
+            'documents': len(self.documents),
+            'requests': self.request_count,
+            'uptime': time.time() - self.started_at,
+        }
+
+    async def route(self, method: str, target: str, body: bytes) -> dict:
+        """Memetakan request ke handler; pekerjaan berat dijalankan di executor."""
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip('/') or '/'
+        loop = asyncio.get_running_loop()
+
+        if path == '/health':
+            return self.health()
+
+        if path == '/search':
+            if method == 'POST':
+                try:
+                    params = json.loads(body or b'{}')
+                except ValueError:
+                    raise HTTPError(400, "Body harus berupa JSON.")
+                if not isinstance(params, dict):
+                    raise HTTPError(400, "Body harus berupa object JSON.")
+            elif method != 'GET':
+                raise HTTPError(405, "Gunakan GET atau POST.")
+            try:
+                query = make_query(params.get('keywords', []), params.get('algorithm', DEFAULT_ALGORITHM),
+                                   params.get('top_n', DEFAULT_TOP_N), params.get('categories'),
+                                   params.get('scoring', DEFAULT_SCORING),
+                                   params.get('limit_per_category', DEFAULT_LIMIT_PER_CATEGORY))
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+            return await loop.run_in_executor(self.executor, self.search, query)
+
+        if path.startswith('/summary/'):
+            if method != 'GET':
+                raise HTTPError(405, "Gunakan GET.")
+            try:
+                applicant_id = int(unquote(path[len('/summary/'):]))
+            except ValueError:
+                raise HTTPError(400, "Id pelamar harus berupa angka.")
+            return await loop.run_in_executor(self.executor, self.summary, applicant_id, params.get('cv_path'))
+
+        raise HTTPError(404, f"Path {path} tidak dikenal.")
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Melayani satu koneksi HTTP/1.1 (keep-alive) sampai client menutupnya."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Request line tidak valid."}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': "Content-Length tidak valid."}, keep_alive=False)
+                    break
+                if length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {'error': "Body terlalu besar."}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                self.request_count += 1
+                try:
+                    status, payload = 200, await self.route(method.upper(), target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    logger.exception(f"Error saat memproses {method} {target}")
+                    status, payload = 500, {'error': str(e)}
+
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool):
+        body = json.dumps(payload, default=str).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode('latin-1')
+        writer.write(head + body)
+        await writer.drain()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 4, warm: bool = True):
+    """Menjalankan server sampai dihentikan (Ctrl+C)."""
+    service = SearchService(workers)
+    if warm:
+        await asyncio.get_running_loop().run_in_executor(service.executor, service.warm_up)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"CV Analyzer service berjalan di http://{host}:{port} (GET /search, GET /summary/{{id}}, GET /health)", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
@@ -0,0 +1,14 @@
+# File: src/db/categories.py
+# Konstanta scope pencarian. Dipisah dari db.operations agar GUI dapat memakainya
+# tanpa memuat backend database saat startup.
+
+# Kategori dataset (nama folder di data/) yang dipindai secara default
+CATEGORIES = [
+    'ACCOUNTANT', 'ADVOCATE', 'AGRICULTURE', 'APPAREL', 'ARTS', 'AUTOMOBILE',
+    'AVIATION', 'BANKING', 'BPO', 'BUSINESS-DEVELOPMENT', 'CHEF', 'CONSTRUCTION',
+    'CONSULTANT', 'DESIGNER', 'DIGITAL-MEDIA', 'ENGINEERING', 'FINANCE',
+    'FITNESS', 'HEALTHCARE', 'HR', 'INFORMATION-TECHNOLOGY', 'PUBLIC-RELATIONS',
+    'SALES', 'TEACHER'
+]
+# Jumlah CV per kategori yang dipindai secara default (sesuai spesifikasi tugas); None = semua CV
+DEFAULT_LIMIT_PER_CATEGORY = 20
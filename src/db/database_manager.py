@@ -1,17 +1,34 @@
+import time
+import threading
+from contextlib import contextmanager
+
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
+
+POOL_NAME = 'rice_cooker_pool'
+POOL_CHECKOUT_TIMEOUT = 10  # Detik menunggu koneksi kosong jika pool sedang penuh
 
 class DatabaseManager:
     def __init__(self, config):
         # print("test0")
+        config = dict(config)
+        # Opsi non-koneksi di seksi [database]: ukuran pool dan pilihan connector
+        self.pool_size = int(config.pop('pool_size', 0) or 0)
+        self.use_pure = str(config.pop('use_pure', 'true')).strip().lower() not in ('false', '0', 'no')
+        if not self.use_pure and not getattr(mysql.connector, 'HAVE_CEXT', False):
+            print("C extension mysql-connector tidak tersedia, memakai implementasi pure Python.")
+            self.use_pure = True
         self.config = config
         self.connection = None
+        self.pool = None
+        # Mode tanpa pool: akses ke satu koneksi bersama diserialkan dengan lock
+        self._lock = threading.RLock()
         try:
             conn_init = mysql.connector.connect(
                 host=self.config['host'],
                 user=self.config['user'],
                 password=self.config['password'],
-                use_pure = True
+                use_pure = self.use_pure
             )
             # print("test1")
             cursor_init = conn_init.cursor()
@@ -20,19 +37,29 @@ class DatabaseManager:
             conn_init.close()
             print(f"Database '{self.config['database']}' is ready.")
 
-            self.connection = mysql.connector.connect(**self.config, use_pure=True)
-            if self.connection.is_connected():
-                self._create_tables()
+            if self.pool_size > 0:
+                self.pool = pooling.MySQLConnectionPool(
+                    pool_name=POOL_NAME,
+                    pool_size=self.pool_size,
+                    pool_reset_session=True,
+                    use_pure=self.use_pure,
+                    **self.config
+                )
+                print(f"Connection pool dibuat ({self.pool_size} koneksi).")
+                with self.checkout() as conn:
+                    self._create_tables(conn)
+            else:
+                self.connection = mysql.connector.connect(**self.config, use_pure=self.use_pure)
+                if self.connection.is_connected():
+                    self._create_tables(self.connection)
 
         except Error as e:
             print(f"Error inisiasi database: {e}")
             self.connection = None
+            self.pool = None
 
-    def _create_tables(self):
-        if not self.connection:
-            return
-        
-        cursor = self.connection.cursor()
+    def _create_tables(self, conn):
+        cursor = conn.cursor()
         try:
             # tabel applicant profile
             cursor.execute("""
@@ -53,26 +80,160 @@ class DatabaseManager:
                 applicant_id INT NOT NULL,
                 application_role VARCHAR(100) DEFAULT NULL,
                 cv_path TEXT,
-                FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id) ON DELETE CASCADE
+                category VARCHAR(64) DEFAULT NULL,
+                FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id) ON DELETE CASCADE,
+                INDEX idx_application_category (category, cv_path(255))
+            )
+            """)
+
+            # tabel teks CV hasil ingest (python -m db.ingest), satu baris per file PDF
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ApplicationText (
+                cv_path VARCHAR(512) PRIMARY KEY,
+                mtime_ns BIGINT NOT NULL,
+                size BIGINT NOT NULL,
+                raw_text MEDIUMTEXT NOT NULL,
+                flat_text MEDIUMTEXT NOT NULL
             )
             """)
-            self.connection.commit()
+
+            # tabel section CV hasil regex_extractor (JSON), diperbarui jika PARSER_VERSION berubah
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ApplicationSections (
+                cv_path VARCHAR(512) PRIMARY KEY,
+                parser_version INT NOT NULL,
+                mtime_ns BIGINT NOT NULL,
+                size BIGINT NOT NULL,
+                sections MEDIUMTEXT NOT NULL
+            )
+            """)
+            conn.commit()
+            self._migrate_category_column(conn, cursor)
             print("Tabel berhasil dibuat.")
         except Error as e:
             print(f"Error membuat tabel: {e}")
         finally:
             cursor.close()
 
+    def _migrate_category_column(self, conn, cursor):
+        """
+        Migrasi skema lama: menambahkan kolom `category` (ter-index) ke ApplicationDetail
+        dan mengisinya dari nama folder pada cv_path untuk baris yang belum memilikinya.
+        """
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'ApplicationDetail' AND COLUMN_NAME = 'category'
+        """)
+        if cursor.fetchone()[0] == 0:
+            cursor.execute("""
+                ALTER TABLE ApplicationDetail
+                ADD COLUMN category VARCHAR(64) DEFAULT NULL,
+                ADD INDEX idx_application_category (category, cv_path(255))
+            """)
+            print("Kolom category ditambahkan ke ApplicationDetail.")
+
+        # Backfill: kategori = folder induk dari file CV ('data/<CATEGORY>/<id>.pdf')
+        cursor.execute("""
+            UPDATE ApplicationDetail
+            SET category = UPPER(SUBSTRING_INDEX(SUBSTRING_INDEX(cv_path, '/', -2), '/', 1))
+            WHERE category IS NULL AND cv_path LIKE '%/%'
+        """)
+        conn.commit()
+
+    def is_available(self) -> bool:
+        """True jika database berhasil diinisialisasi (pool atau koneksi tunggal)."""
+        if self.pool is not None:
+            return True
+        with self._lock:
+            return self.get_connection() is not None
+
     def get_connection(self):
+        """Koneksi tunggal bersama (mode tanpa pool). Untuk akses konkuren gunakan checkout()."""
         if not self.connection or not self.connection.is_connected():
             try:
-                self.connection = mysql.connector.connect(**self.config, use_pure=True)
+                self.connection = mysql.connector.connect(**self.config, use_pure=self.use_pure)
             except Error as e:
                 print(f"Gagal connect ke database: {e}")
                 return None
         return self.connection
 
+    def _get_pooled_connection(self):
+        deadline = time.time() + POOL_CHECKOUT_TIMEOUT
+        while True:
+            try:
+                conn = self.pool.get_connection()
+                break
+            except pooling.PoolError:
+                # Pool penuh: tunggu sampai ada koneksi yang dikembalikan
+                if time.time() >= deadline:
+                    raise
+                time.sleep(0.05)
+        try:
+            # Health check: sambungkan ulang jika koneksi di pool sudah terputus
+            conn.ping(reconnect=True, attempts=2, delay=0)
+        except Error:
+            self._discard_pooled_connection(conn)
+            raise
+        return conn
+
+    def _discard_pooled_connection(self, conn):
+        """
+        Mengembalikan koneksi pool yang rusak. close() menjalankan reset_session yang gagal pada
+        koneksi terputus, tetapi slotnya tetap dikembalikan ke pool; pool menyambungkan ulang
+        koneksi itu saat diambil lagi (get_connection memeriksa is_connected()).
+        """
+        try:
+            conn.close()
+        except Error:
+            pass
+
+    @contextmanager
+    def checkout(self):
+        """
+        Context manager untuk meminjam koneksi yang aman dipakai dari thread mana pun.
+        Mode pool: koneksi diambil dari pool (dengan health check) dan dikembalikan saat selesai.
+        Mode tanpa pool: koneksi tunggal dipinjam secara eksklusif dengan lock.
+
+        Contoh:
+            with db_manager.checkout() as conn:
+                cursor = conn.cursor()
+        """
+        if self.pool is not None:
+            conn = self._get_pooled_connection()
+            try:
+                yield conn
+            finally:
+                # close() pada koneksi pool = mengembalikan koneksi ke pool
+                conn.close()
+        else:
+            with self._lock:
+                conn = self.get_connection()
+                if conn is None:
+                    raise Error("Koneksi database tidak tersedia.")
+                yield conn
+
     def close(self):
+        if self.pool is not None:
+            # Tutup semua koneksi yang sedang menganggur di pool. API publik pool tidak punya cara
+            # menutup koneksi di antrean tanpa mengambilnya, jadi antrean dikuras dengan get_connection()
+            # selama CONNECTION_POOL_LOCK dipegang (tidak ada koneksi yang dikembalikan di tengah jalan).
+            # Catatan: get_connection() menyambungkan ulang koneksi yang sudah terputus sebelum
+            # diberikan, sehingga koneksi mati dibuka sekali lagi lalu langsung ditutup.
+            with pooling.CONNECTION_POOL_LOCK:
+                for _ in range(self.pool_size):
+                    try:
+                        conn = self.pool.get_connection()
+                    except pooling.PoolError:
+                        break  # Pool sudah kosong
+                    except Error:
+                        continue  # Koneksi gagal dibuka ulang (dikembalikan ke antrean oleh pool)
+                    try:
+                        # disconnect() diteruskan ke koneksi dasarnya; slot sengaja tidak dikembalikan
+                        conn.disconnect()
+                    except Error:
+                        pass
+            self.pool = None
+            print("Connection pool closed.")
         if self.connection and self.connection.is_connected():
             self.connection.close()
             print("Database closed.")
\ No newline at end of file
@@ -0,0 +1,139 @@
+# File: src/db/ingest.py
+
+import os
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from core.pdf_parser import ROOT_DIR, extract_texts
+from core.inverted_index import list_cv_paths
+from core.regex_extractor import PARSER_VERSION, extract_all_sections
+from db.storage import category_from_path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200  # Jumlah CV per transaksi
+MAX_ROLE_LENGTH = 100     # Panjang kolom application_role
+
+def _get_fingerprint(cv_path: str):
+    """(mtime_ns, size) dari file CV, atau None jika file tidak ada."""
+    try:
+        stat = os.stat(os.path.join(ROOT_DIR, cv_path))
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _guess_role(raw_text: str):
+    """Judul posisi = baris pertama yang tidak kosong di CV (format dataset: judul di baris teratas)."""
+    for line in raw_text.splitlines():
+        line = line.strip()
+        if line:
+            return line.title()[:MAX_ROLE_LENGTH]
+    return None
+
+def _extract_file(cv_path: str) -> tuple:
+    """Dijalankan di proses worker: (cv_path, fingerprint, raw_text, flat_text, sections_json)."""
+    fingerprint = _get_fingerprint(cv_path)
+    if not fingerprint:
+        return cv_path, None, "", "", None
+    raw_text, flat_text = extract_texts(cv_path)
+    return cv_path, fingerprint, raw_text, flat_text, json.dumps(extract_all_sections(raw_text))
+
+def ingest(storage, data_dir: str = 'data', workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    """
+    Memasukkan seluruh PDF di `data_dir/<CATEGORY>/` ke database.
+    CV yang belum tercatat mendapat ApplicantProfile dan ApplicationDetail baru, teks
+    setiap CV disimpan di ApplicationText, dan section hasil regex_extractor di
+    ApplicationSections. Hanya file baru, file yang berubah (mtime/ukuran), atau section
+    dari PARSER_VERSION lama yang diproses, sehingga ingest ulang bersifat inkremental.
+
+    Args:
+        storage: Backend storage (lihat db.storage).
+        workers: Jumlah proses untuk ekstraksi teks (None = jumlah CPU, 1 = serial).
+        batch_size: Jumlah CV per transaksi (executemany).
+
+    Returns:
+        dict statistik: scanned, inserted (CV baru), texts (teks disimpan), removed, elapsed
+    """
+    start_time = time.time()
+    cv_paths = list_cv_paths(data_dir)
+    known_paths = storage.get_application_paths()
+    stored_fingerprints = storage.get_text_fingerprints()
+    section_versions = storage.get_section_versions()
+
+    pending = [
+        cv_path for cv_path in cv_paths
+        if cv_path not in known_paths
+        or stored_fingerprints.get(cv_path) != _get_fingerprint(cv_path)
+        or section_versions.get(cv_path) != PARSER_VERSION
+    ]
+    # Teks milik file yang sudah dihapus dari disk
+    removed = [cv_path for cv_path in stored_fingerprints if _get_fingerprint(cv_path) is None]
+    if removed:
+        storage.delete_texts(removed)
+
+    logger.info(f"{len(cv_paths)} CV ditemukan, {len(pending)} baru/berubah.")
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(pending) > 1 else None
+    inserted = saved_texts = 0
+    try:
+        for batch_start in range(0, len(pending), batch_size):
+            batch = pending[batch_start:batch_start + batch_size]
+            if executor:
+                chunk_size = max(1, len(batch) // (workers * 4))
+                extracted = executor.map(_extract_file, batch, chunksize=chunk_size)
+            else:
+                extracted = map(_extract_file, batch)
+
+            applications, texts, sections = [], [], []
+            for cv_path, fingerprint, raw_text, flat_text, sections_json in extracted:
+                if fingerprint is None:
+                    continue
+                if cv_path not in known_paths:
+                    applications.append((cv_path, category_from_path(cv_path), _guess_role(raw_text)))
+                    known_paths.add(cv_path)
+                texts.append((cv_path, fingerprint[0], fingerprint[1], raw_text, flat_text))
+                sections.append((cv_path, PARSER_VERSION, fingerprint[0], fingerprint[1], sections_json))
+
+            storage.save_ingest_batch(applications, texts, sections)
+            inserted += len(applications)
+            saved_texts += len(texts)
+            logger.info(f"Ingest {min(batch_start + batch_size, len(pending))}/{len(pending)} CV.")
+    finally:
+        if executor:
+            executor.shutdown()
+
+    stats = {
+        'scanned': len(cv_paths),
+        'inserted': inserted,
+        'texts': saved_texts,
+        'removed': len(removed),
+        'elapsed': time.time() - start_time,
+    }
+    logger.info(
+        f"Ingest selesai dalam {stats['elapsed']:.2f} detik: {inserted} CV baru, "
+        f"{saved_texts} teks disimpan, {len(removed)} teks dihapus."
+    )
+    return stats
+
+
+if __name__ == '__main__':
+    # Jalankan dari direktori src: python -m db.ingest [data_dir] [--workers N] [--batch-size N]
+    from db.operations import _get_storage, close_db_connection
+
+    parser = argparse.ArgumentParser(description="Ingest seluruh CV di data/ ke database (inkremental).")
+    parser.add_argument('data_dir', nargs='?', default='data', help="Direktori dataset relatif terhadap root proyek")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses ekstraksi teks (default: jumlah CPU)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Jumlah CV per transaksi")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    storage = _get_storage()
+    if storage is None or not storage.is_available():
+        raise SystemExit("Database tidak tersedia, periksa config.ini.")
+    try:
+        ingest(storage, args.data_dir, workers=args.workers, batch_size=args.batch_size)
+    finally:
+        close_db_connection()
@@ -1,90 +1,120 @@
 import configparser
+import json
+import threading
 import traceback
 import time
 import os
 import logging
 
-# Konfigurasi logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-from db.database_manager import DatabaseManager
-from mysql.connector import Error
+from db.storage import create_storage_backend
+from db.categories import CATEGORIES, DEFAULT_LIMIT_PER_CATEGORY
 
-from core.pdf_parser import extract_text_for_pattern_matching, extract_text_for_regex
-from core.kmp import kmp_search
-from core.bm import bm_search
-from core.levenshtein import levenshtein_distance
+from core.cv_document import CVDocument, get_document
+from core.matcher import THRESHOLD, compile_keywords, match_exact
+from core.parallel_scan import parallel_exact, shutdown_pool
+from core.vocabulary_index import get_vocabulary_index
 # from core.regex_extractor import extract_skills, extract_experience, extract_education, extract_all_sections
-from core.regex_extractor import extract_all_sections
-from core.aho_corasick import AhoCorasick
-
-_db_manager_instance = None
-
-def _get_db_manager():
-    """Menginisialisasi dan mengembalikan instance tunggal DatabaseManager."""
-    global _db_manager_instance
-    if _db_manager_instance is None:
-        try:
-            config = configparser.ConfigParser()
-            # Menggunakan path absolut dari root direktori
-            root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            config_path = os.path.join(root_dir, 'src', 'config.ini')
-            
-            if not config.read(config_path):
-                raise FileNotFoundError(f"FATAL: File '{config_path}' tidak ditemukan.")
+from core.inverted_index import get_file_fingerprint, get_inverted_index
+from core.corpus import get_corpus, store_covers
+from core.ranking import TopNBound, fuzzy_scope, rank_key, score_rank_key, select_top
+from core.scoring import bm25_scores, get_document_lengths
 
-            db_config = dict(config['database'])
-            _db_manager_instance = DatabaseManager(db_config)
-            
-        except Exception as e:
-            print("--- [ERROR KRITIS SAAT SETUP DATABASE] ---")
-            traceback.print_exc()
-            return None
+_storage_instance = None
+_storage_lock = threading.Lock()
+_config = None
+# Dokumen kandidat dari hasil pencarian terakhir, agar halaman ringkasan tidak mem-parse ulang PDF
+_last_search_documents = {}
+# Jeda minimum (detik) antar pengiriman hasil sementara ke partial_callback
+PARTIAL_RESULTS_INTERVAL = 0.25
+
+def _load_config():
+    """Membaca config.ini sekali dan mengembalikan ConfigParser-nya."""
+    global _config
+    if _config is None:
+        config = configparser.ConfigParser()
+        # Menggunakan path absolut dari root direktori
+        root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        config_path = os.path.join(root_dir, 'src', 'config.ini')
+
+        if not config.read(config_path):
+            raise FileNotFoundError(f"FATAL: File '{config_path}' tidak ditemukan.")
+        _config = config
+    return _config
+
+def _get_search_settings():
+    """Mengambil pengaturan pencarian paralel dari seksi [search] di config.ini."""
+    try:
+        section = _load_config()['search']
+    except (FileNotFoundError, KeyError):
+        return 0, 0, 0
+    try:
+        workers = section.get('workers', '0').strip().lower()
+        workers = (os.cpu_count() or 1) if workers == 'auto' else int(workers)
+        return workers, section.getint('chunk_size', 0), section.getint('min_parallel_candidates', 0)
+    except ValueError as e:
+        logger.warning(f"Pengaturan [search] di config.ini tidak valid ({str(e)}); pencarian dijalankan serial.")
+        return 0, 0, 0
+
+def _get_storage():
+    """Menginisialisasi dan mengembalikan instance tunggal backend storage (MySQL/SQLite)."""
+    global _storage_instance
+    # Lock: worker pencarian dan GUI thread bisa memanggil ini bersamaan
+    with _storage_lock:
+        if _storage_instance is None:
+            try:
+                _storage_instance = create_storage_backend(_load_config())
+                
+            except Exception as e:
+                print("--- [ERROR KRITIS SAAT SETUP DATABASE] ---")
+                traceback.print_exc()
+                return None
             
-    return _db_manager_instance
+    return _storage_instance
 
-def fetch_dataset_by_category(categories: list[str], limit_per_category: int = 20):
+def warm_up() -> bool:
+    """
+    Menyiapkan backend storage (koneksi/pool DB) lebih awal, mis. dari thread latar belakang
+    setelah window GUI tampil, agar pencarian pertama tidak menunggu koneksi dibuka.
+    Kosakata fuzzy yang tersimpan di disk juga dimuat di sini.
+    Return: True jika database dapat dipakai.
+    """
+    start_time = time.time()
+    storage = _get_storage()
+    available = bool(storage) and storage.is_available()
+    logger.info(f"Warm-up database selesai dalam {time.time() - start_time:.2f} detik (tersedia: {available}).")
+    get_vocabulary_index()
+    return available
+
+def fetch_dataset_by_category(categories: list[str], limit_per_category: int = DEFAULT_LIMIT_PER_CATEGORY):
     """
     FUNGSI BARU: Mengambil dataset dari DB sesuai spesifikasi tugas.
-    Mengambil data sejumlah `limit_per_category` dari setiap kategori yang diberikan,
-    diurutkan secara leksikografis berdasarkan path CV.
+    Mengambil data sejumlah `limit_per_category` dari setiap kategori yang diberikan
+    (None = seluruh CV kategori tersebut), diurutkan secara leksikografis berdasarkan path CV.
+    Seluruh kategori diambil dalam satu query: filter memakai kolom `category` yang
+    ter-index dan batas per kategori memakai ROW_NUMBER() OVER (PARTITION BY category).
+    Query dijalankan oleh backend storage yang dipilih di config.ini.
     """
-    db_manager = _get_db_manager()
-    if not db_manager or not db_manager.get_connection():
+    if not categories:
+        return []
+
+    storage = _get_storage()
+    if not storage or not storage.is_available():
         print("[ERROR] Gagal mendapatkan koneksi database saat fetch dataset.")
         return []
 
-    conn = db_manager.get_connection()
-    # cursor = conn.cursor(dictionary=True)
-    cursor = conn.cursor(buffered=True, dictionary=True)
     full_dataset = []
     
     print("Mulai mengambil dataset berdasarkan kategori...")
-    for category in categories:
-        query = """
-        SELECT 
-            p.applicant_id as id, 
-            p.first_name,
-            p.last_name, 
-            d.cv_path
-        FROM ApplicantProfile p
-        JOIN ApplicationDetail d ON p.applicant_id = d.applicant_id
-        WHERE d.cv_path LIKE %s
-        ORDER BY d.cv_path ASC
-        LIMIT %s
-        """
-        try:
-            category_pattern = f"%/{category}/%"
-            cursor.execute(query, (category_pattern, limit_per_category))
-            results = cursor.fetchall()
-            full_dataset.extend(results)
-            # print(f"Mengambil {len(results)} CV dari kategori: {category}") # Uncomment untuk debug
-        except Exception as e:
-            print(f"Error fetching data untuk kategori {category}: {e}")
-
-    if cursor:
-        cursor.close()
+    try:
+        full_dataset = storage.fetch_dataset_by_category(categories, limit_per_category)
+    except Exception as e:
+        print(f"Error fetching dataset: {e}")
+
+    # Urutkan sesuai urutan kategori yang diminta (stabil, urutan cv_path per kategori tetap)
+    category_order = {category: i for i, category in enumerate(categories)}
+    full_dataset.sort(key=lambda candidate: category_order.get(candidate['category'], len(categories)))
         
     for candidate in full_dataset:
         candidate['name'] = f"{candidate.get('first_name', '')} {candidate.get('last_name', '')}".strip()
@@ -92,70 +122,212 @@ def fetch_dataset_by_category(categories: list[str], limit_per_category: int = 2
     print(f"Total dataset yang diambil: {len(full_dataset)} CV.")
     return full_dataset
 
-def search_cvs(keywords: list[str], algorithm: str, top_n: int):
+def _merge_hits(all_candidates: list, exact_hits: dict, fuzzy_hits: dict = None) -> dict:
+    """
+    Menggabungkan hasil per CV menjadi hasil per kandidat, mengikuti urutan kandidat.
+    Hasil exact ({cv_path: {keyword: jumlah}}) menimpa. Hasil fuzzy ({cv_path: {keyword: kata_mirip}})
+    dikelompokkan per keyword asal, sehingga kandidat dengan beberapa CV tetap mendapat satu entri
+    'keyword (similar: kata, ...)' per keyword, dengan jumlah = banyaknya CV yang cocok.
+    """
+    results = {}
+
+    def result_for(candidate):
+        candidate_id = candidate['id']
+        if candidate_id not in results:
+            results[candidate_id] = { 'id': candidate_id, 'name': candidate['name'], 'cv_path': candidate['cv_path'], 'matched_keywords': {}, 'match_count': 0 }
+        return results[candidate_id]
+
+    for candidate in all_candidates:
+        matches = exact_hits.get(candidate['cv_path'])
+        if matches:
+            result_for(candidate)['matched_keywords'].update(matches)
+
+    similar = {}  # {candidate_id: {keyword: [jumlah, set(kata_mirip)]}}
+    for candidate in all_candidates:
+        matches = (fuzzy_hits or {}).get(candidate['cv_path'])
+        if not matches:
+            continue
+        result_for(candidate)
+        keywords = similar.setdefault(candidate['id'], {})
+        for keyword, word in matches.items():
+            entry = keywords.setdefault(keyword, [0, set()])
+            entry[0] += 1
+            entry[1].add(word)
+    for candidate_id, keywords in similar.items():
+        matched_keywords = results[candidate_id]['matched_keywords']
+        for keyword, (count, words) in keywords.items():
+            matched_keywords[f"{keyword} (similar: {', '.join(sorted(words))})"] = count
+
+    for res in results.values():
+        res['match_count'] = len(res['matched_keywords'])
+    return results
+
+def _apply_scores(results: dict, all_candidates: list, cv_scores: dict):
+    """Skor relevansi kandidat = skor tertinggi di antara CV miliknya (disimpan di field 'score')."""
+    for res in results.values():
+        res['score'] = 0.0
+    for candidate in all_candidates:
+        res = results.get(candidate['id'])
+        if res is not None:
+            res['score'] = max(res['score'], cv_scores.get(candidate['cv_path'], 0.0))
+
+def _rank_results(results: dict, top_n: int, key=rank_key) -> list:
+    """
+    Mengambil top_n kandidat berdasarkan jumlah keyword yang cocok, lalu total kemunculan,
+    lalu id (lihat core.ranking.rank_key), dengan heap berukuran top_n.
+    """
+    return select_top(results.values(), top_n, key)
+
+def _match_exact_pruned(cv_path: str, cv_text: str, compiled: list, existence_only: bool, bound: TopNBound) -> dict:
+    """
+    Seperti match_exact untuk KMP/BM, tetapi berhenti menghitung begitu tidak ada pemilik CV
+    yang masih mungkin masuk top-N. Keyword yang belum ditemukan di CV mana pun tetap dicek
+    keberadaannya (penentu keyword mana yang masuk tahap fuzzy); sisanya dilewati.
+    """
+    matches = {}
+    if cv_text:
+        for keyword, pattern in dict(compiled).items():
+            if bound.is_hopeless(cv_path):
+                if keyword in bound.found_anywhere:
+                    bound.record(cv_path, keyword, False)
+                    continue
+                count = int(pattern.contains(cv_text))
+            else:
+                count = int(pattern.contains(cv_text)) if existence_only else pattern.count(cv_text)
+            bound.record(cv_path, keyword, count > 0)
+            if count:
+                matches[keyword] = count
+    else:
+        for keyword in dict(compiled):
+            bound.record(cv_path, keyword, False)
+    bound.finish_document()
+    return matches
+
+def search_cvs(keywords: list[str], algorithm: str, top_n: int, progress_callback=None, partial_callback=None, cancel_event=None,
+               existence_only: bool = False, categories: list[str] = None, documents: dict = None,
+               scoring: str = 'MATCH_COUNT', limit_per_category: int = DEFAULT_LIMIT_PER_CATEGORY):
     """
     Fungsi utama untuk orkestrasi pencarian, menggabungkan Exact dan Fuzzy Match.
+
+    Args:
+        progress_callback: Opsional, dipanggil dengan (tahap, jumlah_cv_dipindai, total_cv).
+        partial_callback: Opsional, dipanggil dengan daftar top_n sementara setiap kali berubah.
+        cancel_event: Opsional, objek dengan is_set() (mis. threading.Event) untuk membatalkan pencarian.
+        existence_only: Jika True, setiap keyword cukup dicek keberadaannya (jumlah kemunculan dicatat 1),
+            sehingga pemindaian berhenti pada kemunculan pertama.
+        categories: Opsional, kategori yang dipindai (default: seluruh CATEGORIES).
+        documents: Opsional, dict {cv_path: CVDocument} yang dipakai bersama oleh beberapa pencarian
+            (mis. batch query), sehingga teks CV cukup dimuat sekali untuk seluruh batch.
+        scoring: 'MATCH_COUNT' (default, jumlah keyword yang cocok) atau 'BM25' (relevansi dari frekuensi
+            keyword, panjang CV, dan jumlah CV yang memuat keyword; skornya dicatat di field 'score').
+        limit_per_category: Jumlah CV per kategori yang dipindai (default 20; None = seluruh CV yang
+            terdaftar di database). Bersama `categories` menentukan scope pencarian.
     """
-    CATEGORIES = [
-        'ACCOUNTANT', 'ADVOCATE', 'AGRICULTURE', 'APPAREL', 'ARTS', 'AUTOMOBILE',
-        'AVIATION', 'BANKING', 'BPO', 'BUSINESS-DEVELOPMENT', 'CHEF', 'CONSTRUCTION',
-        'CONSULTANT', 'DESIGNER', 'DIGITAL-MEDIA', 'ENGINEERING', 'FINANCE',
-        'FITNESS', 'HEALTHCARE', 'HR', 'INFORMATION-TECHNOLOGY', 'PUBLIC-RELATIONS',
-        'SALES', 'TEACHER'
-    ]
-    
-    all_candidates = fetch_dataset_by_category(CATEGORIES, limit_per_category=20)
+    global _last_search_documents
+    all_candidates = fetch_dataset_by_category(categories or CATEGORIES, limit_per_category=limit_per_category)
     
     if not all_candidates:
-        return {'data': [], 'execution_time_exact': 0, 'execution_time_fuzzy': 0, 'total_scanned': 0}
+        return {'data': [], 'execution_time_exact': 0, 'execution_time_fuzzy': 0, 'total_scanned': 0, 'cancelled': False}
 
-    results = {}
     lower_keywords = [kw.strip().lower() for kw in keywords if kw.strip()]
+    algorithm = algorithm.upper()
+    use_bm25 = scoring.upper() == 'BM25'
     total_scanned = len(all_candidates)
     failed_files = []
+    # Satu CVDocument per CV untuk seluruh request: setiap PDF di-decode paling banyak sekali
+    if documents is None:
+        documents = {}
+    # CV unik (urutan dipertahankan); satu CV cukup dipindai sekali walau muncul di beberapa baris
+    cv_paths = list(dict.fromkeys(candidate['cv_path'] for candidate in all_candidates))
 
-    # Bangun automaton Aho-Corasick sekali saja jika dipilih
-    ac_automaton = None
-    if algorithm.upper() == 'AHO-CORASICK':
-        ac_automaton = AhoCorasick()
-        for keyword in lower_keywords:
-            ac_automaton.add_keyword(keyword)
-        ac_automaton.build_failure_links()
+    # Mode paralel hanya dipakai jika diaktifkan di config.ini dan korpus cukup besar
+    workers, chunk_size, min_parallel = _get_search_settings()
+    use_parallel = workers > 1 and len(cv_paths) >= max(min_parallel, workers)
+
+    exact_hits = {}  # {cv_path: {'keyword': jumlah}}
+    fuzzy_hits = {}  # {cv_path: {'keyword': kata_mirip}}
+    last_partial = [None, 0.0]  # [signature top_n terakhir, waktu emit terakhir]
+    if use_bm25:
+        # Panjang CV diambil dari statistik tersimpan (hanya CV baru/berubah yang dihitung)
+        doc_lengths = get_document_lengths(cv_paths, documents)
+
+    def rank(results):
+        if not use_bm25:
+            return _rank_results(results, top_n)
+        cv_hits = {cv_path: dict(matches) for cv_path, matches in exact_hits.items()}
+        for cv_path, matches in fuzzy_hits.items():
+            cv_hits.setdefault(cv_path, {}).update(dict.fromkeys(matches, 1))
+        _apply_scores(results, all_candidates, bm25_scores(cv_hits, doc_lengths, len(cv_paths)))
+        return _rank_results(results, top_n, score_rank_key)
+
+    def is_cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
+    def report(stage, scanned, force=False):
+        if progress_callback:
+            progress_callback(stage, scanned, len(cv_paths))
+        if not partial_callback:
+            return
+        # Batasi frekuensi perhitungan peringkat sementara
+        now = time.time()
+        if not force and now - last_partial[1] < PARTIAL_RESULTS_INTERVAL:
+            return
+        last_partial[1] = now
+        top_results = rank(_merge_hits(all_candidates, exact_hits, fuzzy_hits))
+        signature = [(res['id'], res['match_count'], res.get('score')) for res in top_results]
+        if signature != last_partial[0]:
+            last_partial[0] = signature
+            partial_callback(top_results)
+
+    # Inverted index hanya dimuat/diperbarui jika dipilih (CV yang berubah diindeks ulang)
+    if algorithm == 'INDEX':
+        inverted_index = get_inverted_index(cv_paths)
 
     # --- Tahap 1: Exact Matching ---
     start_time_exact = time.time()
-    for candidate in all_candidates:
-        cv_path = candidate['cv_path']
-        cv_text = extract_text_for_pattern_matching(cv_path)
-        if not cv_text:
-            continue
-
-        if algorithm.upper() in ['KMP', 'BM']:
-            for keyword in lower_keywords:
-                search_func = kmp_search if algorithm.upper() == 'KMP' else bm_search
-                indices = search_func(cv_text, keyword)
-                if indices:
-                    # (logika KMP/BM tetap sama)
-                    candidate_id = candidate['id']
-                    if candidate_id not in results:
-                        results[candidate_id] = { 'id': candidate_id, 'name': candidate['name'], 'cv_path': cv_path, 'matched_keywords': {}, 'match_count': 0 }
-                    results[candidate_id]['matched_keywords'][keyword] = len(indices)
-        
-        elif algorithm.upper() == 'AHO-CORASICK':
-            # Cari semua keyword sekaligus
-            found_matches = ac_automaton.search(cv_text)
-            if found_matches:
-                candidate_id = candidate['id']
-                if candidate_id not in results:
-                    results[candidate_id] = { 'id': candidate_id, 'name': candidate['name'], 'cv_path': cv_path, 'matched_keywords': {}, 'match_count': 0 }
-                
-                # Salin hasil dari Aho-Corasick
-                for keyword, indices in found_matches.items():
-                    results[candidate_id]['matched_keywords'][keyword] = len(indices)
+    if algorithm == 'INDEX':
+        # Lookup sekali per keyword, lalu dibalik menjadi {cv_path: {keyword: jumlah}}
+        for keyword in lower_keywords:
+            for cv_path, count in inverted_index.lookup(keyword).items():
+                exact_hits.setdefault(cv_path, {})[keyword] = 1 if existence_only else count
+        report('exact', len(cv_paths), force=True)
+    elif algorithm == 'CORPUS':
+        # Seluruh teks CV dalam satu buffer: satu lintasan bytes.find per keyword untuk semua CV
+        corpus = get_corpus(cv_paths, documents)
+        for keyword in lower_keywords:
+            if is_cancelled():
+                break
+            for cv_path, count in corpus.lookup(keyword, existence_only).items():
+                exact_hits.setdefault(cv_path, {})[keyword] = count
+        report('exact', len(cv_paths), force=True)
+    else:
+        completed = False
+        if use_parallel:
+            completed = parallel_exact(cv_paths, lower_keywords, algorithm, workers, chunk_size, exact_hits,
+                                       on_progress=lambda scanned: report('exact', scanned), should_cancel=is_cancelled,
+                                       existence_only=existence_only, use_store=store_covers(cv_paths))
 
+        if not completed and not is_cancelled():
+            # Preprocessing pattern (LPS / tabel BM / automaton) sekali saja untuk semua CV
+            compiled = compile_keywords(lower_keywords, algorithm)
+            # KMP/BM memindai per keyword, sehingga CV yang tidak mungkin masuk top-N bisa dipangkas
+            # (batas atas hanya berlaku untuk peringkat jumlah keyword, bukan BM25)
+            prunable = algorithm in ['KMP', 'BM'] and not use_bm25
+            bound = TopNBound(all_candidates, lower_keywords, top_n) if prunable else None
+            for scanned, cv_path in enumerate(cv_paths, start=1):
+                if is_cancelled():
+                    break
+                if cv_path not in exact_hits:
+                    cv_text = get_document(documents, cv_path).flat_text
+                    if bound is None:
+                        matches = match_exact(cv_text, lower_keywords, algorithm, compiled, existence_only)
+                    else:
+                        matches = _match_exact_pruned(cv_path, cv_text, compiled, existence_only, bound)
+                    if matches:
+                        exact_hits[cv_path] = matches
+                report('exact', scanned)
 
-    for res in results.values():
-        res['match_count'] = len(res['matched_keywords'])
+    results = _merge_hits(all_candidates, exact_hits)
     exact_match_duration = time.time() - start_time_exact
 
     # --- Tahap 2: Fuzzy Matching (Lengkap) ---
@@ -164,55 +336,55 @@ def search_cvs(keywords: list[str], algorithm: str, top_n: int):
     unmatched_keywords = [kw for kw in lower_keywords if kw not in found_keywords_exact]
     
     fuzzy_match_duration = 0
-    if unmatched_keywords:
-        THRESHOLD = 2  # Jarak Levenshtein <= 2 dianggap mirip
-        
-        for candidate in all_candidates:
-            if candidate['cv_path'] in failed_files:
+    if unmatched_keywords and not is_cancelled():
+        # CV yang pemiliknya tidak mungkin masuk top-N walau mendapat hasil fuzzy tidak perlu dimuat
+        if use_bm25:
+            scope = set(cv_paths)
+        else:
+            scope = fuzzy_scope(all_candidates, results, len(unmatched_keywords), top_n)
+        # Kosakata global (BK-tree) hanya perlu memuat kata dari CV yang baru atau berubah
+        vocabulary = get_vocabulary_index()
+        vocabulary_updated = 0
+        for scanned, cv_path in enumerate(cv_paths, start=1):
+            if is_cancelled():
+                break
+            if cv_path in failed_files or cv_path not in scope:
                 continue
-                
             try:
-                cv_text = extract_text_for_pattern_matching(candidate['cv_path'])
-                if not cv_text:
-                    continue
-                
-                cv_words = set(cv_text.split())
-                for keyword in unmatched_keywords:
-                    for word in cv_words:
-                        if abs(len(keyword) - len(word)) <= THRESHOLD:
-                            dist = levenshtein_distance(keyword, word)
-                            if dist <= THRESHOLD and dist > 0:
-                                candidate_id = candidate['id']
-                                if candidate_id not in results:
-                                    results[candidate_id] = {
-                                        'id': candidate_id, 'name': candidate['name'], 'cv_path': candidate['cv_path'],
-                                        'matched_keywords': {}, 'match_count': 0
-                                    }
-                                
-                                fuzzy_key = f"{keyword} (similar: {word})"
-                                results[candidate_id]['matched_keywords'][fuzzy_key] = results[candidate_id]['matched_keywords'].get(fuzzy_key, 0) + 1
-                                break
+                vocabulary_updated += vocabulary.update_document(cv_path, lambda: get_document(documents, cv_path).words)
             except Exception as e:
-                logger.error(f"Error dalam fuzzy matching untuk {candidate['cv_path']}: {str(e)}")
+                logger.error(f"Error dalam fuzzy matching untuk {cv_path}: {str(e)}")
                 continue
-        
-        for res in results.values():
-            res['match_count'] = len(res['matched_keywords'])
-        
+            finally:
+                report('fuzzy', scanned)
+        if vocabulary_updated:
+            # Disimpan agar BK-tree tidak perlu dibangun ulang di proses berikutnya
+            try:
+                vocabulary.save()
+            except OSError as e:
+                logger.warning(f"Gagal menyimpan kosakata: {str(e)}")
+
+        if not is_cancelled():
+            # Tetangga tiap keyword dicari sekali di kosakata, lalu disebar ke CV lewat posting list
+            fuzzy_hits.update(vocabulary.fuzzy_matches(unmatched_keywords, THRESHOLD, scope=scope))
+
+        results = _merge_hits(all_candidates, exact_hits, fuzzy_hits)
         fuzzy_match_duration = time.time() - start_time_fuzzy
 
     # --- Tahap 3: Finalisasi Hasil ---
-    sorted_results = sorted(results.values(), key=lambda x: x['match_count'], reverse=True)
+    top_results = rank(results)
+    _last_search_documents = {res['cv_path']: get_document(documents, res['cv_path']) for res in top_results}
     
     if failed_files:
         logger.warning(f"Gagal memproses {len(failed_files)} file: {', '.join(failed_files)}")
     
     return {
-        'data': sorted_results[:top_n],
+        'data': top_results,
         'execution_time_exact': exact_match_duration,
         'execution_time_fuzzy': fuzzy_match_duration,
         'total_scanned': total_scanned,
-        'failed_files': failed_files
+        'failed_files': failed_files,
+        'cancelled': is_cancelled()
     }
 
 # def get_applicant_summary(applicant_id: int, cv_path: str):
@@ -250,22 +422,43 @@ def search_cvs(keywords: list[str], algorithm: str, top_n: int):
 #     cursor.close()
 #     return summary_data
 
-def get_applicant_summary(applicant_id: int, cv_path: str):
-    db_manager = _get_db_manager()
-    conn = db_manager.get_connection()
-    cursor = conn.cursor(buffered=True, dictionary=True)
-    
-    cursor.execute("SELECT * FROM ApplicantProfile WHERE applicant_id = %s", (applicant_id,))
-    profile_data = cursor.fetchone()
+def get_applicant_summary(applicant_id: int, cv_path: str, document: CVDocument = None):
+    """
+    Mengambil profil dan section CV untuk halaman ringkasan dalam satu lookup DB.
+    Section yang tersimpan (hasil ingest atau ringkasan sebelumnya) dipakai langsung selama
+    PDF belum berubah dan PARSER_VERSION sama; jika tidak, CV di-parse ulang lalu disimpan.
+    Jika CV termasuk hasil pencarian terakhir, dokumen yang sudah di-decode dipakai ulang.
+    """
+    # Diimpor saat dibutuhkan: kompilasi seluruh pola regex tidak perlu dibayar saat startup GUI
+    from core.regex_extractor import PARSER_VERSION, extract_all_sections
+
+    storage = _get_storage()
+    if not storage:
+        return None
+    profile_data, stored_sections = storage.get_profile_and_sections(applicant_id, cv_path)
 
     if not profile_data:
-        cursor.close()
         return None
 
-    cv_text_for_regex = extract_text_for_regex(cv_path)
-    
-    # Panggil fungsi ekstraksi utama SATU KALI saja
-    extracted_sections = extract_all_sections(cv_text_for_regex)
+    fingerprint = get_file_fingerprint(cv_path)
+    extracted_sections = None
+    if stored_sections and fingerprint:
+        parser_version, mtime_ns, size, sections_json = stored_sections
+        if parser_version == PARSER_VERSION and (mtime_ns, size) == fingerprint:
+            extracted_sections = json.loads(sections_json)
+
+    if extracted_sections is None:
+        if document is None:
+            document = _last_search_documents.get(cv_path) or CVDocument(cv_path)
+        cv_text_for_regex = document.raw_text
+        
+        # Panggil fungsi ekstraksi utama SATU KALI saja
+        extracted_sections = extract_all_sections(cv_text_for_regex)
+        if fingerprint:
+            try:
+                storage.save_sections(cv_path, PARSER_VERSION, fingerprint[0], fingerprint[1], json.dumps(extracted_sections))
+            except Exception as e:
+                logger.warning(f"Gagal menyimpan section untuk {cv_path}: {str(e)}")
 
     # Ambil hasilnya dari dictionary yang sudah jadi
     summary_data = {
@@ -276,12 +469,14 @@ def get_applicant_summary(applicant_id: int, cv_path: str):
         'education': extracted_sections.get('education')
     }
     
-    cursor.close()
     return summary_data
 
 def close_db_connection():
     """Menutup koneksi database saat aplikasi keluar."""
-    db_manager = _get_db_manager()
-    if db_manager:
-        db_manager.close()
-        print("Koneksi database berhasil ditutup.")
\ No newline at end of file
+    # Jangan membuka koneksi baru hanya untuk menutupnya (mis. aplikasi ditutup sebelum pencarian pertama)
+    storage = _storage_instance
+    if storage:
+        storage.close()
+        print("Koneksi database berhasil ditutup.")
+    # Matikan juga worker pencarian paralel jika ada
+    shutdown_pool()
\ No newline at end of file
@@ -0,0 +1,220 @@
+# File: src/db/sqlite_backend.py
+
+import os
+import json
+import sqlite3
+import threading
+from datetime import date
+
+from db.storage import StorageBackend, category_from_path, placeholder_profile, split_sections_row
+
+SEEDING_SQL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tubes3_seeding.sql')
+
+# Skema setara dengan tabel MySQL di DatabaseManager
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ApplicantProfile (
+    applicant_id INTEGER PRIMARY KEY,
+    first_name TEXT DEFAULT NULL,
+    last_name TEXT DEFAULT NULL,
+    date_of_birth TEXT DEFAULT NULL,
+    address TEXT DEFAULT NULL,
+    phone_number TEXT DEFAULT NULL
+);
+CREATE TABLE IF NOT EXISTS ApplicationDetail (
+    detail_id INTEGER PRIMARY KEY,
+    applicant_id INTEGER NOT NULL REFERENCES ApplicantProfile(applicant_id),
+    application_role TEXT DEFAULT NULL,
+    cv_path TEXT,
+    category TEXT DEFAULT NULL
+);
+CREATE TABLE IF NOT EXISTS ApplicationText (
+    cv_path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    raw_text TEXT NOT NULL,
+    flat_text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ApplicationSections (
+    cv_path TEXT PRIMARY KEY,
+    parser_version INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sections TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_application_category ON ApplicationDetail (category, cv_path, detail_id);
+CREATE INDEX IF NOT EXISTS idx_application_applicant ON ApplicationDetail (applicant_id);
+"""
+
+# Daftar kategori dikirim sebagai satu array JSON, sehingga teks query selalu sama
+# dan statement yang sudah di-prepare dipakai ulang dari cache statement sqlite3.
+FETCH_DATASET_QUERY = """
+SELECT id, first_name, last_name, cv_path, category
+FROM (
+    SELECT
+        p.applicant_id AS id,
+        p.first_name,
+        p.last_name,
+        d.cv_path,
+        d.category,
+        ROW_NUMBER() OVER (PARTITION BY d.category ORDER BY d.cv_path ASC, d.detail_id ASC) AS row_num
+    FROM ApplicationDetail d
+    JOIN ApplicantProfile p ON p.applicant_id = d.applicant_id
+    WHERE d.category IN (SELECT value FROM json_each(?))
+)
+WHERE ? IS NULL OR row_num <= ?
+ORDER BY category, row_num
+"""
+
+PROFILE_SECTIONS_QUERY = """
+SELECT p.*, s.parser_version AS _parser_version, s.mtime_ns AS _mtime_ns,
+    s.size AS _size, s.sections AS _sections
+FROM ApplicantProfile p
+LEFT JOIN ApplicationSections s ON s.cv_path = ?
+WHERE p.applicant_id = ?
+"""
+
+UPSERT_SECTIONS_QUERY = "INSERT OR REPLACE INTO ApplicationSections (cv_path, parser_version, mtime_ns, size, sections) VALUES (?, ?, ?, ?, ?)"
+
+def _convert_profile(profile: dict) -> dict:
+    # Samakan dengan MySQL: kolom DATE dikembalikan sebagai datetime.date
+    if profile.get('date_of_birth'):
+        try:
+            profile['date_of_birth'] = date.fromisoformat(profile['date_of_birth'])
+        except ValueError:
+            pass
+    return profile
+
+def _read_seed_inserts(sql_path: str) -> list[str]:
+    """Mengambil statement INSERT dari file seeding MySQL (sintaksnya juga valid di SQLite)."""
+    statements = []
+    buffer = ''
+    with open(sql_path, encoding='utf-8') as f:
+        for line in f:
+            if line.lstrip().startswith('--'):
+                continue
+            buffer += line
+            if sqlite3.complete_statement(buffer):
+                if buffer.lstrip().upper().startswith('INSERT'):
+                    statements.append(buffer.strip())
+                buffer = ''
+    return statements
+
+class SQLiteBackend(StorageBackend):
+    """
+    Backend SQLite: seluruh data disimpan di satu file lokal (mode WAL), tanpa server.
+    Database kosong otomatis diisi dari tubes3_seeding.sql.
+    Setiap thread memakai koneksinya sendiri, sehingga aman dipanggil dari worker pencarian.
+    """
+    name = 'sqlite'
+
+    def __init__(self, db_path: str, seed_path: str = SEEDING_SQL_PATH):
+        self.db_path = db_path
+        self.seed_path = seed_path
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        try:
+            self._init_schema(self._get_connection())
+            print(f"Database SQLite '{self.db_path}' is ready.")
+        except (sqlite3.Error, OSError) as e:
+            print(f"Error inisiasi database SQLite: {e}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Satu koneksi per thread (dan per proses)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and getattr(self._local, 'pid', None) == os.getpid():
+            return conn
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _init_schema(self, conn: sqlite3.Connection):
+        conn.executescript(SCHEMA)
+        has_data = conn.execute("SELECT 1 FROM ApplicantProfile LIMIT 1").fetchone()
+        if has_data is None and self.seed_path and os.path.exists(self.seed_path):
+            self._seed(conn)
+
+    def _seed(self, conn: sqlite3.Connection):
+        """Mengisi database kosong dari file seeding, lalu mengisi kolom category dari cv_path."""
+        with conn:
+            for statement in _read_seed_inserts(self.seed_path):
+                conn.execute(statement)
+            rows = conn.execute("SELECT detail_id, cv_path FROM ApplicationDetail WHERE category IS NULL AND cv_path IS NOT NULL").fetchall()
+            conn.executemany(
+                "UPDATE ApplicationDetail SET category = ? WHERE detail_id = ?",
+                [(category_from_path(row['cv_path']), row['detail_id']) for row in rows]
+            )
+        conn.execute("ANALYZE")
+        print(f"Database SQLite diisi dari {os.path.basename(self.seed_path)}.")
+
+    def is_available(self) -> bool:
+        try:
+            self._get_connection().execute("SELECT 1")
+            return True
+        except (sqlite3.Error, OSError):
+            return False
+
+    def fetch_dataset_by_category(self, categories: list[str], limit_per_category: int) -> list[dict]:
+        rows = self._get_connection().execute(FETCH_DATASET_QUERY, (json.dumps(list(categories)), limit_per_category, limit_per_category)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_profile_and_sections(self, applicant_id: int, cv_path: str) -> tuple:
+        row = self._get_connection().execute(PROFILE_SECTIONS_QUERY, (cv_path, applicant_id)).fetchone()
+        profile, entry = split_sections_row(row)
+        return (_convert_profile(profile) if profile is not None else None), entry
+
+    def save_sections(self, cv_path: str, parser_version: int, mtime_ns: int, size: int, sections_json: str):
+        conn = self._get_connection()
+        with conn:
+            conn.execute(UPSERT_SECTIONS_QUERY, (cv_path, parser_version, mtime_ns, size, sections_json))
+
+    def get_application_paths(self) -> set:
+        rows = self._get_connection().execute("SELECT DISTINCT cv_path FROM ApplicationDetail WHERE cv_path IS NOT NULL")
+        return {row[0] for row in rows}
+
+    def get_text_fingerprints(self) -> dict:
+        rows = self._get_connection().execute("SELECT cv_path, mtime_ns, size FROM ApplicationText")
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def get_section_versions(self) -> dict:
+        rows = self._get_connection().execute("SELECT cv_path, parser_version FROM ApplicationSections")
+        return {row[0]: row[1] for row in rows}
+
+    def save_ingest_batch(self, applications: list[tuple], texts: list[tuple], sections: list[tuple] = ()):
+        conn = self._get_connection()
+        with conn:
+            if applications:
+                next_id = conn.execute("SELECT COALESCE(MAX(applicant_id), 0) FROM ApplicantProfile").fetchone()[0] + 1
+                profiles, details = [], []
+                for offset, (cv_path, category, role) in enumerate(applications):
+                    first_name, last_name = placeholder_profile(cv_path)
+                    profiles.append((next_id + offset, first_name, last_name))
+                    details.append((next_id + offset, role, cv_path, category))
+                conn.executemany("INSERT INTO ApplicantProfile (applicant_id, first_name, last_name) VALUES (?, ?, ?)", profiles)
+                conn.executemany("INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path, category) VALUES (?, ?, ?, ?)", details)
+            if texts:
+                conn.executemany("INSERT OR REPLACE INTO ApplicationText (cv_path, mtime_ns, size, raw_text, flat_text) VALUES (?, ?, ?, ?, ?)", texts)
+            if sections:
+                conn.executemany(UPSERT_SECTIONS_QUERY, sections)
+
+    def delete_texts(self, cv_paths: list[str]):
+        conn = self._get_connection()
+        with conn:
+            conn.executemany("DELETE FROM ApplicationText WHERE cv_path = ?", [(cv_path,) for cv_path in cv_paths])
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        print("Database SQLite closed.")
@@ -0,0 +1,252 @@
+# File: src/db/storage.py
+
+import os
+from abc import ABC, abstractmethod
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def category_from_path(cv_path: str) -> str:
+    """Kategori sebuah CV = nama folder induknya ('data/<CATEGORY>/<id>.pdf'), uppercase."""
+    parts = cv_path.replace('\\', '/').split('/')
+    return parts[-2].upper() if len(parts) >= 2 else None
+
+def placeholder_profile(cv_path: str) -> tuple:
+    """(first_name, last_name) untuk profil hasil ingest, yang belum punya data diri."""
+    return 'Applicant', os.path.splitext(os.path.basename(cv_path))[0]
+
+def split_sections_row(row) -> tuple:
+    """Memisahkan hasil join profil + ApplicationSections (kolom berawalan '_') menjadi (profile, sections_entry)."""
+    if row is None:
+        return None, None
+    profile = dict(row)
+    entry = tuple(profile.pop(key) for key in ('_parser_version', '_mtime_ns', '_size', '_sections'))
+    return profile, (entry if entry[0] is not None else None)
+
+class StorageBackend(ABC):
+    """
+    Antarmuka penyimpanan data pelamar yang dipakai oleh db.operations.
+    Implementasi: MySQLBackend (server MySQL, lewat DatabaseManager) dan
+    SQLiteBackend (file lokal, tanpa server), dipilih lewat seksi [storage] di config.ini.
+    """
+    name = None
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """True jika backend siap dipakai."""
+
+    @abstractmethod
+    def fetch_dataset_by_category(self, categories: list[str], limit_per_category: int) -> list[dict]:
+        """
+        Mengambil maksimal `limit_per_category` baris per kategori (None = semua baris), terurut
+        per kategori berdasarkan (cv_path, detail_id).
+        Return: list dict dengan key id, first_name, last_name, cv_path, category
+        """
+
+    @abstractmethod
+    def get_profile_and_sections(self, applicant_id: int, cv_path: str) -> tuple:
+        """
+        Mengambil profil pelamar beserta section CV yang tersimpan dalam satu query.
+        Return: (profile atau None, (parser_version, mtime_ns, size, sections_json) atau None)
+        """
+
+    @abstractmethod
+    def save_sections(self, cv_path: str, parser_version: int, mtime_ns: int, size: int, sections_json: str):
+        """Menyimpan (atau mengganti) hasil extract_all_sections sebuah CV dalam bentuk JSON."""
+
+    @abstractmethod
+    def get_application_paths(self) -> set:
+        """Himpunan cv_path yang sudah tercatat di ApplicationDetail."""
+
+    @abstractmethod
+    def get_text_fingerprints(self) -> dict:
+        """Fingerprint teks yang sudah tersimpan: {cv_path: (mtime_ns, size)}."""
+
+    @abstractmethod
+    def get_section_versions(self) -> dict:
+        """Versi parser section yang tersimpan: {cv_path: parser_version}."""
+
+    @abstractmethod
+    def save_ingest_batch(self, applications: list[tuple], texts: list[tuple], sections: list[tuple] = ()):
+        """
+        Menyimpan satu batch hasil ingest dalam satu transaksi.
+
+        Args:
+            applications: CV baru, list (cv_path, category, application_role). Setiap CV
+                mendapat satu ApplicantProfile dan satu ApplicationDetail baru.
+            texts: Teks CV, list (cv_path, mtime_ns, size, raw_text, flat_text), menggantikan entri lama.
+            sections: Section CV, list (cv_path, parser_version, mtime_ns, size, sections_json).
+        """
+
+    @abstractmethod
+    def delete_texts(self, cv_paths: list[str]):
+        """Menghapus teks tersimpan untuk CV yang filenya sudah tidak ada."""
+
+    @abstractmethod
+    def close(self):
+        """Menutup seluruh koneksi milik backend."""
+
+class MySQLBackend(StorageBackend):
+    """Backend MySQL: query dijalankan lewat koneksi (pool) milik DatabaseManager."""
+    name = 'mysql'
+
+    FETCH_DATASET_QUERY = """
+    SELECT id, first_name, last_name, cv_path, category
+    FROM (
+        SELECT
+            p.applicant_id as id,
+            p.first_name,
+            p.last_name,
+            d.cv_path,
+            d.category,
+            ROW_NUMBER() OVER (PARTITION BY d.category ORDER BY d.cv_path ASC, d.detail_id ASC) AS row_num
+        FROM ApplicantProfile p
+        JOIN ApplicationDetail d ON p.applicant_id = d.applicant_id
+        WHERE d.category IN ({placeholders})
+    ) ranked
+    WHERE %s IS NULL OR row_num <= %s
+    ORDER BY category, row_num
+    """
+
+    UPSERT_SECTIONS_QUERY = """
+    INSERT INTO ApplicationSections (cv_path, parser_version, mtime_ns, size, sections)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE parser_version = VALUES(parser_version), mtime_ns = VALUES(mtime_ns),
+        size = VALUES(size), sections = VALUES(sections)
+    """
+
+    def __init__(self, config: dict):
+        from db.database_manager import DatabaseManager
+        self.db_manager = DatabaseManager(config)
+
+    def is_available(self) -> bool:
+        return self.db_manager.is_available()
+
+    def fetch_dataset_by_category(self, categories: list[str], limit_per_category: int) -> list[dict]:
+        placeholders = ', '.join(['%s'] * len(categories))
+        query = self.FETCH_DATASET_QUERY.format(placeholders=placeholders)
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor(buffered=True, dictionary=True)
+            try:
+                cursor.execute(query, (*categories, limit_per_category, limit_per_category))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def get_profile_and_sections(self, applicant_id: int, cv_path: str) -> tuple:
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor(buffered=True, dictionary=True)
+            try:
+                cursor.execute("""
+                    SELECT p.*, s.parser_version AS _parser_version, s.mtime_ns AS _mtime_ns,
+                        s.size AS _size, s.sections AS _sections
+                    FROM ApplicantProfile p
+                    LEFT JOIN ApplicationSections s ON s.cv_path = %s
+                    WHERE p.applicant_id = %s
+                """, (cv_path, applicant_id))
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
+        return split_sections_row(row)
+
+    def save_sections(self, cv_path: str, parser_version: int, mtime_ns: int, size: int, sections_json: str):
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self.UPSERT_SECTIONS_QUERY, (cv_path, parser_version, mtime_ns, size, sections_json))
+                conn.commit()
+            finally:
+                cursor.close()
+
+    def get_application_paths(self) -> set:
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT DISTINCT cv_path FROM ApplicationDetail WHERE cv_path IS NOT NULL")
+                return {row[0] for row in cursor.fetchall()}
+            finally:
+                cursor.close()
+
+    def get_text_fingerprints(self) -> dict:
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT cv_path, mtime_ns, size FROM ApplicationText")
+                return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+            finally:
+                cursor.close()
+
+    def get_section_versions(self) -> dict:
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT cv_path, parser_version FROM ApplicationSections")
+                return dict(cursor.fetchall())
+            finally:
+                cursor.close()
+
+    def save_ingest_batch(self, applications: list[tuple], texts: list[tuple], sections: list[tuple] = ()):
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor()
+            try:
+                conn.start_transaction()
+                if applications:
+                    # Id dialokasikan di sini agar profil dan detail bisa di-insert dengan executemany
+                    cursor.execute("SELECT COALESCE(MAX(applicant_id), 0) FROM ApplicantProfile FOR UPDATE")
+                    next_id = cursor.fetchone()[0] + 1
+                    profiles, details = [], []
+                    for offset, (cv_path, category, role) in enumerate(applications):
+                        first_name, last_name = placeholder_profile(cv_path)
+                        profiles.append((next_id + offset, first_name, last_name))
+                        details.append((next_id + offset, role, cv_path, category))
+                    cursor.executemany(
+                        "INSERT INTO ApplicantProfile (applicant_id, first_name, last_name) VALUES (%s, %s, %s)",
+                        profiles
+                    )
+                    cursor.executemany(
+                        "INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path, category) VALUES (%s, %s, %s, %s)",
+                        details
+                    )
+                if texts:
+                    cursor.executemany("""
+                        INSERT INTO ApplicationText (cv_path, mtime_ns, size, raw_text, flat_text)
+                        VALUES (%s, %s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE mtime_ns = VALUES(mtime_ns), size = VALUES(size),
+                            raw_text = VALUES(raw_text), flat_text = VALUES(flat_text)
+                    """, texts)
+                if sections:
+                    cursor.executemany(self.UPSERT_SECTIONS_QUERY, sections)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def delete_texts(self, cv_paths: list[str]):
+        with self.db_manager.checkout() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.executemany("DELETE FROM ApplicationText WHERE cv_path = %s", [(cv_path,) for cv_path in cv_paths])
+                conn.commit()
+            finally:
+                cursor.close()
+
+    def close(self):
+        self.db_manager.close()
+
+def create_storage_backend(config) -> StorageBackend:
+    """
+    Membuat backend sesuai `backend` di seksi [storage] config.ini ('mysql' atau 'sqlite').
+    Seksi [database] dipakai oleh backend MySQL; `sqlite_path` oleh backend SQLite.
+    """
+    storage = config['storage'] if config.has_section('storage') else {}
+    backend = storage.get('backend', 'mysql').strip().lower()
+    if backend == 'sqlite':
+        from db.sqlite_backend import SQLiteBackend
+        db_path = storage.get('sqlite_path', os.path.join('.cache', 'rice_cooker.sqlite3'))
+        if not os.path.isabs(db_path):
+            db_path = os.path.join(ROOT_DIR, db_path)
+        return SQLiteBackend(db_path)
+    if backend == 'mysql':
+        return MySQLBackend(dict(config['database']))
+    raise ValueError(f"Backend storage tidak dikenal: '{backend}' (pilih 'mysql' atau 'sqlite').")
@@ -21,7 +21,9 @@ CREATE TABLE ApplicationDetail (
     applicant_id INT NOT NULL,
     application_role VARCHAR(100),
     cv_path TEXT,
-    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
+    category VARCHAR(64),
+    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id),
+    INDEX idx_application_category (category, cv_path(255))
 )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 INSERT INTO ApplicantProfile (applicant_id, first_name, last_name, date_of_birth, address, phone_number) VALUES
@@ -715,3 +717,8 @@ INSERT INTO ApplicationDetail (detail_id, applicant_id, application_role, cv_pat
 (598, 12, 'Cost Accountant', 'data/ACCOUNTANT/10554236.pdf'),
 (599, 20, 'Inside Sales Representative', 'data/SALES/13812481.pdf'),
 (600, 58, 'Agricultural Engineer', 'data/AGRICULTURE/10953078.pdf');
+
+-- Kategori = folder induk dari file CV ('data/<CATEGORY>/<id>.pdf')
+UPDATE ApplicationDetail
+SET category = UPPER(SUBSTRING_INDEX(SUBSTRING_INDEX(cv_path, '/', -2), '/', 1))
+WHERE category IS NULL;
@@ -1,17 +1,72 @@
+import time
+_START_TIME = time.perf_counter()
+
 import sys
+import logging
+import argparse
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
 from ui.main_page import CVAnalyzerApp
 
+class StartupTimer:
+    """Mencatat waktu setiap tahap startup (relatif terhadap awal main.py) untuk laporan --startup-report."""
+    def __init__(self, start_time: float):
+        self.start_time = start_time
+        self.stages = []
+
+    def mark(self, stage: str):
+        self.stages.append((stage, time.perf_counter() - self.start_time))
+
+    def report(self) -> str:
+        lines = ["Laporan startup (ms sejak main.py mulai dieksekusi):"]
+        previous = 0.0
+        for stage, elapsed in self.stages:
+            lines.append(f"  {stage:28s} {elapsed * 1000:8.1f}  (+{(elapsed - previous) * 1000:.1f})")
+            previous = elapsed
+        return '\n'.join(lines)
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="CV Analyzer App")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="Cetak waktu setiap tahap startup ke stderr setelah window pertama kali digambar")
+    parser.add_argument('--exit-after-startup', action='store_true',
+                        help="Keluar setelah laporan startup (untuk pengukuran otomatis)")
+    parser.add_argument('--no-warm-up', action='store_true', help="Jangan membuka koneksi database di latar belakang")
+    # Argumen lain (mis. opsi Qt) diteruskan ke QApplication
+    return parser.parse_known_args()
+
 def main():
     """Fungsi utama untuk menjalankan aplikasi."""
+    timer = StartupTimer(_START_TIME)
+    timer.mark('import PyQt5 + ui')
+    args, qt_args = _parse_args()
+    # Konfigurasi logging dilakukan di entry point, bukan saat modul diimpor
+    logging.basicConfig(level=logging.INFO)
+
     # Inisialisasi QApplication
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
+    timer.mark('QApplication')
     # Buat instance window utama
     window = CVAnalyzerApp()
+    timer.mark('CVAnalyzerApp()')
     # Tampilkan window
     window.show()
+    timer.mark('window.show()')
+    # Koneksi DB dan modul backend disiapkan setelah window tampil
+    if not args.no_warm_up:
+        window.start_background_warm_up()
+
+    def on_first_paint():
+        # Timer 0 ms dijalankan setelah event loop memproses event paint pertama
+        timer.mark('first paint')
+        if args.startup_report:
+            print(timer.report(), file=sys.stderr)
+        if args.exit_after_startup:
+            window.close()
+
+    QTimer.singleShot(0, on_first_paint)
     # Jalankan event loop aplikasi
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,17 +1,14 @@
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QRadioButton, QPushButton, QScrollArea, QStackedWidget, QMessageBox, QSpinBox, QFrame
+from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QRadioButton, QCheckBox, QPushButton, QScrollArea, QStackedWidget, QMessageBox, QSpinBox, QFrame, QToolButton, QMenu
 from PyQt5.QtGui import QFont, QPalette, QColor
-from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtCore import Qt, QUrl, QThread
 from PyQt5.QtGui import QDesktopServices
 from ui.summary_page import SummaryWindow
-from core.pdf_parser import extract_text_for_pattern_matching, extract_text_for_regex
 from ui.widgets import CandidateCard
-from core.pdf_parser import extract_text_for_pattern_matching
-from core.kmp import kmp_search
-from core.bm import bm_search
-from core.levenshtein import levenshtein_distance
-from core.regex_extractor import extract_all_sections
-from db.operations import search_cvs, get_applicant_summary, close_db_connection
-import time, os
+from ui.search_worker import SearchWorker
+from db.categories import CATEGORIES, DEFAULT_LIMIT_PER_CATEGORY
+import os, sys, threading
+# Modul backend (db.operations, PyMuPDF, MySQL, regex) sengaja diimpor saat dibutuhkan
+# agar window bisa tampil secepatnya; lihat start_background_warm_up().
 
 class CVAnalyzerApp(QMainWindow):
     """Main window for the CV Analyzer application."""
@@ -68,6 +65,10 @@ class CVAnalyzerApp(QMainWindow):
         # Show search page by default
         self.stack.setCurrentWidget(self.search_page)
 
+        # Thread dan worker pencarian yang sedang berjalan (jika ada)
+        self.search_thread = None
+        self.search_worker = None
+
     def init_search_ui(self):
         """Initialize the UI for the search page."""
         layout = QVBoxLayout(self.search_page)
@@ -120,13 +121,18 @@ class CVAnalyzerApp(QMainWindow):
         self.kmp_radio = QRadioButton("KMP")
         self.bm_radio = QRadioButton("BM")
         self.ac_radio = QRadioButton("Aho-Corasick")
+        self.index_radio = QRadioButton("Index (kata utuh)")
+        self.index_radio.setToolTip("Mencocokkan token utuh: 'java' tidak cocok dengan 'javascript', tetapi 'sales' cocok dengan 'sales/marketing'. Algoritma lain mencocokkan substring.")
+        self.corpus_radio = QRadioButton("Corpus")
         self.kmp_radio.setChecked(True)
-        for radio in [self.kmp_radio, self.bm_radio, self.ac_radio]:
+        for radio in [self.kmp_radio, self.bm_radio, self.ac_radio, self.index_radio, self.corpus_radio]:
             radio.setFont(QFont("Segoe UI", 11))
         algo_layout.addWidget(algo_label)
         algo_layout.addWidget(self.kmp_radio)
         algo_layout.addWidget(self.bm_radio)
         algo_layout.addWidget(self.ac_radio)
+        algo_layout.addWidget(self.index_radio)
+        algo_layout.addWidget(self.corpus_radio)
         algo_layout.addStretch()
         input_layout.addLayout(algo_layout)
 
@@ -148,9 +154,47 @@ class CVAnalyzerApp(QMainWindow):
         """)
         top_matches_layout.addWidget(top_matches_label)
         top_matches_layout.addWidget(self.top_matches_input)
+        # Peringkat BM25: relevansi dari frekuensi keyword dan panjang CV, bukan hanya jumlah keyword yang cocok
+        self.bm25_checkbox = QCheckBox("Ranking BM25")
+        self.bm25_checkbox.setFont(QFont("Segoe UI", 11))
+        top_matches_layout.addSpacing(20)
+        top_matches_layout.addWidget(self.bm25_checkbox)
         top_matches_layout.addStretch()
         input_layout.addLayout(top_matches_layout)
 
+        # Scope pencarian: subset kategori dan jumlah CV per kategori (0 = semua CV)
+        scope_layout = QHBoxLayout()
+        scope_label = QLabel("Scope:")
+        scope_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        self.category_button = QToolButton()
+        self.category_button.setFont(QFont("Segoe UI", 11))
+        self.category_button.setPopupMode(QToolButton.InstantPopup)
+        self.category_menu = QMenu(self.category_button)
+        self.category_actions = []
+        for category in CATEGORIES:
+            action = self.category_menu.addAction(category)
+            action.setCheckable(True)
+            action.setChecked(True)
+            action.toggled.connect(self.update_category_button)
+            self.category_actions.append(action)
+        self.category_button.setMenu(self.category_menu)
+        self.update_category_button()
+        limit_label = QLabel("CV per kategori:")
+        limit_label.setFont(QFont("Segoe UI", 11))
+        self.limit_input = QSpinBox()
+        self.limit_input.setRange(0, 9999)
+        self.limit_input.setSpecialValueText("Semua")
+        self.limit_input.setValue(DEFAULT_LIMIT_PER_CATEGORY)
+        self.limit_input.setFont(QFont("Segoe UI", 11))
+        self.limit_input.setStyleSheet(self.top_matches_input.styleSheet())
+        scope_layout.addWidget(scope_label)
+        scope_layout.addWidget(self.category_button)
+        scope_layout.addSpacing(20)
+        scope_layout.addWidget(limit_label)
+        scope_layout.addWidget(self.limit_input)
+        scope_layout.addStretch()
+        input_layout.addLayout(scope_layout)
+
         layout.addWidget(input_frame)
 
         # Search button
@@ -172,7 +216,32 @@ class CVAnalyzerApp(QMainWindow):
             }
         """)
         self.search_button.clicked.connect(self.perform_search)
-        layout.addWidget(self.search_button)
+
+        # Cancel button (aktif hanya saat pencarian berjalan)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.cancel_button.setStyleSheet("""
+            QPushButton {
+                background: #616161;
+                color: white;
+                padding: 15px;
+                border-radius: 8px;
+                min-height: 50px;
+            }
+            QPushButton:hover {
+                background: #757575;
+            }
+            QPushButton:disabled {
+                background: #bdbdbd;
+            }
+        """)
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_search)
+
+        search_buttons_layout = QHBoxLayout()
+        search_buttons_layout.addWidget(self.search_button, 3)
+        search_buttons_layout.addWidget(self.cancel_button, 1)
+        layout.addLayout(search_buttons_layout)
 
         # Summary result section
         self.result_summary = QLabel("")
@@ -216,7 +285,20 @@ class CVAnalyzerApp(QMainWindow):
         self.scroll_area.setWidget(self.results_container)
         layout.addWidget(self.scroll_area)
 
+    def update_category_button(self):
+        """Menampilkan ringkasan kategori yang dipilih pada tombol kategori."""
+        selected = [action.text() for action in self.category_actions if action.isChecked()]
+        if len(selected) == len(self.category_actions):
+            self.category_button.setText(f"Semua kategori ({len(selected)})")
+        elif len(selected) <= 2:
+            self.category_button.setText(", ".join(selected) or "Tidak ada kategori")
+        else:
+            self.category_button.setText(f"{len(selected)} kategori")
+
     def perform_search(self):
+        if self.search_thread is not None:
+            return
+
         # 1. Kumpulkan input dari UI
         keywords_text = self.keywords_input.text()
         if not keywords_text.strip():
@@ -224,19 +306,69 @@ class CVAnalyzerApp(QMainWindow):
             return
         
         keywords = [kw.strip() for kw in keywords_text.split(',')]
-        algorithm = 'KMP' if self.kmp_radio.isChecked() else 'BM' if self.bm_radio.isChecked() else 'AHO-CORASICK' if self.ac_radio.isChecked() else 'KMP'
+        algorithm = 'KMP' if self.kmp_radio.isChecked() else 'BM' if self.bm_radio.isChecked() else 'AHO-CORASICK' if self.ac_radio.isChecked() else 'INDEX' if self.index_radio.isChecked() else 'CORPUS' if self.corpus_radio.isChecked() else 'KMP'
         top_n = int(self.top_matches_input.text())
+        scoring = 'BM25' if self.bm25_checkbox.isChecked() else 'MATCH_COUNT'
+        categories = [action.text() for action in self.category_actions if action.isChecked()]
+        if not categories:
+            QMessageBox.warning(self, "Scope Kosong", "Silakan pilih minimal satu kategori.")
+            return
+        limit_per_category = self.limit_input.value() or None
+
+        # 2. Jalankan backend (search_cvs) di thread terpisah agar window tidak freeze
+        self.search_thread = QThread(self)
+        self.search_worker = SearchWorker(keywords, algorithm, top_n, scoring, categories, limit_per_category)
+        self.search_worker.moveToThread(self.search_thread)
+        self.search_thread.started.connect(self.search_worker.run)
+        self.search_worker.progress.connect(self.on_search_progress)
+        self.search_worker.partial_results.connect(self.display_results)
+        self.search_worker.finished.connect(self.on_search_finished)
+        self.search_worker.failed.connect(self.on_search_failed)
+        self.search_worker.finished.connect(self.search_thread.quit)
+        self.search_worker.failed.connect(self.search_thread.quit)
+        self.search_thread.finished.connect(self._cleanup_search_thread)
 
-        # 2. Panggil fungsi backend tunggal
-        # Seluruh logika kompleks (PDF, KMP/BM, Levenshtein, DB) ada di dalam search_cvs
-        search_result = search_cvs(keywords, algorithm, top_n)
+        self.search_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.result_summary.setText("Memulai pencarian...")
+        self.search_thread.start()
 
+    def cancel_search(self):
+        """Membatalkan pencarian yang sedang berjalan."""
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.result_summary.setText("Membatalkan pencarian...")
+
+    def on_search_progress(self, stage, scanned, total):
+        stage_label = "Exact Match" if stage == 'exact' else "Fuzzy Match"
+        self.result_summary.setText(f"{stage_label}: {scanned}/{total} CV dipindai...")
+
+    def on_search_finished(self, search_result):
         # 3. Tampilkan hasil yang dikembalikan oleh backend
-        self.result_summary.setText(
+        summary_text = (
             f"Exact Match: scanned in {search_result['execution_time_exact']:.2f}s.\n"
             f"Fuzzy Match: scanned in {search_result['execution_time_fuzzy']:.2f}s."
         )
+        if search_result.get('cancelled'):
+            summary_text = "Pencarian dibatalkan, hasil sementara ditampilkan.\n" + summary_text
+        self.result_summary.setText(summary_text)
+        self.display_results(search_result['data'])
+
+    def on_search_failed(self, message):
+        self.result_summary.setText("")
+        QMessageBox.critical(self, "Error", f"Pencarian gagal: {message}")
 
+    def _cleanup_search_thread(self):
+        self.search_worker.deleteLater()
+        self.search_thread.deleteLater()
+        self.search_worker = None
+        self.search_thread = None
+        self.search_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+
+    def display_results(self, candidates):
+        """Menampilkan daftar kandidat (hasil akhir atau sementara) di results_layout."""
         # Hapus hasil pencarian sebelumnya
         while self.results_layout.count():
             child = self.results_layout.takeAt(0)
@@ -244,10 +376,10 @@ class CVAnalyzerApp(QMainWindow):
                 child.widget().deleteLater()
         
         # Tampilkan kartu kandidat baru
-        if not search_result['data']:
+        if not candidates:
             self.results_layout.addWidget(QLabel("Tidak ada CV yang cocok ditemukan."))
         else:
-            for candidate_data in search_result['data']:
+            for candidate_data in candidates:
                 # data `candidate_data` sudah dalam format yang benar dari backend
                 card = CandidateCard(candidate_data, self.switch_to_summary, self.view_cv)
                 self.results_layout.addWidget(card)
@@ -260,6 +392,7 @@ class CVAnalyzerApp(QMainWindow):
         cv_path = candidate_data['cv_path'] # Ambil cv_path dari data kartu
         
         # Panggil backend dengan DUA argumen untuk memastikan file yang benar diproses
+        from db.operations import get_applicant_summary
         summary_data = get_applicant_summary(applicant_id, cv_path)
         
         if summary_data:
@@ -293,5 +426,28 @@ class CVAnalyzerApp(QMainWindow):
     def closeEvent(self, event):
         """Menutup koneksi database saat aplikasi ditutup."""
         print("Menutup aplikasi dan koneksi database...")
-        close_db_connection()
-        event.accept()
\ No newline at end of file
+        if self.search_thread is not None:
+            self.search_worker.cancel()
+            self.search_thread.quit()
+            self.search_thread.wait()
+        # Jika backend belum pernah diimpor, tidak ada koneksi yang perlu ditutup
+        if 'db.operations' in sys.modules:
+            # Import ini menunggu jika warm-up di thread lain masih mengimpor modulnya
+            from db.operations import close_db_connection
+            close_db_connection()
+        event.accept()
+
+    def start_background_warm_up(self):
+        """
+        Mengimpor modul backend dan membuka koneksi database di thread latar belakang.
+        Dipanggil setelah window.show() sehingga tidak menunda tampilnya window;
+        pencarian pertama tidak perlu lagi menunggu import dan koneksi DB.
+        """
+        def warm_up():
+            try:
+                from db import operations
+                operations.warm_up()
+            except Exception as e:
+                print(f"Warm-up database gagal: {e}")
+
+        threading.Thread(target=warm_up, name='db-warm-up', daemon=True).start()
\ No newline at end of file
@@ -0,0 +1,41 @@
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal
+from db.categories import DEFAULT_LIMIT_PER_CATEGORY
+
+class SearchWorker(QObject):
+    """Menjalankan search_cvs di luar GUI thread dan melaporkan progresnya lewat signal."""
+    progress = pyqtSignal(str, int, int)   # (tahap, jumlah_cv_dipindai, total_cv)
+    partial_results = pyqtSignal(object)   # daftar top_n sementara
+    finished = pyqtSignal(object)          # dict hasil akhir search_cvs
+    failed = pyqtSignal(str)
+
+    def __init__(self, keywords, algorithm, top_n, scoring='MATCH_COUNT', categories=None, limit_per_category=DEFAULT_LIMIT_PER_CATEGORY):
+        super().__init__()
+        self.keywords = keywords
+        self.algorithm = algorithm
+        self.top_n = top_n
+        self.scoring = scoring
+        self.categories = categories
+        self.limit_per_category = limit_per_category
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            # Diimpor di sini (thread worker) agar startup GUI tidak memuat backend
+            from db.operations import search_cvs
+            result = search_cvs(
+                self.keywords, self.algorithm, self.top_n,
+                progress_callback=self.progress.emit,
+                partial_callback=self.partial_results.emit,
+                cancel_event=self.cancel_event,
+                scoring=self.scoring,
+                categories=self.categories,
+                limit_per_category=self.limit_per_category
+            )
+            self.finished.emit(result)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def cancel(self):
+        """Meminta pencarian berhenti secepatnya (dicek setiap satu CV)."""
+        self.cancel_event.set()
@@ -45,6 +45,20 @@ class CandidateCard(QFrame):
         """)
         layout.addWidget(matches_label)
 
+        # Skor relevansi (hanya ada jika pencarian memakai peringkat BM25)
+        if "score" in self.candidate:
+            score_label = QLabel(f"Skor BM25: {self.candidate['score']:.2f}")
+            score_label.setFont(QFont("Segoe UI", 11))
+            score_label.setStyleSheet("""
+                QLabel {
+                    background-color: #E3F2FD;
+                    color: #1565C0;
+                    padding: 5px 10px;
+                    border-radius: 5px;
+                }
+            """)
+            layout.addWidget(score_label)
+
         # Keywords with occurrences dengan style yang lebih baik
         keywords = self.candidate.get("matched_keywords", {})
         if keywords:
@@ -0,0 +1,10 @@
+# File: tests/conftest.py
+# Menambahkan src/ ke sys.path agar modul proyek bisa diimpor dari test (jalankan `python -m pytest` dari root proyek).
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,35 @@
+# File: tests/test_fuzzy_merge.py
+# Penggabungan hasil fuzzy per pelamar: satu entri per keyword asal walau pelamar memiliki beberapa CV.
+
+from core.vocabulary_index import VocabularyIndex
+from db.operations import _merge_hits
+
+CANDIDATES = [
+    {'id': 1, 'name': 'Applicant 1', 'cv_path': 'data/A/1.pdf'},
+    {'id': 2, 'name': 'Applicant 2', 'cv_path': 'data/A/2a.pdf'},
+    {'id': 2, 'name': 'Applicant 2', 'cv_path': 'data/A/2b.pdf'},
+]
+
+def test_multi_cv_applicant_gets_one_fuzzy_key_per_keyword():
+    vocabulary = VocabularyIndex()
+    vocabulary.add_document('data/A/1.pdf', {'accounting'})
+    vocabulary.add_document('data/A/2a.pdf', {'accounting,', 'python'})
+    vocabulary.add_document('data/A/2b.pdf', {'accounting', 'python'})
+    exact_hits = {'data/A/2a.pdf': {'python': 1}, 'data/A/2b.pdf': {'python': 2}}
+
+    fuzzy_hits = vocabulary.fuzzy_matches(['acounting'], 2)
+    results = _merge_hits(CANDIDATES, exact_hits, fuzzy_hits)
+
+    assert results[2]['matched_keywords'] == {'python': 2, 'acounting (similar: accounting, accounting,)': 2}
+    assert results[2]['match_count'] == 2
+    assert results[1]['matched_keywords'] == {'acounting (similar: accounting)': 1}
+    assert results[1]['match_count'] == 1
+
+def test_same_similar_word_in_several_cvs_is_listed_once():
+    fuzzy_hits = {'data/A/2a.pdf': {'pyhton': 'python'}, 'data/A/2b.pdf': {'pyhton': 'python', 'managment': 'management'}}
+
+    results = _merge_hits(CANDIDATES, {}, fuzzy_hits)
+
+    assert results[2]['matched_keywords'] == {'pyhton (similar: python)': 2, 'managment (similar: management)': 1}
+    assert results[2]['match_count'] == 2
+    assert 1 not in results
@@ -0,0 +1,33 @@
+# File: tests/test_inverted_index.py
+# Bagian token gabungan (dipisah . - / &) ikut ditemukan oleh InvertedIndex, termasuk di ujung frasa.
+
+from core.inverted_index import InvertedIndex
+
+def _index(text: str) -> InvertedIndex:
+    index = InvertedIndex()
+    index.add_document('data/A/1.pdf', text, (1, 1))
+    return index
+
+def test_compound_token_parts_are_found():
+    index = _index("senior patient-centered care, sales/marketing manager")
+
+    assert index.lookup('patient') == {'data/A/1.pdf': 1}
+    assert index.lookup('sales') == {'data/A/1.pdf': 1}
+    assert index.lookup('patient-centered') == {'data/A/1.pdf': 1}
+
+def test_phrases_across_compound_tokens_follow_substring_semantics():
+    index = _index("senior patient-centered care, sales/marketing manager")
+
+    assert index.lookup('centered care') == {'data/A/1.pdf': 1}
+    assert index.lookup('senior patient') == {'data/A/1.pdf': 1}
+    assert index.lookup('marketing manager') == {'data/A/1.pdf': 1}
+    # Bagian yang tidak bersebelahan di teks tidak membentuk frasa
+    assert index.lookup('patient care') == {}
+    assert index.lookup('sales marketing') == {}
+
+def test_remove_document_drops_parts():
+    index = _index("sales/marketing")
+    index.remove_document('data/A/1.pdf')
+
+    assert index.lookup('sales') == {}
+    assert index.parts == {}
@@ -0,0 +1,19 @@
+# File: tests/test_server.py
+# Validasi body POST /search: tipe yang salah harus menghasilkan HTTP 400, bukan 500.
+
+import json
+import asyncio
+
+import pytest
+
+from cvanalyzer.server import HTTPError, SearchService
+
+@pytest.mark.parametrize('payload', [{'keywords': 5}, {'keywords': 'python', 'top_n': None}])
+def test_search_rejects_invalid_payload_types(payload):
+    service = SearchService(workers=1)
+    try:
+        with pytest.raises(HTTPError) as error:
+            asyncio.run(service.route('POST', '/search', json.dumps(payload).encode('utf-8')))
+        assert error.value.status == 400
+    finally:
+        service.executor.shutdown()